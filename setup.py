@@ -27,7 +27,7 @@ setup(
     package_dir={"": "src"},
     python_requires=">=3.10",
     install_requires=[
-        "jira>=3.0.0",
+        "jira>=3.10.0",
         "openai>=1.0.0",
         "langchain-core>=1.3.0",
         "httpx>=0.27.0",
@@ -12,6 +12,11 @@ from .client import (
     get_inference_config,
 )
 
+from .cache import MemoryCache, ResponseCache, SQLiteCache
+from .context import ContextPolicy, ToolOutputPolicy
+from .retry import RateBudget, RetryPolicy
+from .streaming import AsyncChatStream, ChatStream
+
 from .exceptions import (
     InferenceClientError,
     InferenceAPIError,
@@ -23,10 +28,22 @@ from .constants import (
     INFERENCE_MAX_TOKENS,
     INFERENCE_MAX_TOOL_ITERATIONS,
     INFERENCE_API_TIMEOUT,
+    INFERENCE_MAX_CONCURRENT_TOOLS,
+    INFERENCE_TOOL_TIMEOUT,
+    INFERENCE_MAX_TOOL_OUTPUT_CHARS,
 )
 
 __all__ = [
     "InferenceClient",
+    "RetryPolicy",
+    "RateBudget",
+    "ResponseCache",
+    "MemoryCache",
+    "SQLiteCache",
+    "ContextPolicy",
+    "ToolOutputPolicy",
+    "ChatStream",
+    "AsyncChatStream",
     "analyze_with_agentic",
     "get_inference_client",
     "get_inference_config",
@@ -37,4 +54,7 @@ __all__ = [
     "INFERENCE_MAX_TOKENS",
     "INFERENCE_MAX_TOOL_ITERATIONS",
     "INFERENCE_API_TIMEOUT",
+    "INFERENCE_MAX_CONCURRENT_TOOLS",
+    "INFERENCE_TOOL_TIMEOUT",
+    "INFERENCE_MAX_TOOL_OUTPUT_CHARS",
 ]
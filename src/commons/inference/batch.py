@@ -0,0 +1,54 @@
+"""Batch files for OpenAI-compatible ``/v1/batches`` endpoints."""
+
+import json
+from typing import Any, Dict, Mapping, Tuple, Union
+
+from .exceptions import InferenceAPIError
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+
+def build_batch_file(requests: Mapping[str, Dict[str, Any]]) -> bytes:
+    """Serialize chat completion params keyed by request ID as batch JSONL."""
+    lines = [
+        json.dumps(
+            {
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": BATCH_ENDPOINT,
+                "body": params,
+            },
+            default=str,
+        )
+        for custom_id, params in requests.items()
+    ]
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def parse_batch_line(line: Union[str, bytes]) -> Tuple[str, Any]:
+    """
+    Parse one line of a batch output or error file.
+
+    Returns the request ID and either the ChatCompletionMessage or an
+    InferenceAPIError describing why that request failed.
+    """
+    from openai.types.chat import (  # pylint: disable=import-outside-toplevel
+        ChatCompletion,
+    )
+
+    record = json.loads(line)
+    custom_id = record["custom_id"]
+    response = record.get("response") or {}
+    error = record.get("error")
+    status_code = response.get("status_code")
+
+    if not error and status_code == 200:
+        completion = ChatCompletion.model_validate(response["body"])
+        return custom_id, completion.choices[0].message
+
+    body_error = (response.get("body") or {}).get("error") or {}
+    message = (error or {}).get("message") or body_error.get("message") or "unknown error"
+    return custom_id, InferenceAPIError(
+        f"Batch request {custom_id} failed ({status_code or 'no response'}): {message}"
+    )
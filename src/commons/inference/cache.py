@@ -0,0 +1,179 @@
+"""Response caches for deterministic chat completion requests."""
+
+import abc
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from commons.utils import SQLiteDatabase
+
+
+def cache_key(params: Dict[str, Any]) -> str:
+    """Return a stable hash of chat completion request parameters."""
+    payload = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache(abc.ABC):
+    """
+    Base class for response caches.
+
+    Stores serialized responses by key, expires them after ``ttl`` seconds
+    (None for never) and keeps at most ``max_entries``, evicting the least
+    recently used. Hit, miss and eviction counts are kept in ``stats()``.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: Optional[float] = None) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached value for a key, or None on a miss."""
+        with self._lock:
+            value = self._get(key, time.time())
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store a value, evicting expired and least recently used entries."""
+        with self._lock:
+            self.evictions += self._set(key, value, time.time())
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit, miss and eviction counts and the current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": self._size(),
+            }
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl is not None and now - created_at > self.ttl
+
+    @abc.abstractmethod
+    def _get(self, key: str, now: float) -> Optional[str]:
+        """Return an unexpired value and mark it recently used."""
+
+    @abc.abstractmethod
+    def _set(self, key: str, value: str, now: float) -> int:
+        """Store a value and return the number of entries evicted."""
+
+    @abc.abstractmethod
+    def _clear(self) -> None:
+        """Remove every entry."""
+
+    @abc.abstractmethod
+    def _size(self) -> int:
+        """Return the number of entries."""
+
+
+class MemoryCache(ResponseCache):
+    """In-process LRU response cache."""
+
+    def __init__(self, max_entries: int = 1024, ttl: Optional[float] = None) -> None:
+        super().__init__(max_entries, ttl)
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+    def _get(self, key: str, now: float) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if self._expired(entry[0], now):
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def _set(self, key: str, value: str, now: float) -> int:
+        self._entries[key] = (now, value)
+        self._entries.move_to_end(key)
+        evicted = 0
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            evicted += 1
+        return evicted
+
+    def _clear(self) -> None:
+        self._entries.clear()
+
+    def _size(self) -> int:
+        return len(self._entries)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+"""
+
+
+class SQLiteCache(SQLiteDatabase, ResponseCache):
+    """On-disk LRU response cache shared across processes and runs."""
+
+    def __init__(
+        self, path: str, max_entries: int = 10000, ttl: Optional[float] = None
+    ) -> None:
+        ResponseCache.__init__(self, max_entries, ttl)
+        SQLiteDatabase.__init__(self, path, _SCHEMA)
+
+    def _get(self, key: str, now: float) -> Optional[str]:
+        row = self._conn.execute(
+            "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        with self._conn:
+            if self._expired(row[1], now):
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+        return row[0]
+
+    def _set(self, key: str, value: str, now: float) -> int:
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, value, now, now),
+            )
+            evicted = 0
+            if self.ttl is not None:
+                evicted += self._conn.execute(
+                    "DELETE FROM responses WHERE created_at < ?", (now - self.ttl,)
+                ).rowcount
+            evicted += self._conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            ).rowcount
+        return evicted
+
+    def _clear(self) -> None:
+        with self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def _size(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
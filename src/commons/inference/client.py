@@ -1,36 +1,107 @@
 """Inference client for OpenAI-compatible LLM endpoints."""
 
+# pylint: disable=too-many-lines
+
+from __future__ import annotations
+
 import asyncio
 import functools
 import json
 import logging
 import os
-from typing import Any, Awaitable, Callable, Dict, List, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
-import httpx
-from langchain_core.utils.function_calling import convert_to_openai_tool
-from openai import APIConnectionError, APITimeoutError, OpenAI
-from openai.types.chat import ChatCompletionMessage
+if TYPE_CHECKING:
+    from openai.types.chat import ChatCompletionMessage
+
+from commons.utils import lazy_import
 
 from .constants import (
     INFERENCE_TEMPERATURE,
     INFERENCE_MAX_TOKENS,
     INFERENCE_MAX_TOOL_ITERATIONS,
     INFERENCE_API_TIMEOUT,
+    INFERENCE_API_CONNECT_TIMEOUT,
+    INFERENCE_MAX_CONNECTIONS,
+    INFERENCE_MAX_KEEPALIVE_CONNECTIONS,
+    INFERENCE_KEEPALIVE_EXPIRY,
+    INFERENCE_API_RETRY_ATTEMPTS,
+    INFERENCE_API_RETRY_DELAY,
+    INFERENCE_API_MAX_RETRY_DELAY,
+    INFERENCE_API_RETRY_BACKOFF_MULTIPLIER,
+    INFERENCE_MAX_CONCURRENT_TOOLS,
+    INFERENCE_TOOL_TIMEOUT,
+    INFERENCE_MAX_TOOL_OUTPUT_CHARS,
+    INFERENCE_BATCH_CONCURRENCY,
+    INFERENCE_BATCH_COMPLETION_WINDOW,
+    INFERENCE_BATCH_POLL_INTERVAL,
+    INFERENCE_BATCH_MAX_POLL_INTERVAL,
 )
 from .exceptions import (
     InferenceAPIError,
     InferenceIterationLimitError,
 )
+from .batch import BATCH_ENDPOINT, TERMINAL_STATUSES, build_batch_file, parse_batch_line
+from .cache import ResponseCache, cache_key
+from .context import ContextPolicy
+from .retry import RateBudget, RetryPolicy
+from .streaming import AsyncChatStream, ChatStream
+from .truncation import limit_tool_output, preview
 
 logger = logging.getLogger(__name__)
 
+# httpx, openai and langchain_core take hundreds of milliseconds to import, so
+# they are imported on first use rather than at module import.
+_LAZY_IMPORTS = {
+    "httpx": ("httpx", None),
+    "OpenAI": ("openai", "OpenAI"),
+    "AsyncOpenAI": ("openai", "AsyncOpenAI"),
+    "APIConnectionError": ("openai", "APIConnectionError"),
+    "APITimeoutError": ("openai", "APITimeoutError"),
+    "ChatCompletionMessage": ("openai.types.chat", "ChatCompletionMessage"),
+    "convert_to_openai_tool": (
+        "langchain_core.utils.function_calling",
+        "convert_to_openai_tool",
+    ),
+}
+
+
+def _lazy(name: str) -> Any:
+    """Return a lazily imported dependency, importing it on first use."""
+    return lazy_import(globals(), _LAZY_IMPORTS, name)
 
-class InferenceClient:
+
+__getattr__ = _lazy
+
+
+class InferenceClient:  # pylint: disable=too-many-instance-attributes
     """
     Client for OpenAI-compatible inference endpoints.
 
     Works with Gemini, Llama, DeepSeek, and other compatible APIs.
+    Blocking calls use ``chat``; coroutines use ``achat``, which runs on an
+    ``AsyncOpenAI`` client created per event loop on first use. With a
+    ``cache``, identical ``chat``/``achat`` requests are answered from it.
+
+    Connection pool limits, HTTP/2 and the connect/read/write/pool timeouts
+    apply to both HTTP clients; read, write and pool default to ``timeout``.
+    ``transport``/``async_transport`` inject shared httpx transports, which
+    then own their connection pool.
     """
 
     def __init__(
@@ -42,19 +113,58 @@ class InferenceClient:
         timeout: float = INFERENCE_API_TIMEOUT,
         top_p: Optional[float] = None,
         frequency_penalty: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[ResponseCache] = None,
+        connect_timeout: Optional[float] = INFERENCE_API_CONNECT_TIMEOUT,
+        read_timeout: Optional[float] = None,
+        write_timeout: Optional[float] = None,
+        pool_timeout: Optional[float] = None,
+        max_connections: Optional[int] = INFERENCE_MAX_CONNECTIONS,
+        max_keepalive_connections: Optional[int] = INFERENCE_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: Optional[float] = INFERENCE_KEEPALIVE_EXPIRY,
+        http2: bool = False,
+        transport: Any = None,
+        async_transport: Any = None,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.model = model
+        self.verify_ssl = verify_ssl
         self.timeout = timeout
         self.top_p = top_p
         self.frequency_penalty = frequency_penalty
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.cache = cache
+        self._api_key = api_key
+        self._async_client: Any = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_transport = async_transport
 
-        http_client = self._create_http_client(verify_ssl, timeout)
+        httpx = _lazy("httpx")
+        self._http_options = {
+            "verify": verify_ssl,
+            "http2": http2,
+            "timeout": httpx.Timeout(
+                timeout,
+                connect=connect_timeout,
+                read=read_timeout if read_timeout is not None else timeout,
+                write=write_timeout if write_timeout is not None else timeout,
+                pool=pool_timeout if pool_timeout is not None else timeout,
+            ),
+            "limits": httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+        }
+        if not verify_ssl:
+            logger.warning("SSL verification disabled for %s", self.base_url)
+        http_client = httpx.Client(transport=transport, **self._http_options)
 
-        self.client = OpenAI(
+        self.client = _lazy("OpenAI")(
             api_key=api_key,
             base_url=self.base_url,
             http_client=http_client,
+            max_retries=0,
         )
 
         logger.debug(
@@ -76,6 +186,27 @@ class InferenceClient:
         """Context manager exit - close the client."""
         self.close()
 
+    async def aclose(self) -> None:
+        """Close the sync and async HTTP clients.
+
+        Call it on the event loop that made the async requests: an async client
+        created on another loop cannot be closed from this one and is dropped.
+        """
+        if self._async_client is not None:
+            if self._async_loop is asyncio.get_running_loop():
+                await self._async_client.close()
+            self._async_client = None
+            self._async_loop = None
+        self.close()
+
+    async def __aenter__(self) -> "InferenceClient":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit - close the clients."""
+        await self.aclose()
+
     def chat(
         self,
         messages: List[Dict[str, Any]],
@@ -88,42 +219,284 @@ class InferenceClient:
         api_params = self._build_chat_params(
             messages, max_tokens, temperature, tools=tools, **kwargs
         )
+        key = self._cache_key(api_params)
+        if (cached := self._cache_get(key)) is not None:
+            return cached
 
-        try:
-            logger.debug("Calling inference API: model=%s", self.model)
-            response = self.client.chat.completions.create(**api_params)
-
-            if response.usage:
-                logger.info(
-                    "Token usage - prompt: %d, completion: %d, total: %d",
-                    response.usage.prompt_tokens,
-                    response.usage.completion_tokens,
-                    response.usage.total_tokens,
+        logger.debug("Calling inference API: model=%s", self.model)
+        response = self._create_completion(api_params)
+
+        self._log_usage(response)
+        message = self._first_message(response)
+        self._cache_set(key, message)
+        return message
+
+    async def achat(
+        self,
+        messages: List[Dict[str, Any]],
+        max_tokens: int = INFERENCE_MAX_TOKENS,
+        temperature: float = INFERENCE_TEMPERATURE,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        **kwargs: Any,
+    ) -> ChatCompletionMessage:
+        """Send a chat completion request without blocking the event loop."""
+        api_params = self._build_chat_params(
+            messages, max_tokens, temperature, tools=tools, **kwargs
+        )
+        key = self._cache_key(api_params)
+        if (cached := self._cache_get(key)) is not None:
+            return cached
+
+        logger.debug("Calling inference API (async): model=%s", self.model)
+        response = await self._acreate_completion(api_params)
+
+        self._log_usage(response)
+        message = self._first_message(response)
+        self._cache_set(key, message)
+        return message
+
+    def chat_stream(
+        self,
+        messages: List[Dict[str, Any]],
+        max_tokens: int = INFERENCE_MAX_TOKENS,
+        temperature: float = INFERENCE_TEMPERATURE,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        **kwargs: Any,
+    ) -> ChatStream:
+        """
+        Send a chat completion request and stream the response.
+
+        Iterate over the returned ChatStream for content deltas; afterwards
+        its ``message``, ``usage`` and ``time_to_first_token`` are set.
+        """
+        api_params = self._build_stream_params(
+            messages, max_tokens, temperature, tools, **kwargs
+        )
+
+        logger.debug("Streaming from inference API: model=%s", self.model)
+        started_at = time.monotonic()
+        chunks = self._create_completion(api_params)
+
+        return ChatStream(chunks, started_at, self._api_error, self._log_usage)
+
+    async def achat_stream(
+        self,
+        messages: List[Dict[str, Any]],
+        max_tokens: int = INFERENCE_MAX_TOKENS,
+        temperature: float = INFERENCE_TEMPERATURE,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        **kwargs: Any,
+    ) -> AsyncChatStream:
+        """Async counterpart of chat_stream; consume with ``async for``."""
+        api_params = self._build_stream_params(
+            messages, max_tokens, temperature, tools, **kwargs
+        )
+
+        logger.debug("Streaming from inference API (async): model=%s", self.model)
+        started_at = time.monotonic()
+        chunks = await self._acreate_completion(api_params)
+
+        return AsyncChatStream(chunks, started_at, self._api_error, self._log_usage)
+
+    def chat_many(
+        self,
+        message_lists: Sequence[List[Dict[str, Any]]],
+        concurrency: int = INFERENCE_BATCH_CONCURRENCY,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_tokens: int = INFERENCE_MAX_TOKENS,
+        temperature: float = INFERENCE_TEMPERATURE,
+        **kwargs: Any,
+    ) -> List[Union[ChatCompletionMessage, Exception]]:
+        """
+        Send many independent chat requests in parallel threads.
+
+        Results are returned in input order. A failed request yields its
+        exception in place of a message instead of aborting the batch.
+        Optional requests/tokens per minute budgets delay requests as needed;
+        tokens are estimated from the prompt size plus ``max_tokens``.
+        """
+        budget = RateBudget(requests_per_minute, tokens_per_minute)
+
+        def run(messages: List[Dict[str, Any]]) -> Any:
+            wait = budget.reserve(_estimate_tokens(messages, max_tokens))
+            if wait > 0:
+                time.sleep(wait)
+            try:
+                return self.chat(
+                    messages, max_tokens=max_tokens, temperature=temperature, **kwargs
                 )
+            except Exception as e:
+                return e
 
-            return response.choices[0].message
+        logger.info(
+            "Sending %d chat requests (concurrency %d)", len(message_lists), concurrency
+        )
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            results = list(executor.map(run, message_lists))
+        self._log_batch_errors(results)
+        return results
 
-        except APITimeoutError as e:
-            logger.error("Request timed out after %s seconds", self.timeout)
-            raise InferenceAPIError(
-                f"Request timed out after {self.timeout} seconds"
-            ) from e
-
-        except APIConnectionError as e:
-            logger.error("Connection error to inference API: %s", e)
-            raise InferenceAPIError("Connection error to inference API") from e
-
-        except Exception as e:
-            logger.error(
-                "Error calling inference API: %s - %s",
-                type(e).__name__,
-                str(e),
+    async def achat_many(
+        self,
+        message_lists: Sequence[List[Dict[str, Any]]],
+        concurrency: int = INFERENCE_BATCH_CONCURRENCY,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_tokens: int = INFERENCE_MAX_TOKENS,
+        temperature: float = INFERENCE_TEMPERATURE,
+        **kwargs: Any,
+    ) -> List[Union[ChatCompletionMessage, Exception]]:
+        """Async counterpart of chat_many, running on the event loop."""
+        budget = RateBudget(requests_per_minute, tokens_per_minute)
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def run(messages: List[Dict[str, Any]]) -> Any:
+            async with semaphore:
+                wait = budget.reserve(_estimate_tokens(messages, max_tokens))
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                try:
+                    return await self.achat(
+                        messages, max_tokens=max_tokens, temperature=temperature, **kwargs
+                    )
+                except Exception as e:
+                    return e
+
+        logger.info(
+            "Sending %d chat requests (concurrency %d)", len(message_lists), concurrency
+        )
+        results = list(await asyncio.gather(*(run(m) for m in message_lists)))
+        self._log_batch_errors(results)
+        return results
+
+    def submit_batch(
+        self,
+        requests: Mapping[str, List[Dict[str, Any]]],
+        max_tokens: int = INFERENCE_MAX_TOKENS,
+        temperature: float = INFERENCE_TEMPERATURE,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        completion_window: str = INFERENCE_BATCH_COMPLETION_WINDOW,
+        **kwargs: Any,
+    ) -> str:
+        """
+        Submit chat requests, keyed by request ID, as an offline batch job.
+
+        Each conversation is turned into ``_build_chat_params`` output, written
+        to a JSONL batch file and uploaded. Returns the batch ID.
+        """
+        payload = build_batch_file(
+            {
+                custom_id: self._build_chat_params(
+                    messages, max_tokens, temperature, tools=tools, **kwargs
+                )
+                for custom_id, messages in requests.items()
+            }
+        )
+        input_file = self._with_retry(
+            self.client.files.create, file=("batch.jsonl", payload), purpose="batch"
+        )
+        batch = self._with_retry(
+            self.client.batches.create,
+            input_file_id=input_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window=completion_window,
+        )
+        logger.info("Submitted batch %s with %d requests", batch.id, len(requests))
+        return batch.id
+
+    def wait_for_batch(
+        self,
+        batch_id: str,
+        poll_interval: float = INFERENCE_BATCH_POLL_INTERVAL,
+        max_poll_interval: float = INFERENCE_BATCH_MAX_POLL_INTERVAL,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """
+        Poll a batch job until it finishes, doubling the interval each time.
+
+        Returns the completed Batch. Raises InferenceAPIError if the batch
+        fails, expires or is cancelled, or if ``timeout`` seconds pass.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = poll_interval
+        while True:
+            batch = self._with_retry(self.client.batches.retrieve, batch_id)
+            if batch.status in TERMINAL_STATUSES:
+                break
+            wait = delay
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise InferenceAPIError(
+                        f"Batch {batch_id} still {batch.status} after {timeout} seconds"
+                    )
+                # Poll once more at the deadline rather than giving up early
+                wait = min(delay, remaining)
+            logger.debug(
+                "Batch %s is %s, checking again in %.0fs", batch_id, batch.status, wait
             )
+            time.sleep(wait)
+            delay = min(max_poll_interval, delay * 2)
+
+        if batch.status != "completed":
             raise InferenceAPIError(
-                f"Inference API error ({type(e).__name__}): {e}"
-            ) from e
+                f"Batch {batch_id} ended with status {batch.status}: {batch.errors}"
+            )
+        logger.info("Batch %s completed: %s", batch_id, batch.request_counts)
+        return batch
+
+    def iter_batch_results(self, batch: Any) -> Iterator[Tuple[str, Any]]:
+        """
+        Stream the results of a completed batch.
+
+        Yields (request ID, ChatCompletionMessage) for successful requests and
+        (request ID, InferenceAPIError) for failed ones.
+        """
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            try:
+                with self.client.files.with_streaming_response.content(
+                    file_id
+                ) as response:
+                    for line in response.iter_lines():
+                        if line.strip():
+                            yield parse_batch_line(line)
+            except InferenceAPIError:
+                raise
+            except Exception as e:
+                raise self._api_error(e) from e
+
+    def run_batch(
+        self,
+        requests: Mapping[str, List[Dict[str, Any]]],
+        poll_interval: float = INFERENCE_BATCH_POLL_INTERVAL,
+        max_poll_interval: float = INFERENCE_BATCH_MAX_POLL_INTERVAL,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Union[ChatCompletionMessage, InferenceAPIError]]:
+        """
+        Submit a batch job, wait for it and collect results by request ID.
+
+        Results follow the order of ``requests``; requests missing from the
+        batch output map to an InferenceAPIError.
+        """
+        batch = self.wait_for_batch(
+            self.submit_batch(requests, **kwargs),
+            poll_interval=poll_interval,
+            max_poll_interval=max_poll_interval,
+            timeout=timeout,
+        )
+        results = dict(self.iter_batch_results(batch))
+        for custom_id in requests:
+            if custom_id not in results:
+                results[custom_id] = InferenceAPIError(
+                    f"Batch request {custom_id} returned no result"
+                )
+        return {custom_id: results[custom_id] for custom_id in requests}
 
-    async def chat_with_tools_async(
+    async def chat_with_tools_async(  # pylint: disable=too-many-locals
         self,
         messages: List[Dict[str, Any]],
         tools: List[Dict[str, Any]],
@@ -131,29 +504,35 @@ class InferenceClient:
         max_iterations: int = INFERENCE_MAX_TOOL_ITERATIONS,
         max_tokens: int = INFERENCE_MAX_TOKENS,
         temperature: float = INFERENCE_TEMPERATURE,
+        max_concurrent_tools: int = INFERENCE_MAX_CONCURRENT_TOOLS,
+        tool_timeout: Optional[float] = INFERENCE_TOOL_TIMEOUT,
+        on_delta: Optional[Callable[[str], Any]] = None,
+        context_policy: Optional[ContextPolicy] = None,
     ) -> str:
         """
         Execute an agentic loop with tool calling.
 
         Iteratively calls the LLM and executes requested tools until a final
-        answer is produced or max_iterations is reached.
+        answer is produced or max_iterations is reached. Tool calls requested
+        in one turn run concurrently, at most ``max_concurrent_tools`` at a
+        time, each cut off after ``tool_timeout`` seconds (None for no limit).
+        Their results are appended in the order the model requested them.
+        If ``on_delta`` is given, responses are streamed and every content
+        delta is passed to it as it arrives. If ``context_policy`` is given,
+        it is applied to the conversation before every model call to keep
+        it within the context window.
         """
         messages = list(messages)
+        semaphore = asyncio.Semaphore(max(1, max_concurrent_tools))
         logger.debug("Starting agentic loop with %d messages", len(messages))
 
         for iteration in range(1, max_iterations + 1):
             logger.debug("Agentic iteration %d/%d", iteration, max_iterations)
+            if context_policy is not None:
+                messages = context_policy.apply(messages)
 
-            loop = asyncio.get_running_loop()
-            message = await loop.run_in_executor(
-                None,
-                functools.partial(
-                    self.chat,
-                    messages=messages,
-                    max_tokens=max_tokens,
-                    temperature=temperature,
-                    tools=tools,
-                ),
+            message = await self._next_message(
+                messages, max_tokens, temperature, tools, on_delta
             )
 
             if not message.tool_calls:
@@ -169,13 +548,19 @@ class InferenceClient:
             )
             messages.append(self._assistant_tool_message(message, message.tool_calls))
 
-            for tc in message.tool_calls:
+            results = await asyncio.gather(
+                *(
+                    self._run_tool_call(tc, execute_tool_func, semaphore, tool_timeout)
+                    for tc in message.tool_calls
+                )
+            )
+            for tc, result in zip(message.tool_calls, results):
                 messages.append(
                     {
                         "role": "tool",
                         "tool_call_id": tc.id,
                         "name": tc.function.name,
-                        "content": await self._run_tool_call(tc, execute_tool_func),
+                        "content": result,
                     }
                 )
 
@@ -187,11 +572,162 @@ class InferenceClient:
             "Please try again with a simpler query."
         )
 
-    def _create_http_client(self, verify_ssl: bool, timeout: float) -> httpx.Client:
-        if not verify_ssl:
-            logger.warning("SSL verification disabled for %s", self.base_url)
-            return httpx.Client(verify=False, timeout=timeout)
-        return httpx.Client(timeout=timeout)
+    async def _next_message(
+        self,
+        messages: List[Dict[str, Any]],
+        max_tokens: int,
+        temperature: float,
+        tools: List[Dict[str, Any]],
+        on_delta: Optional[Callable[[str], Any]],
+    ) -> ChatCompletionMessage:
+        if on_delta is None:
+            return await self.achat(
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                tools=tools,
+            )
+
+        stream = await self.achat_stream(
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            tools=tools,
+        )
+        async for delta in stream:
+            on_delta(delta)
+        return stream.message
+
+    def _get_async_client(self) -> Any:
+        """Return the AsyncOpenAI client bound to the running event loop.
+
+        httpx connections cannot be reused across event loops, so a new client
+        is created when called from a different loop (e.g. successive
+        ``asyncio.run`` calls with the global client). The previous client is
+        dropped without being closed: its connections belong to the old loop,
+        and closing them from this one fails once that loop is closed (or
+        waits on it while it is still open). Its sockets are released when it
+        is garbage collected; ``aclose`` on the old loop shuts it down cleanly.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            self._async_client = _lazy("AsyncOpenAI")(
+                api_key=self._api_key,
+                base_url=self.base_url,
+                max_retries=0,
+                http_client=_lazy("httpx").AsyncClient(
+                    transport=self._async_transport, **self._http_options
+                ),
+            )
+            self._async_loop = loop
+        return self._async_client
+
+    def _cache_key(self, api_params: Dict[str, Any]) -> Optional[str]:
+        return cache_key(api_params) if self.cache is not None else None
+
+    def _cache_get(self, key: Optional[str]) -> Optional[ChatCompletionMessage]:
+        if key is None:
+            return None
+        value = self.cache.get(key)
+        if value is None:
+            return None
+        logger.debug("Response cache hit: model=%s", self.model)
+        return _lazy("ChatCompletionMessage").model_validate_json(value)
+
+    def _cache_set(self, key: Optional[str], message: ChatCompletionMessage) -> None:
+        if key is not None:
+            self.cache.set(key, message.model_dump_json())
+
+    def _create_completion(self, api_params: Dict[str, Any]) -> Any:
+        """Create a chat completion, retrying according to the retry policy."""
+        return self._with_retry(self.client.chat.completions.create, **api_params)
+
+    def _with_retry(self, operation: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Call a blocking API operation, retrying according to the retry policy."""
+        attempt = 0
+        while True:
+            try:
+                return operation(*args, **kwargs)
+            except Exception as e:
+                delay = self._retry_delay(attempt, e)
+                if delay is None:
+                    raise self._api_error(e) from e
+            time.sleep(delay)
+            attempt += 1
+
+    async def _acreate_completion(self, api_params: Dict[str, Any]) -> Any:
+        """Async counterpart of _create_completion."""
+        attempt = 0
+        while True:
+            try:
+                return await self._get_async_client().chat.completions.create(
+                    **api_params
+                )
+            except Exception as e:
+                delay = self._retry_delay(attempt, e)
+                if delay is None:
+                    raise self._api_error(e) from e
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _retry_delay(self, attempt: int, error: Exception) -> Optional[float]:
+        """Return how long to wait before retrying, or None to give up."""
+        if attempt + 1 >= self.retry_policy.attempts:
+            return None
+        if not self.retry_policy.is_retryable(error):
+            return None
+        delay = self.retry_policy.compute_delay(attempt, error)
+        logger.warning(
+            "Inference API request failed (attempt %d/%d): %s. Retrying in %.1fs...",
+            attempt + 1,
+            self.retry_policy.attempts,
+            error,
+            delay,
+        )
+        return delay
+
+    def _api_error(self, error: Exception) -> InferenceAPIError:
+        """Log an inference API failure and convert it to InferenceAPIError."""
+        if isinstance(error, _lazy("APITimeoutError")):
+            logger.error("Request timed out after %s seconds", self.timeout)
+            return InferenceAPIError(f"Request timed out after {self.timeout} seconds")
+
+        if isinstance(error, _lazy("APIConnectionError")):
+            logger.error("Connection error to inference API: %s", error)
+            return InferenceAPIError("Connection error to inference API")
+
+        logger.error(
+            "Error calling inference API: %s - %s",
+            type(error).__name__,
+            str(error),
+        )
+        return InferenceAPIError(
+            f"Inference API error ({type(error).__name__}): {error}"
+        )
+
+    @staticmethod
+    def _log_batch_errors(results: List[Any]) -> None:
+        failed = sum(isinstance(result, Exception) for result in results)
+        if failed:
+            logger.warning("%d of %d chat requests failed", failed, len(results))
+
+    @staticmethod
+    def _first_message(response: Any) -> ChatCompletionMessage:
+        """Return the message of the first choice of a chat completion."""
+        if not response.choices:
+            logger.error("Inference API returned no choices")
+            raise InferenceAPIError("Inference API returned no choices")
+        return response.choices[0].message
+
+    @staticmethod
+    def _log_usage(response: Any) -> None:
+        if response.usage:
+            logger.info(
+                "Token usage - prompt: %d, completion: %d, total: %d",
+                response.usage.prompt_tokens,
+                response.usage.completion_tokens,
+                response.usage.total_tokens,
+            )
 
     def _build_chat_params(
         self,
@@ -216,6 +752,19 @@ class InferenceClient:
             params["tools"] = tools
         return params
 
+    def _build_stream_params(
+        self,
+        messages: List[Dict[str, Any]],
+        max_tokens: int,
+        temperature: float,
+        tools: Optional[List[Dict[str, Any]]],
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        kwargs.setdefault("stream_options", {"include_usage": True})
+        return self._build_chat_params(
+            messages, max_tokens, temperature, tools=tools, stream=True, **kwargs
+        )
+
     @staticmethod
     def _assistant_tool_message(message: Any, tool_calls: List[Any]) -> Dict[str, Any]:
         return {
@@ -238,6 +787,8 @@ class InferenceClient:
     async def _run_tool_call(
         tool_call: Any,
         execute_tool_func: Callable[[str, Dict[str, Any]], Awaitable[str]],
+        semaphore: asyncio.Semaphore,
+        timeout: Optional[float],
     ) -> str:
         name = tool_call.function.name
         try:
@@ -245,13 +796,33 @@ class InferenceClient:
         except (json.JSONDecodeError, TypeError) as e:
             logger.error("Failed to parse tool arguments: %s", e)
             return f"Error: Invalid JSON arguments - {e}"
-        return await execute_tool_func(name, args)
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(execute_tool_func(name, args), timeout)
+            except asyncio.TimeoutError:
+                logger.error("Tool %s timed out after %s seconds", name, timeout)
+                return f"Error: Tool '{name}' timed out after {timeout} seconds"
+
+
+def _estimate_tokens(messages: List[Dict[str, Any]], max_tokens: int) -> int:
+    """Roughly estimate the tokens a request counts against a TPM budget."""
+    return len(json.dumps(messages, default=str)) // 4 + max_tokens
 
 
 async def _execute_tool_call(
-    tool_name: str, tool_args: Dict[str, Any], tools_by_name: Dict[str, Any]
+    tool_name: str,
+    tool_args: Dict[str, Any],
+    tools_by_name: Dict[str, Any],
+    max_output_chars: Optional[int] = None,
+    spill_tool_outputs: bool = False,
 ) -> str:
-    """Execute a LangChain tool by name with the given arguments."""
+    """
+    Execute a LangChain tool by name with the given arguments.
+
+    Results longer than ``max_output_chars`` are truncated; with
+    ``spill_tool_outputs`` the full result is saved to a temporary file
+    and its path is appended to the truncated result.
+    """
     tool = tools_by_name.get(tool_name)
     if not tool:
         error_msg = f"Tool '{tool_name}' not found in available tools"
@@ -261,9 +832,9 @@ async def _execute_tool_call(
     try:
         logger.info("Executing tool: %s", tool_name)
         try:
-            logger.debug("Tool arguments: %s", json.dumps(tool_args))
+            logger.debug("Tool arguments: %s", preview(json.dumps(tool_args)))
         except (TypeError, ValueError):
-            logger.debug("Tool arguments: %s", tool_args)
+            logger.debug("Tool arguments: %s", preview(str(tool_args)))
         result_str = str(await tool.ainvoke(tool_args))
         stripped = result_str.strip()
 
@@ -271,7 +842,23 @@ async def _execute_tool_call(
             logger.warning("Tool %s returned empty or null result", tool_name)
         else:
             logger.info("Tool %s completed (%d chars)", tool_name, len(result_str))
-            logger.debug("Tool result: %s", result_str)
+            logger.debug("Tool result: %s", preview(result_str))
+
+        if max_output_chars is not None and len(result_str) > max_output_chars:
+            limited = await asyncio.to_thread(
+                limit_tool_output,
+                tool_name,
+                result_str,
+                max_output_chars,
+                spill_tool_outputs,
+            )
+            logger.warning(
+                "Tool %s output truncated from %d to %d chars",
+                tool_name,
+                len(result_str),
+                len(limited),
+            )
+            result_str = limited
         return result_str
     except Exception as e:
         error_msg = f"Error executing tool '{tool_name}': {e}"
@@ -283,20 +870,31 @@ async def analyze_with_agentic(
     messages: List[Dict[str, Any]],
     tools: Optional[List[Any]] = None,
     max_iterations: int = INFERENCE_MAX_TOOL_ITERATIONS,
+    max_concurrent_tools: int = INFERENCE_MAX_CONCURRENT_TOOLS,
+    tool_timeout: Optional[float] = INFERENCE_TOOL_TIMEOUT,
+    context_policy: Optional[ContextPolicy] = None,
+    max_tool_output_chars: Optional[int] = INFERENCE_MAX_TOOL_OUTPUT_CHARS,
+    tool_output_limits: Optional[Dict[str, int]] = None,
+    spill_tool_outputs: bool = False,
 ) -> str:
     """
     Perform LLM analysis with optional tool calling.
 
     Uses the global inference client. If tools are provided, executes an
-    agentic loop where the LLM can call tools iteratively.
+    agentic loop where the LLM can call tools iteratively, running the tool
+    calls of each turn concurrently and applying ``context_policy`` to the
+    conversation before each model call. Tool results are capped at
+    ``max_tool_output_chars`` (None for no limit), or at the tool's entry
+    in ``tool_output_limits``.
     """
     try:
         client = get_inference_client()
 
         if not tools:
             logger.debug("No tools provided, doing simple chat completion")
-            return client.chat(messages=messages).content or ""
+            return (await client.achat(messages=messages)).content or ""
 
+        convert_to_openai_tool = _lazy("convert_to_openai_tool")
         tools_by_name = {tool.name: tool for tool in tools}
         openai_tools = [convert_to_openai_tool(tool) for tool in tools]
         logger.info(
@@ -305,14 +903,25 @@ async def analyze_with_agentic(
             ", ".join(t["function"]["name"] for t in openai_tools),
         )
 
+        limits = tool_output_limits or {}
+
         async def execute_tool(tool_name, tool_args):
-            return await _execute_tool_call(tool_name, tool_args, tools_by_name)
+            return await _execute_tool_call(
+                tool_name,
+                tool_args,
+                tools_by_name,
+                max_output_chars=limits.get(tool_name, max_tool_output_chars),
+                spill_tool_outputs=spill_tool_outputs,
+            )
 
         return await client.chat_with_tools_async(
             messages=messages,
             tools=openai_tools,
             execute_tool_func=execute_tool,
             max_iterations=max_iterations,
+            max_concurrent_tools=max_concurrent_tools,
+            tool_timeout=tool_timeout,
+            context_policy=context_policy,
         )
     except (InferenceAPIError, InferenceIterationLimitError):
         raise
@@ -345,6 +954,20 @@ def get_inference_client() -> InferenceClient:
         timeout=config["timeout"],
         top_p=config["top_p"],
         frequency_penalty=config["frequency_penalty"],
+        connect_timeout=config["connect_timeout"],
+        read_timeout=config["read_timeout"],
+        write_timeout=config["write_timeout"],
+        pool_timeout=config["pool_timeout"],
+        max_connections=config["max_connections"],
+        max_keepalive_connections=config["max_keepalive_connections"],
+        keepalive_expiry=config["keepalive_expiry"],
+        http2=config["http2"],
+        retry_policy=RetryPolicy(
+            attempts=config["retry_attempts"],
+            delay=config["retry_delay"],
+            max_delay=config["max_retry_delay"],
+            backoff_multiplier=config["retry_backoff_multiplier"],
+        ),
     )
 
 
@@ -370,4 +993,42 @@ def get_inference_config() -> Dict[str, Any]:
         "frequency_penalty": float(v)
         if (v := os.getenv("INFERENCE_FREQUENCY_PENALTY"))
         else None,
+        "connect_timeout": float(
+            os.getenv("INFERENCE_CONNECT_TIMEOUT", str(INFERENCE_API_CONNECT_TIMEOUT))
+        ),
+        "read_timeout": float(v) if (v := os.getenv("INFERENCE_READ_TIMEOUT")) else None,
+        "write_timeout": float(v)
+        if (v := os.getenv("INFERENCE_WRITE_TIMEOUT"))
+        else None,
+        "pool_timeout": float(v) if (v := os.getenv("INFERENCE_POOL_TIMEOUT")) else None,
+        "max_connections": int(
+            os.getenv("INFERENCE_MAX_CONNECTIONS", str(INFERENCE_MAX_CONNECTIONS))
+        ),
+        "max_keepalive_connections": int(
+            os.getenv(
+                "INFERENCE_MAX_KEEPALIVE_CONNECTIONS",
+                str(INFERENCE_MAX_KEEPALIVE_CONNECTIONS),
+            )
+        ),
+        "keepalive_expiry": float(
+            os.getenv("INFERENCE_KEEPALIVE_EXPIRY", str(INFERENCE_KEEPALIVE_EXPIRY))
+        ),
+        "http2": os.getenv("INFERENCE_HTTP2", "false").lower() == "true",
+        "retry_attempts": int(
+            os.getenv("INFERENCE_API_RETRY_ATTEMPTS", str(INFERENCE_API_RETRY_ATTEMPTS))
+        ),
+        "retry_delay": float(
+            os.getenv("INFERENCE_API_RETRY_DELAY", str(INFERENCE_API_RETRY_DELAY))
+        ),
+        "max_retry_delay": float(
+            os.getenv(
+                "INFERENCE_API_MAX_RETRY_DELAY", str(INFERENCE_API_MAX_RETRY_DELAY)
+            )
+        ),
+        "retry_backoff_multiplier": float(
+            os.getenv(
+                "INFERENCE_API_RETRY_BACKOFF_MULTIPLIER",
+                str(INFERENCE_API_RETRY_BACKOFF_MULTIPLIER),
+            )
+        ),
     }
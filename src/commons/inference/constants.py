@@ -6,6 +6,17 @@ INFERENCE_TEMPERATURE = 0.01
 INFERENCE_MAX_TOKENS = 8192
 INFERENCE_MAX_TOOL_ITERATIONS = 5
 INFERENCE_API_TIMEOUT = 120  # seconds
+INFERENCE_API_CONNECT_TIMEOUT = 10.0  # seconds
+INFERENCE_MAX_CONNECTIONS = 100
+INFERENCE_MAX_KEEPALIVE_CONNECTIONS = 20
+INFERENCE_KEEPALIVE_EXPIRY = 5.0  # seconds
+INFERENCE_MAX_CONCURRENT_TOOLS = 4
+INFERENCE_TOOL_TIMEOUT = 300.0  # seconds
+INFERENCE_MAX_TOOL_OUTPUT_CHARS = 20000
+INFERENCE_BATCH_CONCURRENCY = 8
+INFERENCE_BATCH_COMPLETION_WINDOW = "24h"
+INFERENCE_BATCH_POLL_INTERVAL = 10.0  # seconds
+INFERENCE_BATCH_MAX_POLL_INTERVAL = 300.0  # seconds
 
 INFERENCE_API_RETRY_ATTEMPTS = 3
 INFERENCE_API_RETRY_DELAY = 5.0  # seconds
@@ -0,0 +1,147 @@
+"""Context-window policies bounding message growth in the agentic loop."""
+
+import abc
+import json
+import logging
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from .truncation import truncate_text
+
+logger = logging.getLogger(__name__)
+
+_SYSTEM_ROLES = frozenset({"system", "developer"})
+
+
+def estimate_tokens(text: str) -> int:
+    """Roughly estimate the token count of a text (about 4 characters per token)."""
+    return (len(text) + 3) // 4
+
+
+def _message_text(message: Dict[str, Any]) -> str:
+    content = message.get("content") or ""
+    text = content if isinstance(content, str) else json.dumps(content, default=str)
+    if message.get("tool_calls"):
+        text += json.dumps(message["tool_calls"], default=str)
+    return text
+
+
+class ContextPolicy(abc.ABC):
+    """
+    Base class for policies applied to the conversation before each model call.
+
+    ``apply`` returns the messages to send; it must not mutate the list or
+    the message dicts it is given. ``tokens_saved`` accumulates the
+    estimated tokens removed over the policy's lifetime.
+    """
+
+    def __init__(self, token_counter: Optional[Callable[[str], int]] = None) -> None:
+        self.token_counter = token_counter or estimate_tokens
+        self.tokens_saved = 0
+
+    @abc.abstractmethod
+    def apply(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Return the messages to send to the model."""
+
+    def count_tokens(self, messages: List[Dict[str, Any]]) -> int:
+        """Estimate the prompt tokens of a conversation."""
+        return sum(self.token_counter(_message_text(m)) for m in messages)
+
+
+class ToolOutputPolicy(ContextPolicy):
+    """
+    Shrink old tool outputs to keep the conversation within a budget.
+
+    System messages and the latest turn (the last user or assistant message
+    and everything after it) are never changed. Older tool outputs longer
+    than ``max_tool_output_chars`` are summarized with ``summarizer`` or cut
+    to their head and tail. If the conversation still exceeds ``max_tokens``
+    or ``max_chars``, old tool outputs are replaced by a short note, oldest
+    first. User and assistant messages are kept, so every tool call keeps
+    its tool response.
+
+    Outputs this policy already shrank are left alone when the conversation
+    is passed in again, so the result of ``apply`` can be fed back into it
+    (as the agentic loop does) without cutting or summarizing them twice.
+    """
+
+    def __init__(
+        self,
+        max_tokens: Optional[int] = None,
+        max_chars: Optional[int] = None,
+        max_tool_output_chars: int = 2000,
+        summarizer: Optional[Callable[[str, str], str]] = None,
+        token_counter: Optional[Callable[[str], int]] = None,
+    ) -> None:
+        super().__init__(token_counter)
+        self.max_tokens = max_tokens
+        self.max_chars = max_chars
+        self.max_tool_output_chars = max_tool_output_chars
+        self.summarizer = summarizer
+        self._shrunk: Set[str] = set()
+
+    def apply(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Return the conversation with old tool outputs shrunk as needed."""
+        messages = list(messages)
+        protected = self._protected_indexes(messages)
+        old_tools = [
+            index
+            for index, message in enumerate(messages)
+            if message.get("role") == "tool" and index not in protected
+        ]
+        before = self.count_tokens(messages)
+
+        for index in old_tools:
+            content = str(messages[index].get("content") or "")
+            if len(content) > self.max_tool_output_chars and content not in self._shrunk:
+                name = messages[index].get("name") or "tool"
+                shrunk = self._shrink(name, content)
+                self._shrunk.add(shrunk)
+                messages[index] = {**messages[index], "content": shrunk}
+
+        for index in old_tools:
+            if self._within_budget(messages):
+                break
+            name = messages[index].get("name") or "tool"
+            note = f"[{name} output removed to fit the context window]"
+            if len(str(messages[index].get("content") or "")) > len(note):
+                messages[index] = {**messages[index], "content": note}
+
+        saved = before - self.count_tokens(messages)
+        if saved > 0:
+            self.tokens_saved += saved
+            logger.info(
+                "Context policy saved ~%d tokens (%d total)", saved, self.tokens_saved
+            )
+        return messages
+
+    @staticmethod
+    def _protected_indexes(messages: List[Dict[str, Any]]) -> Set[int]:
+        protected = {
+            index
+            for index, message in enumerate(messages)
+            if message.get("role") in _SYSTEM_ROLES
+        }
+        latest_turn = next(
+            (
+                index
+                for index in range(len(messages) - 1, -1, -1)
+                if messages[index].get("role") in ("user", "assistant")
+            ),
+            0,
+        )
+        protected.update(range(latest_turn, len(messages)))
+        return protected
+
+    def _shrink(self, name: str, content: str) -> str:
+        if self.summarizer is not None:
+            return self.summarizer(name, content)
+        return truncate_text(content, self.max_tool_output_chars)
+
+    def _within_budget(self, messages: List[Dict[str, Any]]) -> bool:
+        if self.max_chars is not None:
+            if sum(len(_message_text(m)) for m in messages) > self.max_chars:
+                return False
+        if self.max_tokens is not None:
+            if self.count_tokens(messages) > self.max_tokens:
+                return False
+        return True
@@ -0,0 +1,134 @@
+"""Retry policy and rate budget for inference API requests."""
+
+import random
+import threading
+import time
+from typing import Any, FrozenSet, Optional
+
+from commons.utils import retry_after_seconds
+
+from .constants import (
+    INFERENCE_API_RETRY_ATTEMPTS,
+    INFERENCE_API_RETRY_DELAY,
+    INFERENCE_API_MAX_RETRY_DELAY,
+    INFERENCE_API_RETRY_BACKOFF_MULTIPLIER,
+)
+
+RETRYABLE_STATUSES = frozenset({408, 409, 425, 429, 500, 502, 503, 504})
+
+
+def parse_retry_after(headers: Any) -> Optional[float]:
+    """Return the wait in seconds requested by rate limit headers, if any."""
+    if not headers:
+        return None
+
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return max(0.0, float(retry_after_ms) / 1000)
+        except ValueError:
+            pass
+
+    return retry_after_seconds(headers.get("retry-after"))
+
+
+class RetryPolicy:
+    """
+    Decide which inference API errors to retry and how long to wait.
+
+    Connection errors, timeouts and responses with a status in
+    ``retry_statuses`` (429 and 5xx by default) are retried. Delays grow
+    exponentially from ``delay`` by ``backoff_multiplier`` up to
+    ``max_delay``, with jitter, unless the server sends ``Retry-After``;
+    a server-requested wait is also capped at ``max_delay``.
+    """
+
+    def __init__(
+        self,
+        attempts: int = INFERENCE_API_RETRY_ATTEMPTS,
+        delay: float = INFERENCE_API_RETRY_DELAY,
+        max_delay: float = INFERENCE_API_MAX_RETRY_DELAY,
+        backoff_multiplier: float = INFERENCE_API_RETRY_BACKOFF_MULTIPLIER,
+        jitter: bool = True,
+        retry_statuses: FrozenSet[int] = RETRYABLE_STATUSES,
+        respect_retry_after: bool = True,
+    ) -> None:
+        self.attempts = max(1, attempts)
+        self.delay = delay
+        self.max_delay = max_delay
+        self.backoff_multiplier = backoff_multiplier
+        self.jitter = jitter
+        self.retry_statuses = retry_statuses
+        self.respect_retry_after = respect_retry_after
+
+    def is_retryable(self, error: Exception) -> bool:
+        """Return whether a failed request may succeed if retried."""
+        from openai import (  # pylint: disable=import-outside-toplevel
+            APIConnectionError,
+            APIStatusError,
+        )
+
+        if isinstance(error, APIConnectionError):
+            return True
+        if isinstance(error, APIStatusError):
+            return error.status_code in self.retry_statuses
+        return isinstance(error, (ConnectionError, TimeoutError))
+
+    def compute_delay(self, attempt: int, error: Optional[Exception] = None) -> float:
+        """Return the seconds to wait after the given zero-based attempt."""
+        if self.respect_retry_after and error is not None:
+            response = getattr(error, "response", None)
+            requested = parse_retry_after(getattr(response, "headers", None))
+            if requested is not None:
+                return min(self.max_delay, requested)
+
+        delay = min(self.max_delay, self.delay * self.backoff_multiplier**attempt)
+        if self.jitter:
+            delay = random.uniform(delay / 2, delay)
+        return delay
+
+
+class RateBudget:  # pylint: disable=too-few-public-methods
+    """
+    Thread-safe requests-per-minute and tokens-per-minute budget.
+
+    Each limit is a token bucket holding one minute of budget that refills
+    continuously. ``reserve`` takes from both buckets and returns how long
+    the caller must wait before sending; None disables a limit.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+    ) -> None:
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._available = {
+            "requests": requests_per_minute or 0.0,
+            "tokens": tokens_per_minute or 0.0,
+        }
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 0.0) -> float:
+        """Take one request and ``tokens`` tokens; return seconds to wait."""
+        limits = {
+            "requests": (self.requests_per_minute, 1.0),
+            "tokens": (self.tokens_per_minute, tokens),
+        }
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._updated = now
+            wait = 0.0
+            for name, (per_minute, amount) in limits.items():
+                if not per_minute:
+                    continue
+                rate = per_minute / 60
+                available = min(per_minute, self._available[name] + elapsed * rate)
+                available -= amount
+                self._available[name] = available
+                if available < 0:
+                    wait = max(wait, -available / rate)
+            return wait
@@ -0,0 +1,175 @@
+"""Streaming chat completion responses."""
+
+import logging
+import time
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _StreamAccumulator:
+    """Rebuild a chat completion message from streamed chunks."""
+
+    def __init__(self, started_at: float) -> None:
+        self.started_at = started_at
+        self.time_to_first_token: Optional[float] = None
+        self.usage: Any = None
+        self.finish_reason: Optional[str] = None
+        self._content: List[str] = []
+        self._tool_calls: Dict[int, Dict[str, Any]] = {}
+
+    def add(self, chunk: Any) -> Optional[str]:
+        """Merge one chunk and return its content delta, if any."""
+        if getattr(chunk, "usage", None):
+            self.usage = chunk.usage
+        if not chunk.choices:
+            return None
+
+        choice = chunk.choices[0]
+        if choice.finish_reason:
+            self.finish_reason = choice.finish_reason
+
+        delta = choice.delta
+        for tool_call in delta.tool_calls or []:
+            self._mark_first_token()
+            entry = self._tool_calls.setdefault(
+                tool_call.index, {"id": None, "name": "", "arguments": ""}
+            )
+            if tool_call.id:
+                entry["id"] = tool_call.id
+            if tool_call.function:
+                entry["name"] += tool_call.function.name or ""
+                entry["arguments"] += tool_call.function.arguments or ""
+
+        if delta.content:
+            self._mark_first_token()
+            self._content.append(delta.content)
+            return delta.content
+        return None
+
+    def _mark_first_token(self) -> None:
+        if self.time_to_first_token is None:
+            self.time_to_first_token = time.monotonic() - self.started_at
+
+    def build_message(self) -> Any:
+        """Return the assembled ChatCompletionMessage."""
+        from openai.types.chat import (  # pylint: disable=import-outside-toplevel
+            ChatCompletionMessage,
+        )
+
+        tool_calls = [
+            {
+                "id": entry["id"],
+                "type": "function",
+                "function": {"name": entry["name"], "arguments": entry["arguments"]},
+            }
+            for _, entry in sorted(self._tool_calls.items())
+        ]
+        return ChatCompletionMessage.model_validate(
+            {
+                "role": "assistant",
+                "content": "".join(self._content) if self._content else None,
+                "tool_calls": tool_calls or None,
+            }
+        )
+
+
+class _BaseChatStream:
+    """State shared by the sync and async chat streams."""
+
+    def __init__(
+        self,
+        chunks: Any,
+        started_at: float,
+        error_handler: Callable[[Exception], Exception],
+        on_complete: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        self._chunks = chunks
+        self._accumulator = _StreamAccumulator(started_at)
+        self._error_handler = error_handler
+        self._on_complete = on_complete
+        self.message: Any = None
+
+    @property
+    def usage(self) -> Any:
+        """Token usage reported at the end of the stream, if any."""
+        return self._accumulator.usage
+
+    @property
+    def time_to_first_token(self) -> Optional[float]:
+        """Seconds from the request until the first content or tool delta."""
+        return self._accumulator.time_to_first_token
+
+    @property
+    def finish_reason(self) -> Optional[str]:
+        """Why the model stopped generating (e.g. 'stop', 'tool_calls')."""
+        return self._accumulator.finish_reason
+
+    def _finish(self) -> None:
+        self.message = self._accumulator.build_message()
+        ttft = self.time_to_first_token
+        logger.info(
+            "Stream complete - time to first token: %s, total: %.2fs",
+            f"{ttft:.2f}s" if ttft is not None else "n/a",
+            time.monotonic() - self._accumulator.started_at,
+        )
+        if self._on_complete:
+            self._on_complete(self)
+
+
+class ChatStream(_BaseChatStream):
+    """
+    Iterator over the content deltas of a streamed chat completion.
+
+    Once exhausted, ``message`` holds the full ChatCompletionMessage with
+    tool calls rebuilt from their deltas, ``usage`` the token usage and
+    ``time_to_first_token`` the latency of the first delta.
+    """
+
+    def __iter__(self) -> Iterator[str]:
+        try:
+            for chunk in self._chunks:
+                delta = self._accumulator.add(chunk)
+                if delta:
+                    yield delta
+        except Exception as e:
+            raise self._error_handler(e) from e
+        self._finish()
+
+    def close(self) -> None:
+        """Close the underlying HTTP response."""
+        self._chunks.close()
+
+    def __enter__(self) -> "ChatStream":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit - close the response."""
+        self.close()
+
+
+class AsyncChatStream(_BaseChatStream):
+    """Async counterpart of ChatStream, consumed with ``async for``."""
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        try:
+            async for chunk in self._chunks:
+                delta = self._accumulator.add(chunk)
+                if delta:
+                    yield delta
+        except Exception as e:
+            raise self._error_handler(e) from e
+        self._finish()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP response."""
+        await self._chunks.close()
+
+    async def __aenter__(self) -> "AsyncChatStream":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit - close the response."""
+        await self.aclose()
@@ -0,0 +1,18 @@
+"""Helpers shared by the inference tests"""
+
+from unittest.mock import Mock
+
+from openai.types.chat import ChatCompletionMessage
+
+
+def fake_completion(content: str) -> Mock:
+    """Build a chat completion response carrying one assistant message
+
+    Args:
+        content: Message content
+
+    Returns:
+        Mock completion with a real ChatCompletionMessage and no usage
+    """
+    message = ChatCompletionMessage(role="assistant", content=content)
+    return Mock(choices=[Mock(message=message)], usage=None)
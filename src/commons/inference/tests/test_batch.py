@@ -0,0 +1,113 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+from commons.inference import InferenceAPIError, InferenceClient
+from commons.inference.tests.helpers import fake_completion
+
+
+def _prompts(count):
+    """Build independent single-message conversations."""
+    return [[{"role": "user", "content": f"job {index}"}] for index in range(count)]
+
+
+class TestChatMany(unittest.TestCase):
+    """Test parallel fan-out with chat_many."""
+
+    @patch("commons.inference.client.OpenAI")
+    def test_results_in_input_order_with_errors(self, mock_openai):
+        """Keep input order and return per-item errors."""
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def create(**params):
+            nonlocal running, peak
+            content = params["messages"][0]["content"]
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02 if content == "job 0" else 0.01)
+            with lock:
+                running -= 1
+            if content == "job 2":
+                raise ValueError("bad request")
+            return fake_completion(f"answer to {content}")
+
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = create
+        mock_openai.return_value = mock_client
+
+        client = InferenceClient(
+            base_url="https://api.example.com",
+            api_key="test-key",
+            model="test-model",
+        )
+
+        results = client.chat_many(_prompts(5), concurrency=3)
+
+        self.assertEqual(results[0].content, "answer to job 0")
+        self.assertEqual(results[4].content, "answer to job 4")
+        self.assertIsInstance(results[2], InferenceAPIError)
+        self.assertEqual(peak, 3)
+
+    @patch("commons.inference.client.time.sleep")
+    @patch("commons.inference.client.OpenAI")
+    def test_requests_per_minute_budget(self, mock_openai, mock_sleep):
+        """Delay requests beyond the per-minute budget."""
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = fake_completion("ok")
+        mock_openai.return_value = mock_client
+
+        client = InferenceClient(
+            base_url="https://api.example.com",
+            api_key="test-key",
+            model="test-model",
+        )
+
+        results = client.chat_many(_prompts(3), concurrency=1, requests_per_minute=2)
+
+        self.assertEqual([r.content for r in results], ["ok", "ok", "ok"])
+        mock_sleep.assert_called_once()
+        self.assertAlmostEqual(mock_sleep.call_args.args[0], 30.0, delta=0.1)
+
+
+class TestAchatMany(unittest.IsolatedAsyncioTestCase):
+    """Test parallel fan-out with achat_many."""
+
+    @patch("commons.inference.client.AsyncOpenAI")
+    async def test_concurrency_limit_and_order(self, mock_async_openai):
+        """Run at most `concurrency` requests at once, keeping input order."""
+        running = 0
+        peak = 0
+
+        async def create(**params):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return fake_completion(params["messages"][0]["content"])
+
+        mock_client = Mock()
+        mock_client.chat.completions.create = AsyncMock(side_effect=create)
+        mock_async_openai.return_value = mock_client
+
+        client = InferenceClient(
+            base_url="https://api.example.com",
+            api_key="test-key",
+            model="test-model",
+        )
+
+        results = await client.achat_many(_prompts(10), concurrency=4)
+
+        self.assertEqual(
+            [r.content for r in results], [f"job {index}" for index in range(10)]
+        )
+        self.assertEqual(peak, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,249 @@
+import json
+import threading
+import unittest
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock, patch
+
+from commons.inference import InferenceAPIError, InferenceClient
+from commons.inference.batch import build_batch_file, parse_batch_line
+
+
+def _completion(custom_id, content):
+    """Build a chat.completion body as returned inside a batch output line."""
+    return {
+        "id": f"chatcmpl-{custom_id}",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "test-model",
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": content},
+            }
+        ],
+    }
+
+
+class _BatchServer(ThreadingHTTPServer):
+    """Minimal stand-in for the OpenAI files and batches endpoints."""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _BatchHandler)
+        self.files = {}
+        self.batches = {}
+        self.polls = 0
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/v1"
+
+
+class _BatchHandler(BaseHTTPRequestHandler):
+    """Serve uploads, batch creation, polling and result downloads."""
+
+    server: _BatchServer
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+    def _send_json(self, payload, status=200):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self):
+        return self.rfile.read(int(self.headers["Content-Length"]))
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        if self.path == "/v1/files":
+            raw = b"Content-Type: " + self.headers["Content-Type"].encode() + b"\r\n\r\n"
+            message = BytesParser(policy=HTTP).parsebytes(raw + self._read_body())
+            content = next(
+                part.get_payload(decode=True)
+                for part in message.iter_parts()
+                if part.get_filename()
+            )
+            file_id = f"file-{len(self.server.files)}"
+            self.server.files[file_id] = content
+            self._send_json(
+                {
+                    "id": file_id,
+                    "object": "file",
+                    "bytes": len(content),
+                    "created_at": 0,
+                    "filename": "batch.jsonl",
+                    "purpose": "batch",
+                    "status": "processed",
+                }
+            )
+        elif self.path == "/v1/batches":
+            request = json.loads(self._read_body())
+            batch_id = f"batch-{len(self.server.batches)}"
+            self.server.batches[batch_id] = {
+                "id": batch_id,
+                "object": "batch",
+                "endpoint": request["endpoint"],
+                "input_file_id": request["input_file_id"],
+                "completion_window": request["completion_window"],
+                "created_at": 0,
+                "status": "validating",
+            }
+            self._send_json(self.server.batches[batch_id])
+        else:
+            self._send_json({"error": {"message": "not found"}}, status=404)
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        parts = self.path.strip("/").split("/")
+        if parts[:2] == ["v1", "batches"]:
+            self.server.polls += 1
+            batch = self.server.batches[parts[2]]
+            if batch["status"] == "validating":
+                batch["status"] = "in_progress"
+            elif batch["status"] == "in_progress":
+                self._complete(batch)
+            self._send_json(batch)
+        elif parts[:2] == ["v1", "files"] and parts[3:] == ["content"]:
+            body = self.server.files[parts[2]]
+            self.send_response(200)
+            self.send_header("Content-Type", "application/octet-stream")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        else:
+            self._send_json({"error": {"message": "not found"}}, status=404)
+
+    def _complete(self, batch):
+        output, errors = [], []
+        for line in self.server.files[batch["input_file_id"]].decode().splitlines():
+            request = json.loads(line)
+            custom_id = request["custom_id"]
+            question = request["body"]["messages"][-1]["content"]
+            if "fail" in custom_id:
+                errors.append(
+                    {
+                        "custom_id": custom_id,
+                        "response": {
+                            "status_code": 400,
+                            "body": {"error": {"message": "context too long"}},
+                        },
+                        "error": None,
+                    }
+                )
+            else:
+                output.append(
+                    {
+                        "custom_id": custom_id,
+                        "response": {
+                            "status_code": 200,
+                            "body": _completion(custom_id, f"summary of {question}"),
+                        },
+                        "error": None,
+                    }
+                )
+        self.server.files["file-output"] = "\n".join(map(json.dumps, output)).encode()
+        self.server.files["file-errors"] = "\n".join(map(json.dumps, errors)).encode()
+        batch.update(
+            status="completed",
+            output_file_id="file-output",
+            error_file_id="file-errors",
+            request_counts={
+                "total": len(output) + len(errors),
+                "completed": len(output),
+                "failed": len(errors),
+            },
+        )
+
+
+class TestBatchFile(unittest.TestCase):
+    """Test batch file helpers."""
+
+    def test_build_and_parse(self):
+        """Write JSONL request lines and parse success and error lines."""
+        payload = build_batch_file({"job-1": {"model": "m", "messages": []}})
+        request = json.loads(payload.decode().splitlines()[0])
+        self.assertEqual(request["custom_id"], "job-1")
+        self.assertEqual(request["url"], "/v1/chat/completions")
+
+        custom_id, message = parse_batch_line(
+            json.dumps(
+                {
+                    "custom_id": "job-1",
+                    "response": {"status_code": 200, "body": _completion("job-1", "ok")},
+                }
+            )
+        )
+        self.assertEqual((custom_id, message.content), ("job-1", "ok"))
+
+        _, error = parse_batch_line(
+            json.dumps(
+                {"custom_id": "job-2", "error": {"code": "expired", "message": "expired"}}
+            )
+        )
+        self.assertIsInstance(error, InferenceAPIError)
+
+
+class TestBatchJobs(unittest.TestCase):
+    """Test batch submission against a local stand-in server."""
+
+    def setUp(self):
+        self.server = _BatchServer()
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        self.client = InferenceClient(
+            base_url=self.server.base_url,
+            api_key="test-key",
+            model="test-model",
+        )
+        self.addCleanup(self.client.close)
+
+    def test_run_batch(self):
+        """Submit, poll and map results back to request IDs in input order."""
+        requests = {
+            "job-2": [{"role": "user", "content": "log 2"}],
+            "job-1": [{"role": "user", "content": "log 1"}],
+            "job-fail": [{"role": "user", "content": "huge log"}],
+        }
+
+        results = self.client.run_batch(requests, poll_interval=0.01, max_tokens=256)
+
+        self.assertEqual(list(results), ["job-2", "job-1", "job-fail"])
+        self.assertEqual(results["job-1"].content, "summary of log 1")
+        self.assertEqual(results["job-2"].content, "summary of log 2")
+        self.assertIsInstance(results["job-fail"], InferenceAPIError)
+        self.assertIn("context too long", str(results["job-fail"]))
+        self.assertEqual(self.server.polls, 2)
+
+        uploaded = json.loads(self.server.files["file-0"].decode().splitlines()[0])
+        self.assertEqual(uploaded["body"]["model"], "test-model")
+        self.assertEqual(uploaded["body"]["max_tokens"], 256)
+
+    @patch("commons.inference.client.time")
+    def test_wait_for_batch_timeout(self, mock_time):
+        """Keep polling until the timeout has passed, then raise InferenceAPIError."""
+        clock = [0.0]
+        mock_time.monotonic.side_effect = lambda: clock[0]
+        mock_time.sleep.side_effect = lambda seconds: clock.__setitem__(0, clock[0] + seconds)
+        batch_id = self.client.submit_batch({"job-1": [{"role": "user", "content": "x"}]})
+
+        with patch.object(
+            self.client.client.batches, "retrieve", return_value=Mock(status="in_progress")
+        ) as retrieve:
+            with self.assertRaises(InferenceAPIError) as context:
+                self.client.wait_for_batch(batch_id, poll_interval=10, timeout=60)
+
+        self.assertEqual([c.args[0] for c in mock_time.sleep.call_args_list], [10, 20, 30])
+        self.assertEqual(retrieve.call_count, 4)
+        self.assertIn("still in_progress after 60 seconds", str(context.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
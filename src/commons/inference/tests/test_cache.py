@@ -0,0 +1,149 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+from commons.inference import InferenceClient, MemoryCache, SQLiteCache
+from commons.inference.cache import ResponseCache, cache_key
+from commons.inference.tests.helpers import fake_completion
+
+
+class TestCacheKey(unittest.TestCase):
+    """Test request hashing."""
+
+    def test_cache_key_is_stable(self):
+        """Hash equal parameters equally regardless of key order."""
+        first = {"model": "m", "messages": [{"role": "user", "content": "hi"}]}
+        second = {"messages": [{"content": "hi", "role": "user"}], "model": "m"}
+
+        self.assertEqual(cache_key(first), cache_key(second))
+        self.assertNotEqual(cache_key(first), cache_key({**first, "temperature": 0.5}))
+
+
+class CacheBackendTests:
+    """Behaviour shared by every cache backend."""
+
+    def make_cache(self, max_entries=2, ttl=None):
+        raise NotImplementedError
+
+    @patch("commons.inference.cache.time.time")
+    def test_lru_eviction(self, mock_time):
+        """Evict the least recently used entry past max_entries."""
+        cache = self.make_cache(max_entries=2)
+        mock_time.return_value = 1.0
+        cache.set("a", "1")
+        mock_time.return_value = 2.0
+        cache.set("b", "2")
+        mock_time.return_value = 3.0
+        self.assertEqual(cache.get("a"), "1")
+        mock_time.return_value = 4.0
+        cache.set("c", "3")
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), "1")
+        self.assertEqual(cache.get("c"), "3")
+        self.assertEqual(
+            cache.stats(), {"hits": 3, "misses": 1, "evictions": 1, "size": 2}
+        )
+
+    @patch("commons.inference.cache.time.time")
+    def test_ttl_expiry(self, mock_time):
+        """Treat entries older than ttl as misses."""
+        cache = self.make_cache(ttl=10)
+        mock_time.return_value = 100.0
+        cache.set("a", "1")
+
+        mock_time.return_value = 105.0
+        self.assertEqual(cache.get("a"), "1")
+        mock_time.return_value = 111.0
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.stats()["size"], 0)
+
+
+class TestMemoryCache(CacheBackendTests, unittest.TestCase):
+    """Test the in-memory LRU backend."""
+
+    def make_cache(self, max_entries=2, ttl=None):
+        return MemoryCache(max_entries=max_entries, ttl=ttl)
+
+    def test_base_class_is_abstract(self):
+        """Refuse to build a cache without a storage backend."""
+        with self.assertRaises(TypeError):
+            ResponseCache()  # pylint: disable=abstract-class-instantiated
+
+
+class TestSQLiteCache(CacheBackendTests, unittest.TestCase):
+    """Test the SQLite backend."""
+
+    def make_cache(self, max_entries=2, ttl=None):
+        cache = SQLiteCache(":memory:", max_entries=max_entries, ttl=ttl)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_persists_across_instances(self):
+        """Reopen a cache file and find earlier entries."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "responses.db")
+            with SQLiteCache(path) as cache:
+                cache.set("a", "1")
+            with SQLiteCache(path) as cache:
+                self.assertEqual(cache.get("a"), "1")
+
+
+class TestClientCache(unittest.IsolatedAsyncioTestCase):
+    """Test InferenceClient with a response cache."""
+
+    @patch("commons.inference.client.OpenAI")
+    async def test_chat_served_from_cache(self, mock_openai):
+        """Answer repeated identical requests from the cache."""
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = fake_completion("cached answer")
+        mock_openai.return_value = mock_client
+        cache = MemoryCache()
+
+        client = InferenceClient(
+            base_url="https://api.example.com",
+            api_key="test-key",
+            model="test-model",
+            cache=cache,
+        )
+
+        messages = [{"role": "user", "content": "Why did the job fail?"}]
+        first = client.chat(messages)
+        second = client.chat(messages)
+        third = await client.achat(messages)
+        client.chat(messages, temperature=0.7)
+
+        self.assertEqual(first.content, "cached answer")
+        self.assertEqual(second.content, "cached answer")
+        self.assertEqual(third.content, "cached answer")
+        self.assertEqual(mock_client.chat.completions.create.call_count, 2)
+        self.assertEqual(cache.stats()["hits"], 2)
+        self.assertEqual(cache.stats()["misses"], 2)
+
+    @patch("commons.inference.client.AsyncOpenAI")
+    async def test_achat_populates_cache(self, mock_async_openai):
+        """Store async responses for later calls."""
+        mock_client = Mock()
+        mock_client.chat.completions.create = AsyncMock(
+            return_value=fake_completion("async answer")
+        )
+        mock_async_openai.return_value = mock_client
+
+        client = InferenceClient(
+            base_url="https://api.example.com",
+            api_key="test-key",
+            model="test-model",
+            cache=MemoryCache(),
+        )
+
+        messages = [{"role": "user", "content": "Hello"}]
+        await client.achat(messages)
+        message = await client.achat(messages)
+
+        self.assertEqual(message.content, "async answer")
+        mock_client.chat.completions.create.assert_awaited_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,9 @@
+import asyncio
 import os
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
 
 from commons.inference import (
     InferenceClient,
@@ -34,6 +37,7 @@ class TestInferenceConfig(unittest.TestCase):
         self.assertEqual(config["model"], "test-model")
         self.assertTrue(config["verify_ssl"])
         self.assertEqual(config["timeout"], 120)
+        self.assertEqual(config["retry_attempts"], 3)
 
     @patch.dict(
         os.environ,
@@ -56,6 +60,55 @@ class TestInferenceConfig(unittest.TestCase):
         self.assertEqual(config["top_p"], 0.9)
         self.assertEqual(config["frequency_penalty"], 0.5)
 
+    @patch.dict(
+        os.environ,
+        {
+            "INFERENCE_URL": "https://api.example.com",
+            "INFERENCE_TOKEN": "test-token",
+            "INFERENCE_MODEL": "test-model",
+            "INFERENCE_API_RETRY_ATTEMPTS": "5",
+            "INFERENCE_API_RETRY_DELAY": "0.5",
+            "INFERENCE_API_MAX_RETRY_DELAY": "10",
+            "INFERENCE_API_RETRY_BACKOFF_MULTIPLIER": "3",
+        },
+        clear=True,
+    )
+    def test_get_inference_config_retry(self):
+        """Load retry settings from env vars."""
+        config = get_inference_config()
+        self.assertEqual(config["retry_attempts"], 5)
+        self.assertEqual(config["retry_delay"], 0.5)
+        self.assertEqual(config["max_retry_delay"], 10.0)
+        self.assertEqual(config["retry_backoff_multiplier"], 3.0)
+
+    @patch.dict(
+        os.environ,
+        {
+            "INFERENCE_URL": "https://api.example.com",
+            "INFERENCE_TOKEN": "test-token",
+            "INFERENCE_MODEL": "test-model",
+            "INFERENCE_CONNECT_TIMEOUT": "3",
+            "INFERENCE_READ_TIMEOUT": "300",
+            "INFERENCE_POOL_TIMEOUT": "30",
+            "INFERENCE_MAX_CONNECTIONS": "200",
+            "INFERENCE_MAX_KEEPALIVE_CONNECTIONS": "50",
+            "INFERENCE_KEEPALIVE_EXPIRY": "30",
+            "INFERENCE_HTTP2": "true",
+        },
+        clear=True,
+    )
+    def test_get_inference_config_http(self):
+        """Load connection pool and timeout settings from env vars."""
+        config = get_inference_config()
+        self.assertEqual(config["connect_timeout"], 3.0)
+        self.assertEqual(config["read_timeout"], 300.0)
+        self.assertIsNone(config["write_timeout"])
+        self.assertEqual(config["pool_timeout"], 30.0)
+        self.assertEqual(config["max_connections"], 200)
+        self.assertEqual(config["max_keepalive_connections"], 50)
+        self.assertEqual(config["keepalive_expiry"], 30.0)
+        self.assertTrue(config["http2"])
+
     @patch.dict(os.environ, {}, clear=True)
     def test_get_inference_config_missing_url(self):
         """Raise ValueError when required env var is missing."""
@@ -177,8 +230,9 @@ class TestInferenceClient(unittest.TestCase):
         call_args = mock_client.chat.completions.create.call_args
         self.assertIn("tools", call_args.kwargs)
 
+    @patch("commons.inference.client.time.sleep")
     @patch("commons.inference.client.OpenAI")
-    def test_chat_timeout_error(self, mock_openai):
+    def test_chat_timeout_error(self, mock_openai, mock_sleep):
         """Raise InferenceAPIError on request timeout."""
         from openai import APITimeoutError
 
@@ -200,8 +254,9 @@ class TestInferenceClient(unittest.TestCase):
             client.chat(messages)
         self.assertIn("timed out", str(context.exception))
 
+    @patch("commons.inference.client.time.sleep")
     @patch("commons.inference.client.OpenAI")
-    def test_chat_connect_error(self, mock_openai):
+    def test_chat_connect_error(self, mock_openai, mock_sleep):
         """Raise InferenceAPIError on connection failure."""
         from openai import APIConnectionError
 
@@ -241,6 +296,146 @@ class TestInferenceClient(unittest.TestCase):
         with self.assertRaises(InferenceAPIError):
             client.chat(messages)
 
+    @patch("commons.inference.client.OpenAI")
+    def test_chat_no_choices(self, mock_openai):
+        """Raise InferenceAPIError when the response has no choices."""
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = Mock(choices=[], usage=None)
+        mock_openai.return_value = mock_client
+
+        client = InferenceClient(
+            base_url="https://api.example.com",
+            api_key="test-key",
+            model="test-model",
+        )
+
+        with self.assertRaises(InferenceAPIError) as context:
+            client.chat([{"role": "user", "content": "Hello"}])
+        self.assertIn("no choices", str(context.exception))
+
+    @patch("commons.inference.client.AsyncOpenAI")
+    def test_achat_new_client_per_event_loop(self, mock_async_openai):
+        """Create a fresh async client for each event loop."""
+        mock_response = Mock()
+        mock_response.choices = [Mock(message=Mock(content="ok"))]
+        mock_response.usage = None
+
+        mock_client = Mock()
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+        mock_async_openai.return_value = mock_client
+
+        client = InferenceClient(
+            base_url="https://api.example.com",
+            api_key="test-key",
+            model="test-model",
+        )
+
+        messages = [{"role": "user", "content": "Hello"}]
+        asyncio.run(client.achat(messages))
+        asyncio.run(client.achat(messages))
+
+        self.assertEqual(mock_async_openai.call_count, 2)
+
+
+    @patch("commons.inference.client.AsyncOpenAI")
+    def test_aclose_only_closes_client_of_running_loop(self, mock_async_openai):
+        """Close the async client on its own loop and drop it on any other."""
+        mock_response = Mock()
+        mock_response.choices = [Mock(message=Mock(content="ok"))]
+        mock_response.usage = None
+
+        mock_client = Mock()
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+        mock_client.close = AsyncMock()
+        mock_async_openai.return_value = mock_client
+
+        client = InferenceClient(
+            base_url="https://api.example.com",
+            api_key="test-key",
+            model="test-model",
+        )
+        messages = [{"role": "user", "content": "Hello"}]
+
+        asyncio.run(client.achat(messages))
+        asyncio.run(client.aclose())
+        mock_client.close.assert_not_awaited()
+
+        async def chat_and_close():
+            await client.achat(messages)
+            await client.aclose()
+
+        asyncio.run(chat_and_close())
+        mock_client.close.assert_awaited_once()
+
+class TestHttpOptions(unittest.TestCase):
+    """Test connection pool, timeout and transport options."""
+
+    @patch("commons.inference.client.OpenAI")
+    @patch("commons.inference.client.httpx.Client")
+    def test_pool_limits_and_split_timeouts(self, mock_http_client, mock_openai):
+        """Pass limits, HTTP/2 and per-phase timeouts to httpx."""
+        InferenceClient(
+            base_url="https://api.example.com",
+            api_key="test-key",
+            model="test-model",
+            timeout=60,
+            connect_timeout=2,
+            pool_timeout=5,
+            max_connections=64,
+            max_keepalive_connections=32,
+            keepalive_expiry=15,
+            http2=True,
+        )
+
+        options = mock_http_client.call_args.kwargs
+        self.assertTrue(options["http2"])
+        self.assertEqual(
+            options["timeout"], httpx.Timeout(60, connect=2, read=60, write=60, pool=5)
+        )
+        self.assertEqual(
+            options["limits"],
+            httpx.Limits(
+                max_connections=64, max_keepalive_connections=32, keepalive_expiry=15
+            ),
+        )
+        self.assertIs(
+            mock_openai.call_args.kwargs["http_client"], mock_http_client.return_value
+        )
+
+    def test_injected_transport(self):
+        """Send requests through an injected shared transport."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(
+                200,
+                json={
+                    "id": "chatcmpl-1",
+                    "object": "chat.completion",
+                    "created": 0,
+                    "model": "test-model",
+                    "choices": [
+                        {
+                            "index": 0,
+                            "finish_reason": "stop",
+                            "message": {"role": "assistant", "content": "pong"},
+                        }
+                    ],
+                },
+            )
+
+        with InferenceClient(
+            base_url="https://api.example.com",
+            api_key="test-key",
+            model="test-model",
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            message = client.chat([{"role": "user", "content": "ping"}])
+
+        self.assertEqual(message.content, "pong")
+        self.assertEqual(str(requests[0].url), "https://api.example.com/chat/completions")
+
 
 class TestGlobalClient(unittest.TestCase):
     """Test global singleton client factory."""
@@ -285,10 +480,84 @@ class TestGlobalClient(unittest.TestCase):
         self.assertEqual(mock_client_class.call_count, 2)
 
 
+class TestAsyncChat(unittest.IsolatedAsyncioTestCase):
+    """Test native async chat completions."""
+
+    @patch("commons.inference.client.AsyncOpenAI")
+    async def test_achat_success(self, mock_async_openai):
+        """Send async chat request and return message."""
+        mock_message = Mock()
+        mock_message.content = "Hello, async!"
+
+        mock_response = Mock()
+        mock_response.choices = [Mock(message=mock_message)]
+        mock_response.usage = Mock(
+            prompt_tokens=10, completion_tokens=5, total_tokens=15
+        )
+
+        mock_client = Mock()
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+        mock_client.close = AsyncMock()
+        mock_async_openai.return_value = mock_client
+
+        async with InferenceClient(
+            base_url="https://api.example.com",
+            api_key="test-key",
+            model="test-model",
+        ) as client:
+            response = await client.achat([{"role": "user", "content": "Hello"}])
+            await client.achat([{"role": "user", "content": "Again"}])
+
+        self.assertEqual(response.content, "Hello, async!")
+        self.assertEqual(mock_client.chat.completions.create.await_count, 2)
+        mock_async_openai.assert_called_once()
+        mock_client.close.assert_awaited_once()
+
+    @patch("commons.inference.client.asyncio.sleep", new_callable=AsyncMock)
+    @patch("commons.inference.client.AsyncOpenAI")
+    async def test_achat_timeout_error(self, mock_async_openai, mock_sleep):
+        """Raise InferenceAPIError on async request timeout."""
+        from openai import APITimeoutError
+
+        mock_client = Mock()
+        mock_client.chat.completions.create = AsyncMock(
+            side_effect=APITimeoutError(request=Mock())
+        )
+        mock_async_openai.return_value = mock_client
+
+        client = InferenceClient(
+            base_url="https://api.example.com",
+            api_key="test-key",
+            model="test-model",
+        )
+
+        with self.assertRaises(InferenceAPIError) as context:
+            await client.achat([{"role": "user", "content": "Hello"}])
+        self.assertIn("timed out", str(context.exception))
+
+    @patch("commons.inference.client.AsyncOpenAI")
+    async def test_achat_no_choices(self, mock_async_openai):
+        """Raise InferenceAPIError when the async response has no choices."""
+        mock_client = Mock()
+        mock_client.chat.completions.create = AsyncMock(
+            return_value=Mock(choices=[], usage=None)
+        )
+        mock_async_openai.return_value = mock_client
+
+        client = InferenceClient(
+            base_url="https://api.example.com",
+            api_key="test-key",
+            model="test-model",
+        )
+
+        with self.assertRaises(InferenceAPIError):
+            await client.achat([{"role": "user", "content": "Hello"}])
+
+
 class TestChatWithToolsAsync(unittest.IsolatedAsyncioTestCase):
     """Test agentic loop with tool calling."""
 
-    @patch("commons.inference.client.OpenAI")
+    @patch("commons.inference.client.AsyncOpenAI")
     async def test_messages_not_mutated(self, mock_openai):
         """Original messages list is not mutated by chat_with_tools_async."""
         mock_message = Mock()
@@ -300,7 +569,7 @@ class TestChatWithToolsAsync(unittest.IsolatedAsyncioTestCase):
         mock_response.usage = None
 
         mock_client = Mock()
-        mock_client.chat.completions.create.return_value = mock_response
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
         mock_openai.return_value = mock_client
 
         client = InferenceClient(
@@ -320,7 +589,7 @@ class TestChatWithToolsAsync(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(len(original_messages), original_length)
 
-    @patch("commons.inference.client.OpenAI")
+    @patch("commons.inference.client.AsyncOpenAI")
     async def test_chat_with_tools_no_tool_calls(self, mock_openai):
         """Return final answer when LLM makes no tool calls."""
         mock_message = Mock()
@@ -332,7 +601,7 @@ class TestChatWithToolsAsync(unittest.IsolatedAsyncioTestCase):
         mock_response.usage = None
 
         mock_client = Mock()
-        mock_client.chat.completions.create.return_value = mock_response
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
         mock_openai.return_value = mock_client
 
         client = InferenceClient(
@@ -351,7 +620,7 @@ class TestChatWithToolsAsync(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(result, "Final answer")
 
-    @patch("commons.inference.client.OpenAI")
+    @patch("commons.inference.client.AsyncOpenAI")
     async def test_chat_with_tools_max_iterations(self, mock_openai):
         """Raise InferenceIterationLimitError when max iterations reached."""
         mock_tool_call = Mock()
@@ -368,7 +637,7 @@ class TestChatWithToolsAsync(unittest.IsolatedAsyncioTestCase):
         mock_response.usage = None
 
         mock_client = Mock()
-        mock_client.chat.completions.create.return_value = mock_response
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
         mock_openai.return_value = mock_client
 
         client = InferenceClient(
@@ -390,6 +659,104 @@ class TestChatWithToolsAsync(unittest.IsolatedAsyncioTestCase):
                 max_iterations=2,
             )
 
+    @patch("commons.inference.client.AsyncOpenAI")
+    async def test_tool_calls_run_concurrently_in_order(self, mock_async_openai):
+        """Run tool calls concurrently within the limit, keeping their order."""
+        tool_calls = []
+        for index, delay in enumerate((0.05, 0.01, 0.03)):
+            tool_call = Mock()
+            tool_call.id = f"call_{index}"
+            tool_call.function.name = "slow_tool"
+            tool_call.function.arguments = f'{{"delay": {delay}}}'
+            tool_calls.append(tool_call)
+
+        tool_message = Mock(content="", tool_calls=tool_calls)
+        final_message = Mock(content="Done", tool_calls=None)
+
+        mock_client = Mock()
+        mock_client.chat.completions.create = AsyncMock(
+            side_effect=[
+                Mock(choices=[Mock(message=tool_message)], usage=None),
+                Mock(choices=[Mock(message=final_message)], usage=None),
+            ]
+        )
+        mock_async_openai.return_value = mock_client
+
+        client = InferenceClient(
+            base_url="https://api.example.com",
+            api_key="test-key",
+            model="test-model",
+        )
+
+        running = 0
+        peak = 0
+
+        async def mock_executor(name, args):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(args["delay"])
+            running -= 1
+            return f"slept {args['delay']}"
+
+        result = await client.chat_with_tools_async(
+            messages=[{"role": "user", "content": "Test"}],
+            tools=[],
+            execute_tool_func=mock_executor,
+            max_concurrent_tools=2,
+        )
+
+        self.assertEqual(result, "Done")
+        self.assertEqual(peak, 2)
+        sent = mock_client.chat.completions.create.call_args.kwargs["messages"]
+        tool_messages = [m for m in sent if m["role"] == "tool"]
+        self.assertEqual(
+            [m["tool_call_id"] for m in tool_messages], ["call_0", "call_1", "call_2"]
+        )
+        self.assertEqual(tool_messages[0]["content"], "slept 0.05")
+
+    @patch("commons.inference.client.AsyncOpenAI")
+    async def test_tool_call_timeout(self, mock_async_openai):
+        """Report a timed out tool call to the model as an error result."""
+        tool_call = Mock()
+        tool_call.id = "call_1"
+        tool_call.function.name = "hanging_tool"
+        tool_call.function.arguments = "{}"
+
+        mock_client = Mock()
+        mock_client.chat.completions.create = AsyncMock(
+            side_effect=[
+                Mock(
+                    choices=[Mock(message=Mock(content="", tool_calls=[tool_call]))],
+                    usage=None,
+                ),
+                Mock(
+                    choices=[Mock(message=Mock(content="Done", tool_calls=None))],
+                    usage=None,
+                ),
+            ]
+        )
+        mock_async_openai.return_value = mock_client
+
+        client = InferenceClient(
+            base_url="https://api.example.com",
+            api_key="test-key",
+            model="test-model",
+        )
+
+        async def mock_executor(name, args):
+            await asyncio.sleep(10)
+
+        await client.chat_with_tools_async(
+            messages=[{"role": "user", "content": "Test"}],
+            tools=[],
+            execute_tool_func=mock_executor,
+            tool_timeout=0.01,
+        )
+
+        sent = mock_client.chat.completions.create.call_args.kwargs["messages"]
+        self.assertIn("timed out", sent[-1]["content"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,174 @@
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+from commons.inference import ContextPolicy, InferenceClient, ToolOutputPolicy
+
+
+def _tool_turn(call_id, content):
+    """Build an assistant tool call message and its tool result."""
+    return [
+        {
+            "role": "assistant",
+            "content": "",
+            "tool_calls": [
+                {
+                    "id": call_id,
+                    "type": "function",
+                    "function": {"name": "search_logs", "arguments": "{}"},
+                }
+            ],
+        },
+        {
+            "role": "tool",
+            "tool_call_id": call_id,
+            "name": "search_logs",
+            "content": content,
+        },
+    ]
+
+
+def _conversation():
+    """Build a conversation with two old tool turns and a latest one."""
+    return [
+        {"role": "system", "content": "You are a log analyst."},
+        {"role": "user", "content": "Why did the build fail?"},
+        *_tool_turn("call_1", "a" * 5000),
+        *_tool_turn("call_2", "b" * 5000),
+        *_tool_turn("call_3", "c" * 5000),
+    ]
+
+
+class TestToolOutputPolicy(unittest.TestCase):
+    """Test shrinking old tool outputs."""
+
+    def test_truncates_old_tool_outputs(self):
+        """Cut old tool outputs to head and tail, keeping the latest turn."""
+        messages = _conversation()
+        policy = ToolOutputPolicy(max_tool_output_chars=300)
+
+        result = policy.apply(messages)
+
+        self.assertEqual(result[:2], messages[:2])
+        self.assertEqual(result[-2:], messages[-2:])
+        self.assertTrue(result[3]["content"].startswith("a" * 200))
+        self.assertTrue(result[3]["content"].endswith("a" * 100))
+        self.assertIn("[4700 chars omitted]", result[3]["content"])
+        self.assertEqual(result[3]["tool_call_id"], "call_1")
+        self.assertEqual(messages[3]["content"], "a" * 5000)
+        self.assertGreater(policy.tokens_saved, 2000)
+
+    def test_removes_oldest_outputs_to_fit_budget(self):
+        """Replace old outputs oldest first until the budget is met."""
+        policy = ToolOutputPolicy(max_chars=11000, max_tool_output_chars=10000)
+
+        result = policy.apply(_conversation())
+
+        self.assertIn("removed to fit the context window", result[3]["content"])
+        self.assertEqual(result[5]["content"], "b" * 5000)
+        self.assertEqual(result[7]["content"], "c" * 5000)
+
+    def test_summarizer(self):
+        """Use the summarizer for old outputs when given."""
+        policy = ToolOutputPolicy(
+            max_tool_output_chars=300,
+            summarizer=lambda name, content: f"{name}: {len(content)} chars",
+        )
+
+        result = policy.apply(_conversation())
+
+        self.assertEqual(result[3]["content"], "search_logs: 5000 chars")
+        self.assertEqual(result[5]["content"], "search_logs: 5000 chars")
+
+    def test_apply_twice_is_idempotent(self):
+        """Leave outputs shrunk by an earlier pass unchanged when fed back in."""
+        policy = ToolOutputPolicy(max_tool_output_chars=300)
+        first = policy.apply(_conversation())
+        saved = policy.tokens_saved
+
+        second = policy.apply(first)
+
+        self.assertEqual(second, first)
+        self.assertIn("[4700 chars omitted]", second[3]["content"])
+        self.assertEqual(policy.tokens_saved, saved)
+
+        summarizer = Mock(side_effect=lambda name, content: "x" * 400)
+        policy = ToolOutputPolicy(max_tool_output_chars=300, summarizer=summarizer)
+        policy.apply(policy.apply(_conversation()))
+        self.assertEqual(summarizer.call_count, 2)
+
+    def test_small_conversation_unchanged(self):
+        """Leave conversations within the limits untouched."""
+        messages = _conversation()[:2] + _tool_turn("call_1", "short")
+        policy = ToolOutputPolicy(max_tokens=1000)
+
+        self.assertEqual(policy.apply(messages), messages)
+        self.assertEqual(policy.tokens_saved, 0)
+
+
+class TestContextPolicy(unittest.TestCase):
+    """Test the context policy base class."""
+
+    def test_apply_is_abstract(self):
+        """Require subclasses to implement apply."""
+
+        class Incomplete(ContextPolicy):  # pylint: disable=abstract-method
+            pass
+
+        with self.assertRaises(TypeError):
+            Incomplete()  # pylint: disable=abstract-class-instantiated
+
+
+class TestContextPolicyInLoop(unittest.IsolatedAsyncioTestCase):
+    """Test the policy inside chat_with_tools_async."""
+
+    @patch("commons.inference.client.AsyncOpenAI")
+    async def test_policy_applied_before_each_call(self, mock_async_openai):
+        """Shrink earlier tool outputs before later model calls."""
+        tool_calls = []
+        for index in range(2):
+            tool_call = Mock()
+            tool_call.id = f"call_{index}"
+            tool_call.function.name = "search_logs"
+            tool_call.function.arguments = "{}"
+            tool_calls.append(tool_call)
+
+        sent = []
+
+        async def create(**params):
+            sent.append([dict(m) for m in params["messages"]])
+            if len(sent) <= 2:
+                message = Mock(content="", tool_calls=[tool_calls[len(sent) - 1]])
+            else:
+                message = Mock(content="Done", tool_calls=None)
+            return Mock(choices=[Mock(message=message)], usage=None)
+
+        mock_client = Mock()
+        mock_client.chat.completions.create = AsyncMock(side_effect=create)
+        mock_async_openai.return_value = mock_client
+
+        client = InferenceClient(
+            base_url="https://api.example.com",
+            api_key="test-key",
+            model="test-model",
+        )
+
+        async def mock_executor(name, args):
+            return "x" * 5000
+
+        policy = ToolOutputPolicy(max_tool_output_chars=500)
+        result = await client.chat_with_tools_async(
+            messages=[{"role": "user", "content": "Test"}],
+            tools=[],
+            execute_tool_func=mock_executor,
+            context_policy=policy,
+        )
+
+        self.assertEqual(result, "Done")
+        self.assertEqual(sent[1][-1]["content"], "x" * 5000)
+        self.assertLess(len(sent[2][2]["content"]), 600)
+        self.assertEqual(sent[2][-1]["content"], "x" * 5000)
+        self.assertGreater(policy.tokens_saved, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+
+from commons.tests.helpers import import_time, run_python
+
+HEAVY_MODULES = ("openai", "httpx", "langchain_core")
+
+
+class TestLazyImports(unittest.TestCase):
+    """Test heavy dependencies are imported on first use only."""
+
+    def test_import_does_not_load_dependencies(self):
+        """Importing the package does not import openai, httpx or langchain."""
+        output = run_python(
+            "import sys\n"
+            "from commons.inference import InferenceAPIError, INFERENCE_MAX_TOKENS\n"
+            f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+        )
+
+        self.assertEqual(output, "[]")
+
+    def test_client_loads_openai_but_not_langchain(self):
+        """Building a client imports openai and httpx, not langchain."""
+        output = run_python(
+            "import sys\n"
+            "from commons.inference import InferenceClient\n"
+            "InferenceClient('https://api.example.com', 'key', 'model').close()\n"
+            f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+        )
+
+        self.assertEqual(output, "['openai', 'httpx']")
+
+    def test_client_module_exposes_dependency_names(self):
+        """Dependency names on the client module resolve on first access."""
+        output = run_python(
+            "from commons.inference import client\n"
+            "print(issubclass(client.APITimeoutError, client.APIConnectionError),\n"
+            "      client.httpx.__name__, client.OpenAI.__name__,\n"
+            "      client.ChatCompletionMessage.__name__)"
+        )
+
+        self.assertEqual(output, "True httpx OpenAI ChatCompletionMessage")
+
+    def test_import_time_below_openai(self):
+        """Benchmark: importing commons.inference is cheaper than openai."""
+        package_time = import_time("commons.inference")
+        openai_time = import_time("openai")
+
+        self.assertIsNotNone(package_time)
+        self.assertLess(package_time, openai_time)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,204 @@
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+from openai import APIConnectionError, APIStatusError
+
+from commons.inference import InferenceAPIError, InferenceClient, RateBudget, RetryPolicy
+from commons.inference.retry import parse_retry_after
+from commons.inference.tests.helpers import fake_completion
+
+REQUEST = httpx.Request("POST", "https://api.example.com/chat/completions")
+
+
+def _status_error(status_code, headers=None):
+    """Build an openai APIStatusError for the given status code."""
+    response = httpx.Response(status_code, headers=headers, request=REQUEST)
+    return APIStatusError("error", response=response, body=None)
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """Test retry classification and delays."""
+
+    def test_is_retryable(self):
+        """Retry rate limits, server errors and connection errors only."""
+        policy = RetryPolicy()
+
+        self.assertTrue(policy.is_retryable(_status_error(429)))
+        self.assertTrue(policy.is_retryable(_status_error(503)))
+        self.assertTrue(policy.is_retryable(APIConnectionError(request=REQUEST)))
+        self.assertTrue(policy.is_retryable(ConnectionResetError()))
+        self.assertFalse(policy.is_retryable(_status_error(400)))
+        self.assertFalse(policy.is_retryable(_status_error(401)))
+        self.assertFalse(policy.is_retryable(ValueError("bad input")))
+
+    def test_compute_delay_backoff(self):
+        """Grow delays by the multiplier up to the maximum."""
+        policy = RetryPolicy(delay=2.0, max_delay=10.0, backoff_multiplier=3.0, jitter=False)
+
+        self.assertEqual(
+            [policy.compute_delay(attempt) for attempt in range(3)], [2.0, 6.0, 10.0]
+        )
+
+    def test_compute_delay_jitter(self):
+        """Keep jittered delays between half and all of the backoff delay."""
+        policy = RetryPolicy(delay=4.0, backoff_multiplier=2.0)
+
+        for _ in range(20):
+            self.assertGreaterEqual(policy.compute_delay(1), 4.0)
+            self.assertLessEqual(policy.compute_delay(1), 8.0)
+
+    def test_compute_delay_honors_retry_after(self):
+        """Use the server-requested wait when present."""
+        policy = RetryPolicy(delay=1.0)
+        error = _status_error(429, {"Retry-After": "7"})
+
+        self.assertEqual(policy.compute_delay(0, error), 7.0)
+        self.assertEqual(
+            RetryPolicy(delay=1.0, jitter=False, respect_retry_after=False)
+            .compute_delay(0, error),
+            1.0,
+        )
+
+    def test_compute_delay_caps_retry_after(self):
+        """Cap the server-requested wait at the maximum delay."""
+        policy = RetryPolicy(delay=1.0, max_delay=5.0)
+
+        self.assertEqual(
+            policy.compute_delay(0, _status_error(429, {"Retry-After": "600"})), 5.0
+        )
+
+    def test_parse_retry_after(self):
+        """Parse retry-after-ms, seconds and HTTP dates."""
+        self.assertEqual(parse_retry_after(httpx.Headers({"retry-after-ms": "1500"})), 1.5)
+        self.assertEqual(parse_retry_after(httpx.Headers({"Retry-After": "3"})), 3.0)
+        self.assertEqual(
+            parse_retry_after(
+                httpx.Headers({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+            ),
+            0.0,
+        )
+        self.assertIsNone(parse_retry_after(httpx.Headers({"Retry-After": "soon"})))
+        self.assertIsNone(parse_retry_after(httpx.Headers({})))
+
+
+class TestRateBudget(unittest.TestCase):
+    """Test requests and tokens per minute budgets."""
+
+    @patch("commons.inference.retry.time.monotonic", return_value=0.0)
+    def test_requests_per_minute(self, mock_monotonic):
+        """Allow a minute of requests at once, then wait for refill."""
+        budget = RateBudget(requests_per_minute=2)
+
+        self.assertEqual(budget.reserve(), 0.0)
+        self.assertEqual(budget.reserve(), 0.0)
+        self.assertEqual(budget.reserve(), 30.0)
+
+        mock_monotonic.return_value = 60.0
+        self.assertEqual(budget.reserve(), 0.0)
+
+    @patch("commons.inference.retry.time.monotonic", return_value=0.0)
+    def test_tokens_per_minute(self, mock_monotonic):
+        """Wait until enough tokens have refilled."""
+        budget = RateBudget(tokens_per_minute=600)
+
+        self.assertEqual(budget.reserve(500), 0.0)
+        self.assertEqual(budget.reserve(200), 10.0)
+        self.assertEqual(RateBudget().reserve(10**9), 0.0)
+
+
+class TestClientRetry(unittest.TestCase):
+    """Test retries in InferenceClient.chat."""
+
+    @patch("commons.inference.client.time.sleep")
+    @patch("commons.inference.client.OpenAI")
+    def test_chat_retries_rate_limit(self, mock_openai, mock_sleep):
+        """Retry a 429 after the Retry-After wait."""
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = [
+            _status_error(429, {"Retry-After": "12"}),
+            fake_completion("ok"),
+        ]
+        mock_openai.return_value = mock_client
+
+        client = InferenceClient(
+            base_url="https://api.example.com",
+            api_key="test-key",
+            model="test-model",
+        )
+
+        message = client.chat([{"role": "user", "content": "Hello"}])
+
+        self.assertEqual(message.content, "ok")
+        mock_sleep.assert_called_once_with(12.0)
+        self.assertEqual(mock_openai.call_args.kwargs["max_retries"], 0)
+
+    @patch("commons.inference.client.time.sleep")
+    @patch("commons.inference.client.OpenAI")
+    def test_chat_non_retryable_fails_fast(self, mock_openai, mock_sleep):
+        """Raise immediately on client errors."""
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = _status_error(400)
+        mock_openai.return_value = mock_client
+
+        client = InferenceClient(
+            base_url="https://api.example.com",
+            api_key="test-key",
+            model="test-model",
+        )
+
+        with self.assertRaises(InferenceAPIError):
+            client.chat([{"role": "user", "content": "Hello"}])
+
+        mock_client.chat.completions.create.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @patch("commons.inference.client.time.sleep")
+    @patch("commons.inference.client.OpenAI")
+    def test_chat_gives_up_after_attempts(self, mock_openai, mock_sleep):
+        """Raise InferenceAPIError once all attempts are used."""
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = _status_error(503)
+        mock_openai.return_value = mock_client
+
+        client = InferenceClient(
+            base_url="https://api.example.com",
+            api_key="test-key",
+            model="test-model",
+            retry_policy=RetryPolicy(attempts=3),
+        )
+
+        with self.assertRaises(InferenceAPIError):
+            client.chat([{"role": "user", "content": "Hello"}])
+
+        self.assertEqual(mock_client.chat.completions.create.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+
+class TestAsyncClientRetry(unittest.IsolatedAsyncioTestCase):
+    """Test retries in InferenceClient.achat."""
+
+    @patch("commons.inference.client.asyncio.sleep", new_callable=AsyncMock)
+    @patch("commons.inference.client.AsyncOpenAI")
+    async def test_achat_retries_connection_error(self, mock_async_openai, mock_sleep):
+        """Retry connection errors without blocking the event loop."""
+        mock_client = Mock()
+        mock_client.chat.completions.create = AsyncMock(
+            side_effect=[APIConnectionError(request=REQUEST), fake_completion("ok")]
+        )
+        mock_async_openai.return_value = mock_client
+
+        client = InferenceClient(
+            base_url="https://api.example.com",
+            api_key="test-key",
+            model="test-model",
+        )
+
+        message = await client.achat([{"role": "user", "content": "Hello"}])
+
+        self.assertEqual(message.content, "ok")
+        mock_sleep.assert_awaited_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,209 @@
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+from openai.types.chat import ChatCompletionChunk
+
+from commons.inference import InferenceAPIError, InferenceClient
+
+
+def _chunk(content=None, tool_calls=None, finish_reason=None, usage=None):
+    """Build a streamed chat completion chunk."""
+    choices = []
+    if content is not None or tool_calls is not None or finish_reason:
+        choices.append(
+            {
+                "index": 0,
+                "delta": {"content": content, "tool_calls": tool_calls},
+                "finish_reason": finish_reason,
+            }
+        )
+    return ChatCompletionChunk.model_validate(
+        {
+            "id": "chunk",
+            "object": "chat.completion.chunk",
+            "created": 0,
+            "model": "test-model",
+            "choices": choices,
+            "usage": usage,
+        }
+    )
+
+
+USAGE = {"prompt_tokens": 10, "completion_tokens": 3, "total_tokens": 13}
+
+TOOL_CALL_CHUNKS = [
+    _chunk(
+        tool_calls=[
+            {
+                "index": 0,
+                "id": "call_1",
+                "type": "function",
+                "function": {"name": "get_weather", "arguments": '{"loc'},
+            }
+        ]
+    ),
+    _chunk(
+        tool_calls=[{"index": 0, "function": {"arguments": 'ation": "Paris"}'}}]
+    ),
+    _chunk(finish_reason="tool_calls"),
+    _chunk(usage=USAGE),
+]
+
+
+class _AsyncChunks:
+    """Async iterator standing in for an openai AsyncStream."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self.close = AsyncMock()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._chunks)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+class TestChatStream(unittest.TestCase):
+    """Test synchronous streaming."""
+
+    @patch("commons.inference.client.OpenAI")
+    def test_chat_stream_yields_content_deltas(self, mock_openai):
+        """Yield content deltas and expose the message and usage afterwards."""
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = iter(
+            [
+                _chunk(content="Hel"),
+                _chunk(content="lo"),
+                _chunk(finish_reason="stop"),
+                _chunk(usage=USAGE),
+            ]
+        )
+        mock_openai.return_value = mock_client
+
+        client = InferenceClient(
+            base_url="https://api.example.com",
+            api_key="test-key",
+            model="test-model",
+        )
+
+        stream = client.chat_stream([{"role": "user", "content": "Hello"}])
+
+        self.assertEqual(list(stream), ["Hel", "lo"])
+        self.assertEqual(stream.message.content, "Hello")
+        self.assertIsNone(stream.message.tool_calls)
+        self.assertEqual(stream.usage.total_tokens, 13)
+        self.assertEqual(stream.finish_reason, "stop")
+        self.assertGreaterEqual(stream.time_to_first_token, 0)
+
+        call_kwargs = mock_client.chat.completions.create.call_args.kwargs
+        self.assertTrue(call_kwargs["stream"])
+        self.assertEqual(call_kwargs["stream_options"], {"include_usage": True})
+
+    @patch("commons.inference.client.OpenAI")
+    def test_chat_stream_rebuilds_tool_calls(self, mock_openai):
+        """Reassemble tool call deltas into complete tool calls."""
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = iter(TOOL_CALL_CHUNKS)
+        mock_openai.return_value = mock_client
+
+        client = InferenceClient(
+            base_url="https://api.example.com",
+            api_key="test-key",
+            model="test-model",
+        )
+
+        stream = client.chat_stream([{"role": "user", "content": "Weather?"}])
+
+        self.assertEqual(list(stream), [])
+        tool_call = stream.message.tool_calls[0]
+        self.assertEqual(tool_call.id, "call_1")
+        self.assertEqual(tool_call.function.name, "get_weather")
+        self.assertEqual(tool_call.function.arguments, '{"location": "Paris"}')
+
+    @patch("commons.inference.client.OpenAI")
+    def test_chat_stream_error_mid_stream(self, mock_openai):
+        """Wrap errors raised while reading the stream in InferenceAPIError."""
+
+        def broken_stream():
+            yield _chunk(content="partial")
+            raise ConnectionResetError("reset by peer")
+
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = broken_stream()
+        mock_openai.return_value = mock_client
+
+        client = InferenceClient(
+            base_url="https://api.example.com",
+            api_key="test-key",
+            model="test-model",
+        )
+
+        with self.assertRaises(InferenceAPIError):
+            list(client.chat_stream([{"role": "user", "content": "Hello"}]))
+
+
+class TestAsyncChatStream(unittest.IsolatedAsyncioTestCase):
+    """Test asynchronous streaming."""
+
+    @patch("commons.inference.client.AsyncOpenAI")
+    async def test_achat_stream(self, mock_async_openai):
+        """Stream content deltas with async for."""
+        mock_client = Mock()
+        mock_client.chat.completions.create = AsyncMock(
+            return_value=_AsyncChunks([_chunk(content="Hi"), _chunk(content="!")])
+        )
+        mock_async_openai.return_value = mock_client
+
+        client = InferenceClient(
+            base_url="https://api.example.com",
+            api_key="test-key",
+            model="test-model",
+        )
+
+        stream = await client.achat_stream([{"role": "user", "content": "Hello"}])
+        deltas = [delta async for delta in stream]
+
+        self.assertEqual(deltas, ["Hi", "!"])
+        self.assertEqual(stream.message.content, "Hi!")
+
+    @patch("commons.inference.client.AsyncOpenAI")
+    async def test_agentic_loop_streams_with_on_delta(self, mock_async_openai):
+        """Stream every turn of the agentic loop when on_delta is given."""
+        mock_client = Mock()
+        mock_client.chat.completions.create = AsyncMock(
+            side_effect=[
+                _AsyncChunks(TOOL_CALL_CHUNKS),
+                _AsyncChunks([_chunk(content="Sunny"), _chunk(content=" in Paris")]),
+            ]
+        )
+        mock_async_openai.return_value = mock_client
+
+        client = InferenceClient(
+            base_url="https://api.example.com",
+            api_key="test-key",
+            model="test-model",
+        )
+
+        async def mock_executor(name, args):
+            return f"{name}: {args['location']} is sunny"
+
+        deltas = []
+        result = await client.chat_with_tools_async(
+            messages=[{"role": "user", "content": "Weather?"}],
+            tools=[],
+            execute_tool_func=mock_executor,
+            on_delta=deltas.append,
+        )
+
+        self.assertEqual(result, "Sunny in Paris")
+        self.assertEqual(deltas, ["Sunny", " in Paris"])
+        sent = mock_client.chat.completions.create.call_args.kwargs["messages"]
+        self.assertEqual(sent[-1]["content"], "get_weather: Paris is sunny")
+
+
+if __name__ == "__main__":
+    unittest.main()
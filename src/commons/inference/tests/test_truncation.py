@@ -0,0 +1,99 @@
+import json
+import os
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+from commons.inference.client import _execute_tool_call
+from commons.inference.truncation import preview, truncate_output, truncate_text
+
+
+class TestTruncation(unittest.TestCase):
+    """Test tool output size limits."""
+
+    def test_truncate_text_keeps_head_and_tail(self):
+        """Keep the start and end of long text."""
+        text = "start " + "x" * 1000 + " end"
+
+        result = truncate_text(text, 90)
+
+        self.assertTrue(result.startswith("start "))
+        self.assertTrue(result.endswith(" end"))
+        self.assertIn("[920 chars omitted]", result)
+        self.assertEqual(truncate_text("short", 90), "short")
+
+    def test_truncate_text_limits(self):
+        """Treat None as no limit, 0 as marker only and reject negatives."""
+        text = "x" * 100
+
+        self.assertEqual(truncate_text(text, None), text)
+        self.assertEqual(truncate_text(text, 0), "\n... [100 chars omitted] ...\n")
+        self.assertEqual(truncate_output(text, None), text)
+        with self.assertRaises(ValueError):
+            truncate_text(text, -1)
+        with self.assertRaises(ValueError):
+            truncate_output(text, -1)
+
+    def test_truncate_json_stays_valid(self):
+        """Shrink JSON into smaller valid JSON keeping its structure."""
+        hits = [{"id": index, "message": "error " * 50} for index in range(1000)]
+        text = json.dumps({"total": 1000, "hits": hits})
+
+        result = truncate_output(text, 2000)
+
+        self.assertLessEqual(len(result), 2000)
+        data = json.loads(result)
+        self.assertEqual(data["total"], 1000)
+        self.assertEqual(data["hits"][0]["id"], 0)
+        self.assertIn("more items omitted", data["hits"][-1])
+
+    def test_truncate_invalid_json_falls_back(self):
+        """Fall back to head and tail for text that only looks like JSON."""
+        text = "[" + "y" * 5000
+
+        result = truncate_output(text, 300)
+
+        self.assertIn("chars omitted", result)
+        self.assertTrue(result.startswith("[yyy"))
+
+    def test_preview(self):
+        """Shorten long text for logs."""
+        self.assertEqual(preview("a" * 2000, 10), "aaaaaaaaaa... (2000 chars)")
+        self.assertEqual(preview("short"), "short")
+
+
+class TestExecuteToolCallLimits(unittest.IsolatedAsyncioTestCase):
+    """Test output caps in _execute_tool_call."""
+
+    async def test_caps_and_spills_large_output(self):
+        """Truncate large results and save the full output to a file."""
+        tool = Mock()
+        tool.ainvoke = AsyncMock(return_value="line\n" * 100_000)
+
+        result = await _execute_tool_call(
+            "search_logs",
+            {},
+            {"search_logs": tool},
+            max_output_chars=1000,
+            spill_tool_outputs=True,
+        )
+
+        self.assertLess(len(result), 1200)
+        path = result.rsplit("saved to ", 1)[1].rstrip("]")
+        self.addCleanup(os.remove, path)
+        with open(path, encoding="utf-8") as f:
+            self.assertEqual(len(f.read()), 500_000)
+
+    async def test_small_output_unchanged(self):
+        """Return results within the cap as they are."""
+        tool = Mock()
+        tool.ainvoke = AsyncMock(return_value={"status": "ok"})
+
+        result = await _execute_tool_call(
+            "get_status", {}, {"get_status": tool}, max_output_chars=1000
+        )
+
+        self.assertEqual(result, "{'status': 'ok'}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""Size limits for tool outputs and log previews."""
+
+import json
+import os
+import tempfile
+from typing import Any, Optional
+
+_MIN_STRING_CHARS = 32
+
+
+def _fits(text: str, max_chars: Optional[int]) -> bool:
+    """Return whether a text fits in ``max_chars`` (None for no limit)."""
+    if max_chars is None:
+        return True
+    if max_chars < 0:
+        raise ValueError(f"Character limit must be None or non-negative, got {max_chars}")
+    return len(text) <= max_chars
+
+
+def truncate_text(text: str, max_chars: Optional[int]) -> str:
+    """
+    Keep the head and tail of a text, marking how much was omitted.
+
+    ``max_chars`` of None keeps the whole text; 0 leaves only the marker.
+    """
+    if _fits(text, max_chars):
+        return text
+    head = max_chars * 2 // 3
+    tail = max_chars - head
+    omitted = len(text) - head - tail
+    return f"{text[:head]}\n... [{omitted} chars omitted] ...\n{text[len(text) - tail:]}"
+
+
+def truncate_output(text: str, max_chars: Optional[int]) -> str:
+    """
+    Limit a tool output to about ``max_chars`` characters.
+
+    JSON outputs are shrunk into smaller valid JSON by shortening long lists
+    and strings, so the model still sees the structure. Anything else, or
+    JSON that cannot be shrunk enough, keeps its head and tail. None means
+    no limit.
+    """
+    if _fits(text, max_chars):
+        return text
+    stripped = text.lstrip()
+    if stripped[:1] in ("{", "["):
+        try:
+            shrunk = _truncate_json(json.loads(stripped), max_chars)
+        except ValueError:
+            shrunk = None
+        if shrunk is not None:
+            return shrunk
+    return truncate_text(text, max_chars)
+
+
+def limit_tool_output(
+    tool_name: str, text: str, max_chars: Optional[int], spill: bool = False
+) -> str:
+    """
+    Truncate a tool output to about ``max_chars`` characters.
+
+    With ``spill`` the full output is written to a temporary file and a
+    reference to it is appended to the truncated output.
+    """
+    limited = truncate_output(text, max_chars)
+    if spill:
+        path = spill_to_file(text, tool_name)
+        limited += f"\n[Full output ({len(text)} chars) saved to {path}]"
+    return limited
+
+
+def spill_to_file(text: str, tool_name: str) -> str:
+    """Write a full tool output to a new temporary file and return its path."""
+    fd, path = tempfile.mkstemp(prefix=f"{tool_name}-", suffix=".txt")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(text)
+    return path
+
+
+def preview(text: str, limit: Optional[int] = 500) -> str:
+    """Shorten a text for logging (None for no limit)."""
+    if _fits(text, limit):
+        return text
+    return f"{text[:limit]}... ({len(text)} chars)"
+
+
+def _truncate_json(value: Any, max_chars: int) -> Optional[str]:
+    max_items = max_chars
+    max_string = max_chars
+    while True:
+        text = json.dumps(
+            _shrink_json(value, max_items, max_string), ensure_ascii=False, default=str
+        )
+        if len(text) <= max_chars:
+            return text
+        if max_items == 1 and max_string == _MIN_STRING_CHARS:
+            return None
+        max_items = max(1, max_items // 2)
+        max_string = max(_MIN_STRING_CHARS, max_string // 2)
+
+
+def _shrink_json(value: Any, max_items: int, max_string: int) -> Any:
+    if isinstance(value, str):
+        return truncate_text(value, max_string)
+    if isinstance(value, list):
+        items = [_shrink_json(item, max_items, max_string) for item in value[:max_items]]
+        if len(value) > max_items:
+            items.append(f"... {len(value) - max_items} more items omitted")
+        return items
+    if isinstance(value, dict):
+        return {
+            key: _shrink_json(item, max_items, max_string) for key, item in value.items()
+        }
+    return value
@@ -7,5 +7,30 @@ Atlassian Cloud and on-premise instances.
 
 from commons.jira.client import JiraClient
 from commons.jira.exceptions import JiraAuthError, JiraQueryError, JiraUpdateError
+from commons.jira.records import IssueRecord
+from commons.jira.retry import RetryPolicy, TokenBucket
+from commons.jira.store import IssueStore
+from commons.utils import lazy_import
 
-__all__ = ["JiraClient", "JiraAuthError", "JiraQueryError", "JiraUpdateError"]
+__all__ = [
+    "AsyncJiraClient",  # pylint: disable=undefined-all-variable
+    "IssueRecord",
+    "IssueStore",
+    "JiraClient",
+    "JiraAuthError",
+    "JiraQueryError",
+    "JiraUpdateError",
+    "RetryPolicy",
+    "TokenBucket",
+]
+
+
+# AsyncJiraClient (and httpx behind it) is only imported when it is used
+_LAZY_IMPORTS = {
+    "AsyncJiraClient": ("commons.jira.async_client", "AsyncJiraClient"),
+}
+
+
+def __getattr__(name):
+    """Resolve lazily imported names (PEP 562)"""
+    return lazy_import(globals(), _LAZY_IMPORTS, name)
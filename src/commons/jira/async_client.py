@@ -0,0 +1,548 @@
+"""Asynchronous JIRA client for interacting with JIRA issues
+
+Talks to the JIRA REST API directly over a pooled ``httpx.AsyncClient`` so that
+many issue operations can run concurrently on one event loop. Retries back off
+with ``asyncio.sleep`` and never block the loop.
+"""
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Union
+
+import httpx
+
+from .utils import (
+    FieldIndex,
+    build_issue_fields,
+    find_transition,
+    label_operations,
+    project_jql,
+    transition_not_found,
+)
+from .exceptions import JiraAuthError, JiraQueryError, JiraUpdateError
+from .retry import RetryPolicy, TokenBucket, policy_attribute
+
+logger = logging.getLogger(__name__)
+
+IssueRef = Union[str, Dict[str, Any], Any]
+
+
+def _issue_key(issue: IssueRef) -> str:
+    """Return the key of an issue given as a key, raw JSON dict or Issue object
+
+    Args:
+        issue: Issue key, raw issue JSON or object with a ``key`` attribute
+
+    Returns:
+        Issue key
+    """
+    if isinstance(issue, str):
+        return issue
+    if isinstance(issue, dict):
+        return issue["key"]
+    return issue.key
+
+
+class AsyncJiraClient:
+    """Asyncio client for JIRA operations with non-blocking retry logic
+
+    Issues are returned as raw JSON dictionaries. Methods that act on an issue
+    accept an issue key, a raw issue dictionary or a ``jira.resources.Issue``.
+    """
+
+    max_retries = policy_attribute(
+        "max_retries", "Maximum attempts per operation (stored on retry_policy)"
+    )
+    retry_delay = policy_attribute(
+        "base_delay", "Minimum delay in seconds between retries (stored on retry_policy)"
+    )
+
+    def __init__(
+        self,
+        server: str,
+        email: Optional[str] = None,
+        api_token: Optional[str] = None,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        max_retries: int = 3,
+        retry_delay: int = 2,
+        max_connections: int = 100,
+        timeout: float = 30.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        field_cache_ttl: float = 3600,
+    ):
+        """Initialize asynchronous JIRA client
+
+        Args:
+            server: JIRA server URL
+            email: JIRA email (for Atlassian Cloud token auth)
+            api_token: JIRA API token (for Atlassian Cloud)
+            username: JIRA username (for on-premise basic auth)
+            password: JIRA password (for on-premise basic auth)
+            max_retries: Maximum number of retry attempts for failed operations
+            retry_delay: Delay in seconds between retries
+            max_connections: Size of the HTTP connection pool
+            timeout: Request timeout in seconds
+            transport: Optional httpx transport (e.g., for testing or proxies)
+            retry_policy: Retry policy (default: built from max_retries and retry_delay)
+            rate_limiter: Token bucket shared by every request of this client
+            field_cache_ttl: Seconds before the cached field name index is rebuilt
+
+        Raises:
+            JiraAuthError: If credentials are missing or invalid
+        """
+        self.server = server.rstrip("/")
+        self.retry_policy = retry_policy or RetryPolicy(
+            max_retries=max_retries, base_delay=retry_delay
+        )
+        self.rate_limiter = rate_limiter
+        self.field_cache_ttl = field_cache_ttl
+        self._field_index = FieldIndex(asyncio.Lock())
+        self.is_cloud = "atlassian.net" in server.lower()
+
+        auth = None
+        headers = {"Accept": "application/json"}
+        if self.is_cloud:
+            # Atlassian Cloud requires email + API token
+            if not (email and api_token):
+                raise JiraAuthError(
+                    "Atlassian Cloud requires both 'email' and 'api_token'. "
+                    "Generate an API token at: https://id.atlassian.com/manage/api-tokens"
+                )
+            auth = httpx.BasicAuth(email, api_token)
+        elif email and api_token:
+            auth = httpx.BasicAuth(email, api_token)
+        elif api_token:
+            headers["Authorization"] = f"Bearer {api_token}"
+        elif username and password:
+            auth = httpx.BasicAuth(username, password)
+        else:
+            raise JiraAuthError(
+                "Must provide one of: (email, api_token), api_token alone, "
+                "or (username, password)"
+            )
+
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        )
+        self._http = httpx.AsyncClient(
+            base_url=f"{self.server}/rest/api/2/",
+            auth=auth,
+            headers=headers,
+            timeout=timeout,
+            limits=limits,
+            transport=transport,
+        )
+        logger.debug("Initialized AsyncJiraClient: %s", self.server)
+
+    async def aclose(self):
+        """Close the underlying HTTP connection pool."""
+        await self._http.aclose()
+
+    async def __aenter__(self) -> "AsyncJiraClient":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit - close the client."""
+        await self.aclose()
+
+    async def _request(self, method: str, path: str, **kwargs) -> Any:
+        """Send a single REST request and decode the JSON response
+
+        Args:
+            method: HTTP method
+            path: Path relative to the REST API base
+            **kwargs: Extra arguments for ``httpx.AsyncClient.request``
+
+        Returns:
+            Decoded JSON body, or None for empty responses
+
+        Raises:
+            httpx.HTTPStatusError: If the server returns an error status
+            httpx.TransportError: If the request cannot be sent
+        """
+        response = await self._http.request(method, path, **kwargs)
+        response.raise_for_status()
+        return response.json() if response.content else None
+
+    async def _retry_operation(self, operation, *args, **kwargs):
+        """Retry a coroutine function according to the client's retry policy
+
+        Args:
+            operation: Coroutine function to retry
+            *args: Positional arguments for operation
+            **kwargs: Keyword arguments for operation
+
+        Returns:
+            Result of operation
+
+        Raises:
+            Last exception encountered if all retries fail
+        """
+        attempt = 0
+        delay = 0.0
+        while True:
+            if self.rate_limiter and (wait := self.rate_limiter.reserve()) > 0:
+                await asyncio.sleep(wait)
+            try:
+                return await operation(*args, **kwargs)
+            except httpx.HTTPError as e:
+                delay = self.retry_policy.next_delay(
+                    attempt, delay, e, self.rate_limiter
+                )
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+            attempt += 1
+
+    async def query_issues(
+        self, jql: str, max_results: int = 100, fields: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Query JIRA issues using JQL with retry logic
+
+        The server caps each response at its own page size, so pages are
+        requested until max_results issues are collected or the results run
+        out. Atlassian Cloud is paged with ``nextPageToken`` and on-premise
+        instances with ``startAt``; each page is retried independently.
+
+        Args:
+            jql: JQL query string
+            max_results: Maximum number of results to return
+            fields: Comma-separated list of fields to retrieve (None = all fields)
+
+        Returns:
+            List of raw issue dictionaries
+
+        Raises:
+            JiraQueryError: If query fails after retries
+        """
+        logger.info("Querying JIRA with JQL: %s", jql)
+
+        # Atlassian Cloud removed /search in favour of the token-paged /search/jql
+        path = "search/jql" if self.is_cloud else "search"
+        issues: List[Dict[str, Any]] = []
+        next_page_token = None
+        try:
+            while len(issues) < max_results:
+                params = {
+                    "jql": jql,
+                    "maxResults": max_results - len(issues),
+                    "fields": fields or "*all",
+                }
+                if self.is_cloud:
+                    if next_page_token:
+                        params["nextPageToken"] = next_page_token
+                else:
+                    params["startAt"] = len(issues)
+                result = await self._retry_operation(
+                    self._request, "GET", path, params=params
+                )
+                page = result.get("issues", [])
+                issues.extend(page[:max_results - len(issues)])
+
+                if self.is_cloud:
+                    next_page_token = result.get("nextPageToken")
+                    if not next_page_token or result.get("isLast"):
+                        break
+                else:
+                    total = result.get("total")
+                    if total is None:
+                        # Without a total, only a short page marks the end
+                        if len(page) < params["maxResults"]:
+                            break
+                    elif not page or params["startAt"] + len(page) >= total:
+                        break
+            logger.info("Found %d issues", len(issues))
+            return issues
+        except Exception as e:
+            raise JiraQueryError(f"Failed to query JIRA: {e}") from e
+
+    async def query_custom(
+        self, jql: str, max_results: int = 100
+    ) -> List[Dict[str, Any]]:
+        """Query JIRA issues using custom JQL (alias for query_issues)
+
+        Args:
+            jql: JQL query string
+            max_results: Maximum number of results to return
+
+        Returns:
+            List of raw issue dictionaries
+        """
+        return await self.query_issues(jql, max_results)
+
+    async def get_issues_by_status(
+        self, project: str, status: str, component: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Get issues by project and status
+
+        Args:
+            project: JIRA project key
+            status: Issue status
+            component: Optional component filter
+
+        Returns:
+            List of raw issue dictionaries
+        """
+        return await self.query_issues(
+            project_jql(project, "status", status, component)
+        )
+
+    async def get_issues_by_label(
+        self, project: str, label: str, component: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Get issues by project and label
+
+        Args:
+            project: JIRA project key
+            label: Issue label
+            component: Optional component filter
+
+        Returns:
+            List of raw issue dictionaries
+        """
+        return await self.query_issues(
+            project_jql(project, "labels", label, component)
+        )
+
+    async def get_field_value(
+        self, issue: Union[Dict[str, Any], Any], field_name: str
+    ) -> Optional[Any]:
+        """Get field value from issue (built-in or custom fields)
+
+        Args:
+            issue: Raw issue dictionary or Issue object
+            field_name: Field name (e.g., 'description', 'summary', or custom field name)
+
+        Returns:
+            Raw JSON field value or None if not found
+        """
+        fields = (issue if isinstance(issue, dict) else issue.raw).get("fields") or {}
+
+        # Handle built-in fields
+        field_name_lower = field_name.lower()
+        if field_name_lower in ("description", "summary"):
+            return fields.get(field_name_lower)
+        if field_name_lower in ("status", "assignee"):
+            value = fields.get(field_name_lower)
+            attribute = "name" if field_name_lower == "status" else "displayName"
+            return value.get(attribute) if isinstance(value, dict) else None
+
+        # Handle custom fields - resolve name through the cached index
+        field_id = (await self.resolve_field_ids([field_name]))[field_name]
+        if field_id:
+            return fields.get(field_id)
+
+        logger.warning(
+            "Field '%s' not found in issue %s", field_name, _issue_key(issue)
+        )
+        return None
+
+    async def resolve_field_ids(
+        self, field_names: List[str], refresh: bool = False
+    ) -> Dict[str, Optional[str]]:
+        """Resolve field names to field IDs using the cached field index
+
+        Names are matched case-insensitively. Field IDs (e.g. 'customfield_12345')
+        resolve to themselves.
+
+        Args:
+            field_names: Field names to resolve
+            refresh: Rebuild the field index before resolving
+
+        Returns:
+            Dictionary mapping each requested name to its field ID, or None if unknown
+
+        Raises:
+            JiraQueryError: If the field catalog cannot be fetched
+        """
+        field_ids = await self._get_field_index(refresh=refresh)
+        return {name: field_ids.get(name.lower()) for name in field_names}
+
+    async def _get_field_index(self, refresh: bool = False) -> Dict[str, str]:
+        """Return the lowercase field name/ID to field ID index, building it if stale
+
+        Args:
+            refresh: Rebuild the index even if it has not expired
+
+        Returns:
+            Dictionary mapping lowercase field names and IDs to field IDs
+
+        Raises:
+            JiraQueryError: If the field catalog cannot be fetched
+        """
+        index = self._field_index
+        async with index.lock:
+            if index.is_stale(self.field_cache_ttl, refresh):
+                try:
+                    index.load(await self._retry_operation(self._request, "GET", "field"))
+                except Exception as e:
+                    raise JiraQueryError(f"Failed to fetch JIRA fields: {e}") from e
+            return index.ids
+
+    async def add_label(self, issue: IssueRef, label: str):
+        """Add label to issue with retry logic
+
+        Args:
+            issue: Issue key, raw issue dictionary or Issue object
+            label: Label to add
+
+        Raises:
+            JiraUpdateError: If update fails after retries
+        """
+        await self.update_labels(issue, add=[label])
+
+    async def remove_label(self, issue: IssueRef, label: str):
+        """Remove label from issue
+
+        Args:
+            issue: Issue key, raw issue dictionary or Issue object
+            label: Label to remove
+
+        Raises:
+            JiraUpdateError: If update fails after retries
+        """
+        await self.update_labels(issue, remove=[label])
+
+    async def update_labels(
+        self,
+        issue: IssueRef,
+        add: Optional[List[str]] = None,
+        remove: Optional[List[str]] = None,
+    ):
+        """Add and remove several labels in a single update request
+
+        Args:
+            issue: Issue key, raw issue dictionary or Issue object
+            add: Labels to add
+            remove: Labels to remove
+
+        Raises:
+            JiraUpdateError: If update fails after retries
+        """
+        operations = label_operations(add, remove)
+        if not operations:
+            return
+
+        key = _issue_key(issue)
+        try:
+            await self._retry_operation(
+                self._request, "PUT", f"issue/{key}",
+                json={"update": {"labels": operations}},
+            )
+            logger.info(
+                "Updated labels on %s (added: %s, removed: %s)",
+                key, add or [], remove or []
+            )
+        except Exception as e:
+            raise JiraUpdateError(f"Failed to update labels on {key}: {e}") from e
+
+    async def get_available_transitions(
+        self, issue: IssueRef
+    ) -> List[Dict[str, Any]]:
+        """Get available transitions for an issue
+
+        Args:
+            issue: Issue key, raw issue dictionary or Issue object
+
+        Returns:
+            List of transition dictionaries with 'id' and 'name' keys
+
+        Raises:
+            JiraUpdateError: If fetching transitions fails
+        """
+        key = _issue_key(issue)
+        try:
+            result = await self._retry_operation(
+                self._request, "GET", f"issue/{key}/transitions"
+            )
+            return result.get("transitions", [])
+        except Exception as e:
+            raise JiraUpdateError(f"Failed to get transitions for {key}: {e}") from e
+
+    async def transition_issue(self, issue: IssueRef, transition_name: str):
+        """Transition issue to new status
+
+        Args:
+            issue: Issue key, raw issue dictionary or Issue object
+            transition_name: Name of transition (e.g., 'Done', 'In Progress')
+
+        Raises:
+            JiraUpdateError: If transition fails or is not found
+        """
+        key = _issue_key(issue)
+        transitions = await self.get_available_transitions(key)
+        transition = find_transition(transitions, transition_name)
+        if not transition:
+            raise transition_not_found(key, transition_name, transitions)
+
+        try:
+            await self._retry_operation(
+                self._request, "POST", f"issue/{key}/transitions",
+                json={"transition": {"id": transition["id"]}},
+            )
+            logger.info("Transitioned %s to '%s'", key, transition_name)
+        except Exception as e:
+            raise JiraUpdateError(f"Failed to transition {key}: {e}") from e
+
+    async def add_comment(self, issue: IssueRef, comment: str):
+        """Add comment to issue
+
+        Args:
+            issue: Issue key, raw issue dictionary or Issue object
+            comment: Comment text
+
+        Raises:
+            JiraUpdateError: If comment fails to add
+        """
+        key = _issue_key(issue)
+        try:
+            await self._retry_operation(
+                self._request, "POST", f"issue/{key}/comment", json={"body": comment}
+            )
+            logger.info("Added comment to %s", key)
+        except Exception as e:
+            raise JiraUpdateError(f"Failed to add comment to {key}: {e}") from e
+
+    async def create_issue(
+        self,
+        project: str,
+        summary: str,
+        description: str,
+        issue_type: str = "Bug",
+        component: Optional[str] = None,
+        labels: Optional[List[str]] = None,
+        **extra_fields
+    ) -> Dict[str, Any]:
+        """Create a new JIRA issue
+
+        Args:
+            project: JIRA project key
+            summary: Issue summary/title
+            description: Issue description
+            issue_type: Issue type (e.g., 'Bug', 'Task', 'Story')
+            component: Optional component name
+            labels: Optional list of labels
+            **extra_fields: Additional fields to set
+
+        Returns:
+            Dictionary with the 'id', 'key' and 'self' of the created issue
+
+        Raises:
+            JiraUpdateError: If issue creation fails
+        """
+        try:
+            fields = build_issue_fields(
+                project, summary, description, issue_type, component, labels,
+                **extra_fields
+            )
+            issue = await self._retry_operation(
+                self._request, "POST", "issue", json={"fields": fields}
+            )
+            logger.info("Created issue %s: %s", issue["key"], summary)
+            return issue
+        except Exception as e:
+            raise JiraUpdateError(f"Failed to create issue: {e}") from e
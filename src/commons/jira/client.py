@@ -3,30 +3,153 @@
 Unified client supporting both Atlassian Cloud and on-premise JIRA instances.
 Includes retry logic, error handling, and common query patterns.
 """
+# pylint: disable=too-many-lines
 
+from __future__ import annotations
+
+import importlib.util
+import json
 import logging
+import re
+import threading
 import time
-from typing import List, Optional, Dict, Any
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta, timezone, tzinfo
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 from urllib.parse import urlencode
+from zoneinfo import ZoneInfo
 
-try:
+if TYPE_CHECKING:
     from jira import JIRA
     from jira.resources import Issue
-    from jira.exceptions import JIRAError
-    JIRA_AVAILABLE = True
-except ImportError:
-    JIRA_AVAILABLE = False
-    JIRA = None
-    Issue = None
-    JIRAError = Exception
+
+from commons.utils import lazy_import
 
 from .exceptions import JiraAuthError, JiraQueryError, JiraUpdateError
+from .records import IssueRecord
+from .retry import RetryPolicy, TokenBucket, policy_attribute
+from .store import IssueStore
+from .utils import (
+    FieldIndex,
+    build_issue_fields,
+    columns_to_output,
+    find_transition,
+    flatten_field_value,
+    label_operations,
+    parse_jira_datetime,
+    project_jql,
+    transition_not_found,
+)
+
+# The jira library (and requests, oauthlib, defusedxml behind it) is imported
+# when the first JiraClient is built, so importing this module stays cheap for
+# tools that never connect.
+JIRA_AVAILABLE = importlib.util.find_spec("jira") is not None
+
+_LAZY_IMPORTS = {
+    "Issue": ("jira.resources", "Issue"),
+    "JIRA": ("jira", "JIRA"),
+    "JIRAError": ("jira.exceptions", "JIRAError"),
+    "requests": ("requests", None),
+}
 
 logger = logging.getLogger(__name__)
 
+# Issue objects whose post-transition status is remembered (oldest dropped first)
+_MAX_TRANSITIONED_ISSUES = 10000
+
+_ORDER_BY = re.compile(r"\s+ORDER\s+BY\s+", re.IGNORECASE)
+
+
+def _lazy(name: str) -> Any:
+    """Return JIRA, JIRAError or Issue, importing the jira library on first use
+
+    Args:
+        name: Lazily imported name
+
+    Returns:
+        The value bound on this module, which may be a test double
+    """
+    return lazy_import(globals(), _LAZY_IMPORTS, name)
+
+
+# PEP 562: resolve the lazily imported names as module attributes
+__getattr__ = _lazy
+
+
+def _records_from_json(result: Dict[str, Any]) -> List[IssueRecord]:
+    """Convert a raw search response into a page of IssueRecords
+
+    Args:
+        result: JSON returned by the search endpoint
+
+    Returns:
+        ResultList of IssueRecords carrying the page's total and cursor
+    """
+    from jira.client import ResultList  # pylint: disable=import-outside-toplevel
+
+    return ResultList(
+        [IssueRecord.from_raw(raw) for raw in result.get("issues", [])],
+        _startAt=result.get("startAt", 0),
+        _maxResults=result.get("maxResults", 0),
+        _total=result.get("total"),
+        _isLast=result.get("isLast"),
+        _nextPageToken=result.get("nextPageToken"),
+    )
+
+
+def _field_value(
+    issue: Union[Issue, IssueRecord], field_id: str, attribute: Optional[str] = None
+) -> Any:
+    """Read a field of a JIRA issue or an IssueRecord
+
+    Args:
+        issue: JIRA issue or IssueRecord
+        field_id: Field ID (e.g., 'summary', 'customfield_12345')
+        attribute: Attribute of the field value to return (e.g., 'name')
+
+    Returns:
+        Field value (raw JSON for records), or None if missing
+    """
+    if isinstance(issue, IssueRecord):
+        value = issue.get(field_id)
+        if attribute:
+            return value.get(attribute) if isinstance(value, dict) else None
+        return value
+    value = getattr(issue.fields, field_id, None)
+    return getattr(value, attribute, None) if attribute else value
+
 
-class JiraClient:
-    """Client for JIRA operations with retry logic and error handling"""
+def _issue_ref(issue: Union[Issue, IssueRecord]) -> Union[Issue, str]:
+    """Return what to pass to jira library calls that accept an issue or its key
+
+    Args:
+        issue: JIRA issue or IssueRecord
+
+    Returns:
+        The issue key for records, the issue itself otherwise
+    """
+    return issue.key if isinstance(issue, IssueRecord) else issue
+
+
+class JiraClient:  # pylint: disable=too-many-instance-attributes,too-many-public-methods
+    """Client for JIRA operations with retry logic and error handling
+
+    A single JiraClient may be shared by many threads. The field and transition
+    caches are lock-protected, and requests go through one pooled HTTP session;
+    set pool_size to at least the number of threads sharing the client so they
+    reuse kept-alive connections instead of reconnecting.
+    """
+
+    max_retries = policy_attribute(
+        "max_retries", "Maximum attempts per operation (stored on retry_policy)"
+    )
+    retry_delay = policy_attribute(
+        "base_delay", "Minimum delay in seconds between retries (stored on retry_policy)"
+    )
 
     def __init__(
         self,
@@ -37,6 +160,16 @@ class JiraClient:
         password: Optional[str] = None,
         max_retries: int = 3,
         retry_delay: int = 2,
+        field_cache_ttl: float = 3600,
+        transition_cache_ttl: float = 3600,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        default_fields: Optional[str] = None,
+        pool_size: Optional[int] = None,
+        timeout: Optional[Union[float, Tuple[float, float]]] = None,
+        proxies: Optional[Dict[str, str]] = None,
+        adapter_retries: Union[int, Any] = 0,
+        configure_session: Optional[Callable[[Any], None]] = None,
     ):
         """Initialize JIRA client
 
@@ -48,6 +181,19 @@ class JiraClient:
             password: JIRA password (for on-premise basic auth)
             max_retries: Maximum number of retry attempts for failed operations
             retry_delay: Delay in seconds between retries
+            field_cache_ttl: Seconds before the cached field name index is rebuilt
+            transition_cache_ttl: Seconds a cached transition lookup stays valid
+            retry_policy: Retry policy (default: built from max_retries and retry_delay)
+            rate_limiter: Token bucket shared by every request of this client
+            default_fields: Fields to retrieve when a query does not specify any
+                (None = all fields)
+            pool_size: Maximum kept-alive connections per host (requests default: 10)
+            timeout: Request timeout in seconds, or a (connect, read) tuple
+            proxies: Proxy URLs keyed by scheme, as accepted by requests
+            adapter_retries: urllib3 retries (int or urllib3 Retry) for the HTTP
+                adapter when pool_size is set; 0 leaves retrying to retry_policy
+            configure_session: Hook called with the underlying requests session
+                after it is created (e.g., to mount adapters or set certificates)
 
         Raises:
             ImportError: If jira library is not installed
@@ -59,18 +205,71 @@ class JiraClient:
             )
 
         self.server = server
-        self.max_retries = max_retries
-        self.retry_delay = retry_delay
+        self.retry_policy = retry_policy or RetryPolicy(
+            max_retries=max_retries, base_delay=retry_delay
+        )
+        self.rate_limiter = rate_limiter
+        self.default_fields = default_fields
+        self.field_cache_ttl = field_cache_ttl
+
+        self._field_index = FieldIndex(threading.Lock())
+
+        self.transition_cache_ttl = transition_cache_ttl
+        self._transitions: Dict[tuple, tuple] = {}
+        self._transitioned: Dict[int, tuple] = {}
+        self._transitions_lock = threading.Lock()
+
+        self._user_timezone: Optional[tzinfo] = None
 
         # Detect if this is Atlassian Cloud or on-premise
-        is_cloud = "atlassian.net" in server.lower()
+        self.is_cloud = "atlassian.net" in server.lower()
+
+        # The jira library's ResilientSession retries 429/503 with time.sleep
+        # before retry_policy sees the error; leave every retry to retry_policy
+        session_options: Dict[str, Any] = {"max_retries": 0}
+        if timeout is not None:
+            session_options["timeout"] = timeout
+        if proxies:
+            session_options["proxies"] = proxies
+        self.jira = self._connect(email, api_token, username, password, session_options)
+        self._configure_session(pool_size, adapter_retries, configure_session)
+
+    def _connect(
+        self,
+        email: Optional[str],
+        api_token: Optional[str],
+        username: Optional[str],
+        password: Optional[str],
+        session_options: Dict[str, Any],
+    ) -> JIRA:
+        """Connect to JIRA with the credentials matching the server type
 
+        Args:
+            email: JIRA email (for Atlassian Cloud token auth)
+            api_token: JIRA API token
+            username: JIRA username (for on-premise basic auth)
+            password: JIRA password (for on-premise basic auth)
+            session_options: Extra JIRA constructor arguments (max_retries,
+                timeout, proxies)
+
+        Returns:
+            Connected JIRA instance
+
+        Raises:
+            JiraAuthError: If authentication fails or credentials are invalid
+        """
+        jira_class = _lazy("JIRA")
+        server = self.server
         try:
-            if is_cloud:
+            if self.is_cloud:
                 # Atlassian Cloud requires email + API token
                 if email and api_token:
                     logger.debug("Using Atlassian Cloud auth (email + API token)")
-                    self.jira = JIRA(server=server, basic_auth=(email, api_token))
+                    jira = jira_class(
+                        server=server,
+                        basic_auth=(email, api_token),
+                        **session_options,
+                    )
                     logger.info("Connected to Atlassian Cloud JIRA: %s", server)
                 else:
                     raise JiraAuthError(
@@ -81,26 +280,74 @@ class JiraClient:
                 # On-premise supports: (email, api_token), api_token alone, or (username, password)
                 if email and api_token:
                     logger.debug("Using token auth with email for on-premise JIRA")
-                    self.jira = JIRA(server=server, basic_auth=(email, api_token))
+                    jira = jira_class(
+                        server=server,
+                        basic_auth=(email, api_token),
+                        **session_options,
+                    )
                     logger.info("Connected to JIRA using API token: %s", server)
                 elif api_token and not email:
                     logger.debug("Using token-only auth for on-premise JIRA")
-                    self.jira = JIRA(server=server, token_auth=api_token)
+                    jira = jira_class(
+                        server=server,
+                        token_auth=api_token,
+                        **session_options,
+                    )
                     logger.info("Connected to JIRA using token-only auth: %s", server)
                 elif username and password:
                     logger.debug("Using username/password auth for on-premise JIRA")
-                    self.jira = JIRA(server=server, basic_auth=(username, password))
+                    jira = jira_class(
+                        server=server,
+                        basic_auth=(username, password),
+                        **session_options,
+                    )
                     logger.info("Connected to JIRA using username/password: %s", server)
                 else:
                     raise JiraAuthError(
                         "Must provide one of: (email, api_token), api_token alone, "
                         "or (username, password)"
                     )
-        except JIRAError as e:
+        except _lazy("JIRAError") as e:
             raise JiraAuthError(f"Failed to connect to JIRA: {e}") from e
+        return jira
+
+    def _configure_session(
+        self,
+        pool_size: Optional[int],
+        adapter_retries: Union[int, Any],
+        configure_session: Optional[Callable[[Any], None]],
+    ):
+        """Tune the connection pool of the underlying requests session
+
+        Args:
+            pool_size: Maximum kept-alive connections per host
+            adapter_retries: urllib3 retries for the HTTP adapter
+            configure_session: Hook called with the session
+        """
+        # The jira library only exposes its requests session as a private attribute
+        session = self.jira._session  # pylint: disable=protected-access
+        if pool_size:
+            from requests.adapters import HTTPAdapter  # pylint: disable=import-outside-toplevel
+
+            adapter = HTTPAdapter(
+                pool_connections=pool_size,
+                pool_maxsize=pool_size,
+                max_retries=adapter_retries,
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            logger.debug("Configured HTTP connection pool of %d", pool_size)
+        if configure_session:
+            configure_session(session)
 
     def _retry_operation(self, operation, *args, **kwargs):
-        """Retry an operation with exponential backoff
+        """Retry an operation according to the client's retry policy
+
+        JIRA errors and connection errors or timeouts raised by requests go
+        through the policy. Non-retryable errors (e.g. 400, 401, 404) are
+        raised immediately.
+        Rate-limited responses wait as long as the server asks, and pause the
+        shared rate limiter so other workers back off too.
 
         Args:
             operation: Function to retry
@@ -113,45 +360,51 @@ class JiraClient:
         Raises:
             Last exception encountered if all retries fail
         """
-        last_exception = None
-        attempts = max(1, self.max_retries)
-        for attempt in range(attempts):
+        # With the session's own retries off, network errors reach us as
+        # requests exceptions rather than JIRAError
+        exceptions = _lazy("requests").exceptions
+        retryable = (_lazy("JIRAError"), exceptions.ConnectionError, exceptions.Timeout)
+        attempt = 0
+        delay = 0.0
+        while True:
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
             try:
                 return operation(*args, **kwargs)
-            except JIRAError as e:
-                last_exception = e
-                if attempt < attempts - 1:
-                    delay = self.retry_delay * (2 ** attempt)  # Exponential backoff
-                    logger.warning(
-                        "Operation failed (attempt %d/%d): %s. Retrying in %ds...",
-                        attempt + 1, attempts, e, delay
-                    )
-                    time.sleep(delay)
-                else:
-                    logger.error(
-                        "Operation failed after %d attempts: %s",
-                        attempts, e
-                    )
-
-        raise last_exception
+            except retryable as e:
+                delay = self.retry_policy.next_delay(
+                    attempt, delay, e, self.rate_limiter
+                )
+                if delay is None:
+                    raise
+                time.sleep(delay)
+            attempt += 1
 
     def query_issues(
-        self, jql: str, max_results: int = 100, fields: Optional[str] = None
-    ) -> List[Issue]:
+        self,
+        jql: str,
+        max_results: int = 100,
+        fields: Optional[str] = None,
+        lean: bool = False,
+    ) -> List[Union[Issue, IssueRecord]]:
         """Query JIRA issues using JQL with retry logic
 
         Args:
             jql: JQL query string
             max_results: Maximum number of results to return
-            fields: Comma-separated list of fields to retrieve (None = all fields)
+            fields: Comma-separated list of fields to retrieve
+                (None = the client's default_fields, or all fields)
+            lean: Return IssueRecords built from raw JSON instead of Issue objects
 
         Returns:
-            List of JIRA issues
+            List of JIRA issues (IssueRecords if lean)
 
         Raises:
             JiraQueryError: If query fails after retries
         """
         logger.info("Querying JIRA with JQL: %s", jql)
+        if fields is None:
+            fields = self.default_fields
 
         # Construct the full URL for debugging
         params = {"jql": jql, "maxResults": max_results}
@@ -166,194 +419,970 @@ class JiraClient:
         logger.debug("=" * 80)
 
         try:
-            issues = self._retry_operation(
-                self.jira.search_issues,
-                jql,
-                maxResults=max_results,
-                fields=fields
-            )
+            if lean:
+                issues = self._query_records(jql, max_results, fields)
+            else:
+                issues = self._retry_operation(
+                    self.jira.search_issues,
+                    jql,
+                    maxResults=max_results,
+                    fields=fields
+                )
             logger.info("Found %d issues", len(issues))
             return issues
         except Exception as e:
             raise JiraQueryError(f"Failed to query JIRA: {e}") from e
 
-    def query_custom(self, jql: str, max_results: int = 100) -> List[Issue]:
+    def _query_records(
+        self, jql: str, max_results: int, fields: Optional[str]
+    ) -> List[IssueRecord]:
+        """Collect up to max_results IssueRecords, one search page at a time
+
+        The jira library fetches a raw JSON search as a single request capped
+        at the server's page size, so the pages are requested here until
+        max_results is reached or the results run out.
+
+        Args:
+            jql: JQL query string
+            max_results: Maximum number of records to return
+            fields: Comma-separated list of fields to retrieve, already resolved
+                against default_fields (None = all fields)
+
+        Returns:
+            IssueRecords in server order
+
+        Raises:
+            JiraQueryError: If a page fails after retries
+        """
+        records: List[IssueRecord] = []
+        next_page_token = None
+        while len(records) < max_results:
+            requested = max_results - len(records)
+            page = self._fetch_page(
+                jql,
+                requested,
+                fields,
+                start_at=len(records),
+                next_page_token=next_page_token,
+                lean=True,
+            )
+            records.extend(page[:requested])
+            if self.is_cloud:
+                next_page_token = getattr(page, "nextPageToken", None)
+                if not next_page_token:
+                    break
+            else:
+                total = getattr(page, "total", None)
+                if total is None:
+                    # Without a total, only a short page marks the end
+                    if len(page) < requested:
+                        break
+                elif not page or len(records) >= total:
+                    break
+        return records
+
+    def iter_issues(
+        self,
+        jql: str,
+        page_size: int = 100,
+        fields: Optional[str] = None,
+        max_workers: int = 1,
+        lean: bool = False,
+    ) -> Iterator[Union[Issue, IssueRecord]]:
+        """Iterate over all issues matching a JQL query, one page at a time
+
+        Pages are fetched lazily, so only one page of issues is held in memory.
+        Atlassian Cloud is paged with ``nextPageToken`` and on-premise instances
+        with ``startAt``. Each page is retried independently.
+
+        With ``max_workers > 1`` the total reported by the first page is used to
+        prefetch the remaining offset pages in parallel. Issues are still
+        yielded in server order. Cloud cursors cannot be fetched out of order,
+        so Cloud instances always page sequentially.
+
+        Args:
+            jql: JQL query string
+            page_size: Number of issues to request per page
+            fields: Comma-separated list of fields to retrieve
+                (None = the client's default_fields, or all fields)
+            max_workers: Maximum number of pages fetched concurrently
+            lean: Yield IssueRecords built from raw JSON instead of Issue objects
+
+        Yields:
+            JIRA issues (IssueRecords if lean) in server order
+
+        Raises:
+            JiraQueryError: If a page fails after retries
+        """
+        logger.info("Iterating JIRA issues with JQL: %s", jql)
+        if fields is None:
+            fields = self.default_fields
+
+        page = self._fetch_page(jql, page_size, fields, lean=lean)
+        total = getattr(page, "total", None)
+        if max_workers > 1 and not self.is_cloud and page and total is not None:
+            logger.debug(
+                "Prefetching %d issues with %d workers", total, max_workers
+            )
+            yield from page
+            yield from self._iter_prefetched_pages(
+                jql, len(page), fields, total, max_workers, lean
+            )
+            return
+
+        start_at = 0
+        next_page_token = None
+        while page:
+            yield from page
+            start_at += len(page)
+
+            if self.is_cloud:
+                next_page_token = getattr(page, "nextPageToken", None)
+                if not next_page_token:
+                    return
+            else:
+                total = getattr(page, "total", None)
+                if total is None:
+                    # Without a total, only a short page marks the end
+                    if len(page) < page_size:
+                        return
+                elif start_at >= total:
+                    return
+
+            page = self._fetch_page(
+                jql,
+                page_size,
+                fields,
+                start_at=start_at,
+                next_page_token=next_page_token,
+                lean=lean,
+            )
+            logger.debug("Fetched page of %d issues at offset %d", len(page), start_at)
+
+    def query_all_issues(
+        self,
+        jql: str,
+        page_size: int = 100,
+        fields: Optional[str] = None,
+        max_workers: int = 4,
+        lean: bool = False,
+    ) -> List[Union[Issue, IssueRecord]]:
+        """Query every issue matching a JQL query, prefetching pages in parallel
+
+        Args:
+            jql: JQL query string
+            page_size: Number of issues to request per page
+            fields: Comma-separated list of fields to retrieve
+                (None = the client's default_fields, or all fields)
+            max_workers: Maximum number of pages fetched concurrently
+            lean: Return IssueRecords built from raw JSON instead of Issue objects
+
+        Returns:
+            List of JIRA issues (IssueRecords if lean) in server order
+
+        Raises:
+            JiraQueryError: If a page fails after retries
+        """
+        issues = list(
+            self.iter_issues(
+                jql,
+                page_size=page_size,
+                fields=fields,
+                max_workers=max_workers,
+                lean=lean,
+            )
+        )
+        logger.info("Found %d issues", len(issues))
+        return issues
+
+    def sync_issues(
+        self,
+        jql: str,
+        store: IssueStore,
+        fields: Optional[str] = None,
+        page_size: int = 100,
+    ) -> int:
+        """Incrementally sync issues matching a JQL query into a local store
+
+        The first run downloads every matching issue. Later runs only fetch
+        issues whose ``updated`` timestamp is at or after the high-water mark
+        saved for this query, and merge them into the store. Issues that stop
+        matching the query are not removed.
+
+        Issues are read in ``updated`` order with an ``updated >=`` cursor
+        rather than plain offsets. An issue updated during the scan moves to
+        the end of the result set, which shifts the rows after it. So the
+        query restarts from the newest timestamp seen whenever it advances,
+        and issues already merged with the same timestamp are skipped. Offsets
+        (or Cloud page tokens) are only followed while a page brings no newer
+        timestamp, i.e. within one minute of JQL date precision.
+
+        Args:
+            jql: JQL query string (any ORDER BY clause is replaced)
+            store: Issue store to merge results into
+            fields: Comma-separated list of fields to retrieve, 'updated' is
+                always added (None = the client's default_fields, or all fields)
+            page_size: Number of issues to request per page
+
+        Returns:
+            Number of issues fetched and merged into the store
+
+        Raises:
+            JiraQueryError: If a page fails after retries
+        """
+        base_jql = _ORDER_BY.split(jql, maxsplit=1)[0].strip()
+        fields = fields if fields is not None else self.default_fields
+        if fields and "updated" not in fields.split(","):
+            fields = f"{fields},updated"
+
+        high_water_mark = store.get_high_water_mark(jql)
+        seen: Dict[str, Optional[str]] = {}
+        synced = 0
+        newest = cursor = high_water_mark
+        start_at, next_page_token = 0, None
+        while True:
+            query = base_jql
+            if cursor:
+                query = f'({base_jql}) AND updated >= "{self._jql_datetime(cursor)}"'
+            page = self._fetch_page(
+                f"{query} ORDER BY updated ASC",
+                page_size,
+                fields,
+                start_at=start_at,
+                next_page_token=next_page_token,
+            )
+            fresh = []
+            for issue in page:
+                raw = issue.raw
+                updated = raw.get("fields", {}).get("updated")
+                if raw["key"] in seen and seen[raw["key"]] == updated:
+                    continue
+                seen[raw["key"]] = updated
+                fresh.append(raw)
+                if updated and (
+                    not newest
+                    or parse_jira_datetime(updated) > parse_jira_datetime(newest)
+                ):
+                    newest = updated
+            synced += store.upsert(fresh)
+
+            next_page_token = getattr(page, "nextPageToken", None)
+            if (not next_page_token) if self.is_cloud else len(page) < page_size:
+                break
+            if newest != cursor:
+                # Restart from the newest timestamp so shifted rows are not skipped
+                cursor, start_at, next_page_token = newest, 0, None
+            else:
+                start_at += len(page)
+
+        # Only advance the mark once every issue is stored, so a failed run is redone
+        if newest and newest != high_water_mark:
+            store.set_high_water_mark(jql, newest)
+        logger.info("Synced %d changed issues (high-water mark: %s)", synced, newest)
+        return synced
+
+    def _jql_datetime(self, jira_datetime: str) -> str:
+        """Convert a JIRA timestamp to a JQL date literal for 'updated >='
+
+        JQL dates have minute precision and are read in the user's profile time
+        zone. One minute of overlap is subtracted; if the time zone is unknown,
+        a 14 hour overlap covers every UTC offset.
+
+        Args:
+            jira_datetime: Timestamp as returned by JIRA (e.g. in 'updated')
+
+        Returns:
+            Date literal in 'yyyy/MM/dd HH:mm' format
+        """
+        when = parse_jira_datetime(jira_datetime) - timedelta(minutes=1)
+        user_timezone = self._get_user_timezone()
+        if user_timezone is None:
+            user_timezone, when = timezone.utc, when - timedelta(hours=14)
+        return when.astimezone(user_timezone).strftime("%Y/%m/%d %H:%M")
+
+    def _get_user_timezone(self) -> Optional[tzinfo]:
+        """Return the time zone of the authenticated user's JIRA profile
+
+        Returns:
+            Time zone (cached after the first successful lookup), or None if unknown
+        """
+        if self._user_timezone is None:
+            try:
+                name = self._retry_operation(self.jira.myself).get("timeZone")
+                self._user_timezone = ZoneInfo(name) if name else timezone.utc
+            except Exception as e:
+                logger.warning("Could not determine JIRA user time zone: %s", e)
+        return self._user_timezone
+
+    def _iter_prefetched_pages(
+        self,
+        jql: str,
+        page_size: int,
+        fields: Optional[str],
+        total: int,
+        max_workers: int,
+        lean: bool = False,
+    ) -> Iterator[Union[Issue, IssueRecord]]:
+        """Fetch the pages after the first one concurrently and yield them in order
+
+        At most ``2 * max_workers`` pages are in flight or buffered at a time.
+
+        Args:
+            jql: JQL query string
+            page_size: Stride between page offsets (size of the first page)
+            fields: Comma-separated list of fields to retrieve, already resolved
+                against default_fields (None = all fields)
+            total: Total number of issues reported by the first page
+            max_workers: Maximum number of pages fetched concurrently
+            lean: Yield IssueRecords instead of Issue objects
+
+        Yields:
+            JIRA issues in server order
+        """
+        offsets = iter(range(page_size, total, page_size))
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            def submit(start_at):
+                pending.append(
+                    executor.submit(
+                        self._fetch_page,
+                        jql,
+                        page_size,
+                        fields,
+                        start_at=start_at,
+                        lean=lean,
+                    )
+                )
+
+            try:
+                for start_at in islice(offsets, 2 * max_workers):
+                    submit(start_at)
+                while pending:
+                    page = pending.popleft().result()
+                    for start_at in islice(offsets, 1):
+                        submit(start_at)
+                    yield from page
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _fetch_page(
+        self,
+        jql: str,
+        page_size: int,
+        fields: Optional[str],
+        start_at: int = 0,
+        next_page_token: Optional[str] = None,
+        lean: bool = False,
+    ) -> List[Union[Issue, IssueRecord]]:
+        """Fetch a single page of search results with retry logic
+
+        Args:
+            jql: JQL query string
+            page_size: Number of issues to request
+            fields: Comma-separated list of fields to retrieve, already resolved
+                against default_fields (None = all fields)
+            start_at: Offset of the first issue (on-premise only)
+            next_page_token: Cursor returned by the previous page (Cloud only)
+            lean: Build IssueRecords from the raw JSON instead of Issue objects
+
+        Returns:
+            Page of JIRA issues (IssueRecords if lean)
+
+        Raises:
+            JiraQueryError: If the page fails after retries
+        """
+        extra = {"json_result": True} if lean else {}
+        try:
+            if self.is_cloud:
+                page = self._retry_operation(
+                    self.jira.enhanced_search_issues,
+                    jql,
+                    nextPageToken=next_page_token,
+                    maxResults=page_size,
+                    fields=fields,
+                    **extra,
+                )
+            else:
+                page = self._retry_operation(
+                    self.jira.search_issues,
+                    jql,
+                    startAt=start_at,
+                    maxResults=page_size,
+                    fields=fields,
+                    **extra,
+                )
+            return _records_from_json(page) if lean else page
+        except Exception as e:
+            raise JiraQueryError(
+                f"Failed to fetch JIRA page at offset {start_at}: {e}"
+            ) from e
+
+    def query_custom(
+        self,
+        jql: str,
+        max_results: int = 100,
+        fields: Optional[str] = None,
+        lean: bool = False,
+    ) -> List[Union[Issue, IssueRecord]]:
         """Query JIRA issues using custom JQL (alias for query_issues)
 
         Args:
             jql: JQL query string
             max_results: Maximum number of results to return
+            fields: Comma-separated list of fields to retrieve
+                (None = the client's default_fields, or all fields)
+            lean: Return IssueRecords built from raw JSON instead of Issue objects
 
         Returns:
-            List of JIRA issues
+            List of JIRA issues (IssueRecords if lean)
         """
-        return self.query_issues(jql, max_results)
+        return self.query_issues(jql, max_results, fields=fields, lean=lean)
 
     def get_issues_by_status(
-        self, project: str, status: str, component: Optional[str] = None
-    ) -> List[Issue]:
+        self,
+        project: str,
+        status: str,
+        component: Optional[str] = None,
+        fields: Optional[str] = None,
+        lean: bool = False,
+    ) -> List[Union[Issue, IssueRecord]]:
         """Get issues by project and status
 
         Args:
             project: JIRA project key
             status: Issue status
             component: Optional component filter
+            fields: Comma-separated list of fields to retrieve
+                (None = the client's default_fields, or all fields)
+            lean: Return IssueRecords built from raw JSON instead of Issue objects
 
         Returns:
-            List of JIRA issues
+            List of JIRA issues (IssueRecords if lean)
         """
-        escaped_status = status.replace('"', '\\"')
-        jql = f'project = {project} AND status = "{escaped_status}"'
-        if component:
-            escaped_component = component.replace('"', '\\"')
-            jql += f' AND component = "{escaped_component}"'
-        return self.query_issues(jql)
+        return self.query_issues(
+            project_jql(project, "status", status, component), fields=fields, lean=lean
+        )
 
     def get_issues_by_label(
-        self, project: str, label: str, component: Optional[str] = None
-    ) -> List[Issue]:
+        self,
+        project: str,
+        label: str,
+        component: Optional[str] = None,
+        fields: Optional[str] = None,
+        lean: bool = False,
+    ) -> List[Union[Issue, IssueRecord]]:
         """Get issues by project and label
 
         Args:
             project: JIRA project key
             label: Issue label
             component: Optional component filter
+            fields: Comma-separated list of fields to retrieve
+                (None = the client's default_fields, or all fields)
+            lean: Return IssueRecords built from raw JSON instead of Issue objects
 
         Returns:
-            List of JIRA issues
+            List of JIRA issues (IssueRecords if lean)
         """
-        escaped_label = label.replace('"', '\\"')
-        jql = f'project = {project} AND labels = "{escaped_label}"'
-        if component:
-            escaped_component = component.replace('"', '\\"')
-            jql += f' AND component = "{escaped_component}"'
-        return self.query_issues(jql)
+        return self.query_issues(
+            project_jql(project, "labels", label, component), fields=fields, lean=lean
+        )
 
-    def get_field_value(self, issue: Issue, field_name: str) -> Optional[Any]:
+    def get_field_value(
+        self, issue: Union[Issue, IssueRecord], field_name: str
+    ) -> Optional[Any]:
         """Get field value from issue (built-in or custom fields)
 
         Args:
-            issue: JIRA issue
+            issue: JIRA issue or IssueRecord
             field_name: Field name (e.g., 'description', 'summary', or custom field name)
 
         Returns:
-            Field value or None if not found
+            Field value (raw JSON for IssueRecords) or None if not found
         """
         # Handle built-in fields
         field_name_lower = field_name.lower()
-        if field_name_lower == "description":
-            return getattr(issue.fields, "description", None)
-        if field_name_lower == "summary":
-            return getattr(issue.fields, "summary", None)
+        if field_name_lower in ("description", "summary"):
+            return _field_value(issue, field_name_lower)
         if field_name_lower == "status":
-            status = getattr(issue.fields, "status", None)
-            return status.name if status else None
+            return _field_value(issue, "status", "name")
         if field_name_lower == "assignee":
-            assignee = getattr(issue.fields, "assignee", None)
-            return assignee.displayName if assignee else None
+            return _field_value(issue, "assignee", "displayName")
 
-        # Handle custom fields - search by name
-        try:
-            fields = self._retry_operation(self.jira.fields)
-        except Exception as e:
-            raise JiraQueryError(f"Failed to fetch JIRA fields: {e}") from e
-
-        for field in fields:
-            if field["name"].lower() == field_name_lower:
-                return getattr(issue.fields, field["id"], None)
+        # Handle custom fields - resolve name through the cached index
+        field_id = self.resolve_field_ids([field_name])[field_name]
+        if field_id:
+            return _field_value(issue, field_id)
 
         logger.warning("Field '%s' not found in issue %s", field_name, issue.key)
         return None
 
-    def add_label(self, issue: Issue, label: str):
+    def query_fields(
+        self,
+        jql: str,
+        field_names: List[str],
+        page_size: int = 100,
+        max_workers: int = 1,
+        output: str = "dict",
+    ) -> Union[Dict[str, List[Any]], Any]:
+        """Query issues and extract the named fields into columns
+
+        Field names are resolved to IDs once and only those fields are
+        requested from the server. Each column is then built with a plain
+        loop over the raw JSON of the issues, flattening object values the
+        same way as get_field_value (status -> name, assignee -> displayName,
+        option -> value) without per-cell attribute lookups.
+
+        Args:
+            jql: JQL query string
+            field_names: Human-readable field names (or field IDs) to extract
+            page_size: Number of issues to request per page
+            max_workers: Maximum number of pages fetched concurrently
+            output: 'dict' for a dict of lists, 'numpy' for a NumPy structured
+                array or 'pandas' for a DataFrame
+
+        Returns:
+            Columns keyed by 'key' and each requested field name
+
+        Raises:
+            ValueError: If output is not a supported format
+            ImportError: If numpy or pandas is requested but not installed
+            JiraQueryError: If the field catalog or a page cannot be fetched
+        """
+        if output not in ("dict", "numpy", "pandas"):
+            raise ValueError(
+                f"Unsupported output '{output}'. Use 'dict', 'numpy' or 'pandas'"
+            )
+
+        resolved = self.resolve_field_ids(field_names)
+        missing = [name for name, field_id in resolved.items() if not field_id]
+        if missing:
+            logger.warning("Fields not found: %s", ", ".join(missing))
+
+        field_ids = [field_id for field_id in resolved.values() if field_id]
+        raw_issues = [
+            issue.raw
+            for issue in self.iter_issues(
+                jql,
+                page_size=page_size,
+                fields=",".join(dict.fromkeys(field_ids)) or "key",
+                max_workers=max_workers,
+            )
+        ]
+
+        columns = {"key": [raw["key"] for raw in raw_issues]}
+        raw_fields = [raw.get("fields", {}) for raw in raw_issues]
+        for name, field_id in resolved.items():
+            columns[name] = [
+                flatten_field_value(fields.get(field_id)) for fields in raw_fields
+            ]
+        logger.info(
+            "Extracted %d fields from %d issues", len(resolved), len(raw_issues)
+        )
+
+        return columns_to_output(columns, output)
+
+    def resolve_field_ids(
+        self, field_names: List[str], refresh: bool = False
+    ) -> Dict[str, Optional[str]]:
+        """Resolve field names to field IDs using the cached field index
+
+        Names are matched case-insensitively. Field IDs (e.g. 'customfield_12345')
+        resolve to themselves.
+
+        Args:
+            field_names: Field names to resolve
+            refresh: Rebuild the field index before resolving
+
+        Returns:
+            Dictionary mapping each requested name to its field ID, or None if unknown
+
+        Raises:
+            JiraQueryError: If the field catalog cannot be fetched
+        """
+        field_ids = self._get_field_index(refresh=refresh)
+        return {name: field_ids.get(name.lower()) for name in field_names}
+
+    def refresh_field_cache(self):
+        """Force the field name index to be rebuilt from the server
+
+        Raises:
+            JiraQueryError: If the field catalog cannot be fetched
+        """
+        self._get_field_index(refresh=True)
+
+    def _get_field_index(self, refresh: bool = False) -> Dict[str, str]:
+        """Return the lowercase field name/ID to field ID index, building it if stale
+
+        Args:
+            refresh: Rebuild the index even if it has not expired
+
+        Returns:
+            Dictionary mapping lowercase field names and IDs to field IDs
+
+        Raises:
+            JiraQueryError: If the field catalog cannot be fetched
+        """
+        index = self._field_index
+        with index.lock:
+            if index.is_stale(self.field_cache_ttl, refresh):
+                try:
+                    index.load(self._retry_operation(self.jira.fields))
+                except Exception as e:
+                    raise JiraQueryError(f"Failed to fetch JIRA fields: {e}") from e
+            return index.ids
+
+    def add_label(self, issue: Union[Issue, IssueRecord], label: str):
         """Add label to issue with retry logic
 
         Args:
-            issue: JIRA issue
+            issue: JIRA issue or IssueRecord
             label: Label to add
 
         Raises:
             JiraUpdateError: If update fails after retries
         """
-        try:
-            current_labels = list(issue.fields.labels or [])
-            if label not in current_labels:
-                updated_labels = [*current_labels, label]
-                self._retry_operation(issue.update, fields={"labels": updated_labels})
-                issue.fields.labels = updated_labels
-                logger.info("Added label '%s' to %s", label, issue.key)
-            else:
-                logger.debug("Label '%s' already exists on %s", label, issue.key)
-        except Exception as e:
-            raise JiraUpdateError(f"Failed to add label to {issue.key}: {e}") from e
+        self.update_labels(issue, add=[label])
 
-    def remove_label(self, issue: Issue, label: str):
+    def remove_label(self, issue: Union[Issue, IssueRecord], label: str):
         """Remove label from issue
 
         Args:
-            issue: JIRA issue
+            issue: JIRA issue or IssueRecord
             label: Label to remove
 
         Raises:
             JiraUpdateError: If update fails after retries
         """
+        self.update_labels(issue, remove=[label])
+
+    def update_labels(
+        self,
+        issue: Union[Issue, IssueRecord],
+        add: Optional[List[str]] = None,
+        remove: Optional[List[str]] = None,
+    ):
+        """Add and remove several labels in a single update request
+
+        Labels are sent as incremental ``add``/``remove`` update operations
+        rather than a replacement label list. The issue's current labels do not
+        need to be known, and labels changed concurrently by other clients are
+        preserved.
+
+        The update is sent by issue key. Unlike ``Issue.update``, which reloads
+        the whole issue after every change, this costs one request; in turn,
+        ``Issue.fields.labels`` of the passed issue is not refreshed.
+
+        Args:
+            issue: JIRA issue or IssueRecord
+            add: Labels to add
+            remove: Labels to remove
+
+        Raises:
+            JiraUpdateError: If update fails after retries
+        """
+        operations = label_operations(add, remove)
+        if not operations:
+            return
+
         try:
-            current_labels = list(issue.fields.labels or [])
-            if label in current_labels:
-                updated_labels = [lbl for lbl in current_labels if lbl != label]
-                self._retry_operation(issue.update, fields={"labels": updated_labels})
-                issue.fields.labels = updated_labels
-                logger.info("Removed label '%s' from %s", label, issue.key)
-            else:
-                logger.debug("Label '%s' not found on %s", label, issue.key)
+            self._retry_operation(
+                self.jira._session.put,  # pylint: disable=protected-access
+                self.jira._get_url(f"issue/{issue.key}"),  # pylint: disable=protected-access
+                data=json.dumps({"update": {"labels": operations}}),
+            )
+            logger.info(
+                "Updated labels on %s (added: %s, removed: %s)",
+                issue.key, add or [], remove or []
+            )
         except Exception as e:
-            raise JiraUpdateError(f"Failed to remove label from {issue.key}: {e}") from e
+            raise JiraUpdateError(f"Failed to update labels on {issue.key}: {e}") from e
+
+    def add_labels_bulk(
+        self,
+        issues: Union[List[Union[Issue, IssueRecord]], str],
+        labels: Union[List[str], str],
+        max_workers: int = 8,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Add labels to many issues concurrently
+
+        Issues whose loaded labels already include every label are skipped.
+        Issues loaded without their labels are always updated.
+        Failures are recorded in the report instead of stopping the batch.
+
+        Args:
+            issues: JIRA issues or IssueRecords, or a JQL query selecting them
+            labels: Label or labels to add
+            max_workers: Maximum number of concurrent updates
+
+        Returns:
+            Dictionary mapping issue key to {'status': 'updated' | 'skipped' |
+            'failed', 'error': error message or None}, in input order
+
+        Raises:
+            JiraQueryError: If the JQL query fails
+        """
+        return self._update_labels_bulk(issues, labels, True, max_workers)
 
-    def transition_issue(self, issue: Issue, transition_name: str):
+    def remove_labels_bulk(
+        self,
+        issues: Union[List[Union[Issue, IssueRecord]], str],
+        labels: Union[List[str], str],
+        max_workers: int = 8,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Remove labels from many issues concurrently
+
+        Issues whose loaded labels include none of the labels are skipped.
+        Issues loaded without their labels are always updated.
+        Failures are recorded in the report instead of stopping the batch.
+
+        Args:
+            issues: JIRA issues or IssueRecords, or a JQL query selecting them
+            labels: Label or labels to remove
+            max_workers: Maximum number of concurrent updates
+
+        Returns:
+            Dictionary mapping issue key to {'status': 'updated' | 'skipped' |
+            'failed', 'error': error message or None}, in input order
+
+        Raises:
+            JiraQueryError: If the JQL query fails
+        """
+        return self._update_labels_bulk(issues, labels, False, max_workers)
+
+    def _update_labels_bulk(
+        self,
+        issues: Union[List[Union[Issue, IssueRecord]], str],
+        labels: Union[List[str], str],
+        add: bool,
+        max_workers: int,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Add or remove labels on many issues with a bounded thread pool
+
+        Args:
+            issues: JIRA issues or IssueRecords, or a JQL query selecting them
+            labels: Label or labels to add or remove
+            add: True to add the labels, False to remove them
+            max_workers: Maximum number of concurrent updates
+
+        Returns:
+            Per-issue report keyed by issue key
+        """
+        if isinstance(labels, str):
+            labels = [labels]
+        labels = list(dict.fromkeys(labels))
+        if isinstance(issues, str):
+            issues = self.iter_issues(issues, fields="labels", lean=True)
+
+        def update(issue):
+            current = _field_value(issue, "labels")
+            if not isinstance(current, list):
+                # Labels were not loaded; the add/remove operations are idempotent
+                changes = labels
+            elif add:
+                changes = [label for label in labels if label not in current]
+            else:
+                changes = [label for label in labels if label in current]
+            if not changes:
+                return issue.key, {"status": "skipped", "error": None}
+            try:
+                if add:
+                    self.update_labels(issue, add=changes)
+                else:
+                    self.update_labels(issue, remove=changes)
+                return issue.key, {"status": "updated", "error": None}
+            except JiraUpdateError as e:
+                logger.warning("%s", e)
+                return issue.key, {"status": "failed", "error": str(e)}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            report = dict(executor.map(update, issues))
+
+        statuses = [result["status"] for result in report.values()]
+        logger.info(
+            "Bulk label update: %d updated, %d skipped, %d failed",
+            statuses.count("updated"),
+            statuses.count("skipped"),
+            statuses.count("failed"),
+        )
+        return report
+
+    def transition_issue(self, issue: Union[Issue, IssueRecord], transition_name: str):
         """Transition issue to new status
 
+        Available transitions are cached per (project, issue type, status) for
+        transition_cache_ttl seconds, so transitioning many issues in the same
+        workflow state costs one lookup. A name missing from the cached entry
+        triggers a fresh lookup. If a cached transition is rejected, the entry
+        is dropped and the transition is retried once with a fresh lookup.
+
+        The issue object is not modified, so its status goes stale after a
+        transition. The client remembers the status the issue moved to and
+        uses it for later transitions of the same object only; other objects
+        for the same issue are keyed by their own status.
+
         Args:
-            issue: JIRA issue
+            issue: JIRA issue or IssueRecord
             transition_name: Name of transition (e.g., 'Done', 'In Progress')
 
         Raises:
             JiraUpdateError: If transition fails or is not found
         """
+        cache_key = self._transition_cache_key(issue)
         try:
-            transitions = self._retry_operation(self.jira.transitions, issue)
-            transition_id = None
-
-            for t in transitions:
-                if t["name"].lower() == transition_name.lower():
-                    transition_id = t["id"]
-                    break
-
-            if transition_id:
-                self._retry_operation(self.jira.transition_issue, issue, transition_id)
-                logger.info("Transitioned %s to '%s'", issue.key, transition_name)
-            else:
-                available = [t["name"] for t in transitions]
-                raise JiraUpdateError(
-                    f"Transition '{transition_name}' not found for {issue.key}. "
-                    f"Available transitions: {available}"
+            transition, cached = self._lookup_transition(
+                issue, transition_name, cache_key
+            )
+            try:
+                self._retry_operation(
+                    self.jira.transition_issue, _issue_ref(issue), transition["id"]
+                )
+            except _lazy("JIRAError") as e:
+                if not cached:
+                    raise
+                logger.warning(
+                    "Cached transition '%s' rejected for %s (%s), looking it up again",
+                    transition_name, issue.key, e
+                )
+                self._invalidate_transitions(cache_key)
+                transition, _ = self._lookup_transition(
+                    issue, transition_name, cache_key
                 )
+                self._retry_operation(
+                    self.jira.transition_issue, _issue_ref(issue), transition["id"]
+                )
+            self._record_transition(issue, transition)
+            logger.info("Transitioned %s to '%s'", issue.key, transition_name)
         except JiraUpdateError:
             raise
         except Exception as e:
+            self._invalidate_transitions(cache_key)
             raise JiraUpdateError(f"Failed to transition {issue.key}: {e}") from e
 
-    def add_comment(self, issue: Issue, comment: str):
+    def clear_transition_cache(self):
+        """Drop every cached transition lookup"""
+        with self._transitions_lock:
+            self._transitions.clear()
+            self._transitioned.clear()
+
+    def _transition_cache_key(
+        self, issue: Union[Issue, IssueRecord]
+    ) -> Optional[tuple]:
+        """Return the (project, issue type, status) workflow key of an issue
+
+        If this client already transitioned this very issue object, the status
+        it moved to replaces the object's stale status.
+
+        Args:
+            issue: JIRA issue or IssueRecord
+
+        Returns:
+            Cache key, or None if the issue was loaded without those fields or
+            its current status is unknown
+        """
+        try:
+            key = (
+                _field_value(issue, "project", "key"),
+                _field_value(issue, "issuetype", "name"),
+                _field_value(issue, "status", "name"),
+            )
+        except AttributeError:
+            return None
+        if None in key:
+            return None
+        status = key[2]
+        with self._transitions_lock:
+            entry = self._transitioned.get(id(issue))
+        if entry and entry[0]() is issue and entry[1] == status:
+            status = entry[2]
+        return None if status is None else (key[0], key[1], status)
+
+    def _record_transition(
+        self, issue: Union[Issue, IssueRecord], transition: Dict[str, Any]
+    ):
+        """Remember the status an issue object moved to
+
+        Entries are keyed by object identity and hold a weak reference, so they
+        never apply to another object that happens to reuse the same id.
+
+        Args:
+            issue: JIRA issue or IssueRecord whose status field predates the transition
+            transition: Transition dictionary, with a 'to' status if the server sent it
+        """
+        try:
+            status = _field_value(issue, "status", "name")
+        except AttributeError:
+            return
+        if status is None:
+            return
+        try:
+            ref = weakref.ref(issue)
+        except TypeError:
+            return
+        target = (transition.get("to") or {}).get("name")
+        with self._transitions_lock:
+            self._transitioned.pop(id(issue), None)
+            if len(self._transitioned) >= _MAX_TRANSITIONED_ISSUES:
+                self._transitioned.pop(next(iter(self._transitioned)))
+            self._transitioned[id(issue)] = (ref, status, target)
+
+    def _lookup_transition(
+        self, issue: Union[Issue, IssueRecord], transition_name: str, cache_key: Optional[tuple]
+    ) -> Tuple[Dict[str, Any], bool]:
+        """Find a transition by name, using the transition cache when possible
+
+        Args:
+            issue: JIRA issue or IssueRecord
+            transition_name: Name of transition (case-insensitive)
+            cache_key: Workflow key from _transition_cache_key
+
+        Returns:
+            Tuple of (transition dictionary, whether it came from the cache)
+
+        Raises:
+            JiraUpdateError: If the transition is not available for the issue
+        """
+        if cache_key is not None:
+            with self._transitions_lock:
+                loaded_at, transitions = self._transitions.get(cache_key, (0.0, []))
+            if time.monotonic() - loaded_at < self.transition_cache_ttl:
+                transition = find_transition(transitions, transition_name)
+                if transition:
+                    return transition, True
+
+        transitions = self._retry_operation(self.jira.transitions, _issue_ref(issue))
+        if cache_key is not None:
+            with self._transitions_lock:
+                self._transitions[cache_key] = (time.monotonic(), transitions)
+
+        transition = find_transition(transitions, transition_name)
+        if not transition:
+            raise transition_not_found(issue.key, transition_name, transitions)
+        return transition, False
+
+    def _invalidate_transitions(self, cache_key: Optional[tuple]):
+        """Drop the cached transitions for one workflow key
+
+        Args:
+            cache_key: Workflow key from _transition_cache_key
+        """
+        if cache_key is not None:
+            with self._transitions_lock:
+                self._transitions.pop(cache_key, None)
+
+    def add_comment(self, issue: Union[Issue, IssueRecord], comment: str):
         """Add comment to issue
 
         Args:
-            issue: JIRA issue
+            issue: JIRA issue or IssueRecord
             comment: Comment text
 
         Raises:
             JiraUpdateError: If comment fails to add
         """
         try:
-            self._retry_operation(self.jira.add_comment, issue, comment)
+            self._retry_operation(self.jira.add_comment, _issue_ref(issue), comment)
             logger.info("Added comment to %s", issue.key)
         except Exception as e:
             raise JiraUpdateError(f"Failed to add comment to {issue.key}: {e}") from e
@@ -386,33 +1415,93 @@ class JiraClient:
             JiraUpdateError: If issue creation fails
         """
         try:
-            fields = {
-                "project": {"key": project},
-                "summary": summary,
-                "description": description,
-                "issuetype": {"name": issue_type},
-            }
-
-            if component:
-                fields["components"] = [{"name": component}]
-
-            if labels:
-                fields["labels"] = labels
-
-            # Add any extra fields
-            fields.update(extra_fields)
-
+            fields = build_issue_fields(
+                project, summary, description, issue_type, component, labels,
+                **extra_fields
+            )
             issue = self._retry_operation(self.jira.create_issue, fields=fields)
             logger.info("Created issue %s: %s", issue.key, summary)
             return issue
         except Exception as e:
             raise JiraUpdateError(f"Failed to create issue: {e}") from e
 
-    def get_available_transitions(self, issue: Issue) -> List[Dict[str, str]]:
+    def create_issues_bulk(
+        self, specs: List[Dict[str, Any]], batch_size: int = 50
+    ) -> List[Optional[str]]:
+        """Create many issues through the bulk create endpoint
+
+        Each spec holds the keyword arguments of create_issue (project, summary,
+        description, issue_type, component, labels and extra fields). Issues are
+        sent in batches of batch_size. Items rejected inside a batch are retried
+        with backoff; a batch request that fails after retries is not resent.
+
+        Args:
+            specs: create_issue keyword arguments, one dict per issue
+            batch_size: Number of issues per bulk request (JIRA allows 50)
+
+        Returns:
+            Created issue keys in input order, None for issues that failed
+
+        Raises:
+            JiraUpdateError: If a spec is missing required arguments
+        """
+        try:
+            pending = [
+                (index, build_issue_fields(**spec)) for index, spec in enumerate(specs)
+            ]
+        except TypeError as e:
+            raise JiraUpdateError(f"Invalid issue spec: {e}") from e
+
+        keys: List[Optional[str]] = [None] * len(specs)
+        errors: Dict[int, Any] = {}
+        attempts = max(1, self.retry_policy.max_retries)
+        delay = 0.0
+        for attempt in range(attempts):
+            rejected = []
+            for start in range(0, len(pending), batch_size):
+                batch = pending[start:start + batch_size]
+                try:
+                    results = self._retry_operation(
+                        self.jira.create_issues,
+                        [fields for _, fields in batch],
+                        prefetch=False,
+                    )
+                except Exception as e:
+                    logger.error("Bulk create request failed: %s", e)
+                    errors.update((index, str(e)) for index, _ in batch)
+                    continue
+
+                for (index, fields), result in zip(batch, results):
+                    if result["status"] == "Success":
+                        keys[index] = result["issue"].key
+                        errors.pop(index, None)
+                    else:
+                        errors[index] = result["error"]
+                        rejected.append((index, fields))
+
+            pending = rejected
+            if not pending:
+                break
+            if attempt < attempts - 1:
+                delay = self.retry_policy.compute_delay(attempt, delay)
+                logger.warning(
+                    "%d issues rejected (attempt %d/%d). Retrying in %.1fs...",
+                    len(pending), attempt + 1, attempts, delay
+                )
+                time.sleep(delay)
+
+        for index, error in sorted(errors.items()):
+            logger.error("Failed to create issue %d: %s", index, error)
+        logger.info("Created %d/%d issues", len(specs) - len(errors), len(specs))
+        return keys
+
+    def get_available_transitions(
+        self, issue: Union[Issue, IssueRecord]
+    ) -> List[Dict[str, str]]:
         """Get available transitions for an issue
 
         Args:
-            issue: JIRA issue
+            issue: JIRA issue or IssueRecord
 
         Returns:
             List of transition dictionaries with 'id' and 'name' keys
@@ -421,7 +1510,7 @@ class JiraClient:
             JiraUpdateError: If fetching transitions fails
         """
         try:
-            return self._retry_operation(self.jira.transitions, issue)
+            return self._retry_operation(self.jira.transitions, _issue_ref(issue))
         except Exception as e:
             raise JiraUpdateError(
                 f"Failed to get transitions for {issue.key}: {e}"
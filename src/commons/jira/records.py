@@ -0,0 +1,52 @@
+"""Lightweight issue representation for large JIRA scans"""
+
+from typing import Any, Dict, Optional
+
+
+class IssueRecord:
+    """Compact issue holding only its key, id and the fields returned by the server
+
+    Built directly from search JSON, skipping the ``jira.resources.Issue``
+    object graph. Field values are kept as raw JSON.
+    """
+
+    __slots__ = ("key", "id", "fields", "__weakref__")
+
+    def __init__(self, key: str, id: Optional[str], fields: Dict[str, Any]):  # pylint: disable=redefined-builtin
+        """Initialize issue record
+
+        Args:
+            key: Issue key
+            id: Issue ID
+            fields: Raw field values keyed by field ID
+        """
+        self.key = key
+        self.id = id
+        self.fields = fields
+
+    @classmethod
+    def from_raw(cls, raw: Dict[str, Any]) -> "IssueRecord":
+        """Build a record from raw issue JSON
+
+        Args:
+            raw: Issue JSON as returned by the search endpoint
+
+        Returns:
+            Issue record
+        """
+        return cls(raw["key"], raw.get("id"), raw.get("fields") or {})
+
+    def get(self, field_id: str, default: Any = None) -> Any:
+        """Get a raw field value
+
+        Args:
+            field_id: Field ID (e.g., 'summary', 'customfield_12345')
+            default: Value returned if the field is missing
+
+        Returns:
+            Raw field value or default
+        """
+        return self.fields.get(field_id, default)
+
+    def __repr__(self) -> str:
+        return f"IssueRecord(key={self.key!r}, fields={sorted(self.fields)!r})"
@@ -0,0 +1,253 @@
+"""Retry policy and rate limiting for JIRA clients
+
+RetryPolicy decides whether a failed request is worth retrying and how long to
+wait, honoring ``Retry-After`` and ``X-RateLimit-Reset`` headers sent by
+Atlassian Cloud. TokenBucket caps the request rate across every thread (or
+coroutine) sharing a client.
+"""
+
+import logging
+import random
+import threading
+import time
+from datetime import datetime
+from typing import Any, FrozenSet, Optional
+
+from commons.utils import retry_after_seconds, seconds_until
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+def _status_and_headers(exc: Exception):
+    """Extract the HTTP status code and response headers from a request error
+
+    Works with ``jira.exceptions.JIRAError`` and ``httpx.HTTPStatusError``.
+
+    Args:
+        exc: Exception raised by a request
+
+    Returns:
+        Tuple of (status code or None, headers mapping)
+    """
+    response = getattr(exc, "response", None)
+    status = getattr(exc, "status_code", None)
+    if status is None and response is not None:
+        status = getattr(response, "status_code", None)
+    headers = getattr(response, "headers", None) or {}
+    return status, headers
+
+
+def parse_retry_after(headers: Any) -> Optional[float]:
+    """Parse the server-requested wait from rate limit headers
+
+    Args:
+        headers: Response headers mapping
+
+    Returns:
+        Seconds to wait, or None if the headers do not say
+    """
+    retry_after = retry_after_seconds(headers.get("Retry-After"))
+    if retry_after is not None:
+        return retry_after
+
+    reset = headers.get("X-RateLimit-Reset")
+    if reset:
+        try:
+            return seconds_until(datetime.fromisoformat(reset.replace("Z", "+00:00")))
+        except ValueError:
+            pass
+    return None
+
+
+class RetryPolicy:
+    """Classify request errors and compute backoff delays
+
+    Errors without an HTTP status (connection resets, timeouts) and statuses in
+    ``retry_statuses`` are retried. Other 4xx errors fail immediately. Delays
+    use decorrelated jitter between ``base_delay`` and ``max_delay`` unless the
+    server asks for a specific wait.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 2.0,
+        max_delay: float = 60.0,
+        jitter: bool = True,
+        retry_statuses: FrozenSet[int] = RETRYABLE_STATUSES,
+        respect_retry_after: bool = True,
+    ):
+        """Initialize retry policy
+
+        Args:
+            max_retries: Maximum number of attempts per operation
+            base_delay: Minimum delay in seconds between attempts
+            max_delay: Maximum computed delay in seconds
+            jitter: Use decorrelated jitter instead of plain exponential backoff
+            retry_statuses: HTTP status codes worth retrying
+            respect_retry_after: Wait as long as Retry-After / X-RateLimit-Reset say
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.retry_statuses = retry_statuses
+        self.respect_retry_after = respect_retry_after
+
+    def is_retryable(self, exc: Exception) -> bool:
+        """Return whether a failed request may succeed if retried
+
+        Args:
+            exc: Exception raised by the request
+
+        Returns:
+            True for network errors and retryable status codes
+        """
+        status, _ = _status_and_headers(exc)
+        return status is None or status in self.retry_statuses
+
+    def server_delay(self, exc: Exception) -> Optional[float]:
+        """Return the wait requested by the server for a failed request
+
+        Args:
+            exc: Exception raised by the request
+
+        Returns:
+            Seconds to wait, or None if the server did not ask for one
+        """
+        if not self.respect_retry_after:
+            return None
+        _, headers = _status_and_headers(exc)
+        return parse_retry_after(headers)
+
+    def compute_delay(
+        self, attempt: int, previous_delay: float, exc: Optional[Exception] = None
+    ) -> float:
+        """Compute how long to wait before the next attempt
+
+        Args:
+            attempt: Zero-based number of the attempt that just failed
+            previous_delay: Delay used before the failed attempt (0 for the first)
+            exc: Exception raised by the failed attempt
+
+        Returns:
+            Delay in seconds
+        """
+        if exc is not None:
+            requested = self.server_delay(exc)
+            if requested is not None:
+                return requested
+        if not self.jitter:
+            return min(self.max_delay, self.base_delay * (2 ** attempt))
+        upper = max(self.base_delay, previous_delay * 3)
+        return min(self.max_delay, random.uniform(self.base_delay, upper))
+
+    def next_delay(
+        self,
+        attempt: int,
+        previous_delay: float,
+        exc: Exception,
+        rate_limiter: Optional["TokenBucket"] = None,
+    ) -> Optional[float]:
+        """Decide whether to retry a failed attempt and how long to wait first
+
+        Rate-limited responses pause the shared rate limiter for the wait so
+        other workers back off too. The decision is logged.
+
+        Args:
+            attempt: Zero-based number of the attempt that just failed
+            previous_delay: Delay used before the failed attempt (0 for the first)
+            exc: Exception raised by the failed attempt
+            rate_limiter: Token bucket shared by the client's requests, if any
+
+        Returns:
+            Seconds to wait before the next attempt, or None to give up
+        """
+        attempts = max(1, self.max_retries)
+        if not self.is_retryable(exc):
+            logger.error("Operation failed with non-retryable error: %s", exc)
+            return None
+        if attempt >= attempts - 1:
+            logger.error("Operation failed after %d attempts: %s", attempts, exc)
+            return None
+        delay = self.compute_delay(attempt, previous_delay, exc)
+        if rate_limiter and self.server_delay(exc) is not None:
+            # Rate limited: hold back every worker sharing the limiter
+            rate_limiter.pause(delay)
+        logger.warning(
+            "Operation failed (attempt %d/%d): %s. Retrying in %.1fs...",
+            attempt + 1, attempts, exc, delay
+        )
+        return delay
+
+
+def policy_attribute(name: str, doc: str) -> property:
+    """Build a client property that reads and writes an attribute of retry_policy
+
+    Args:
+        name: RetryPolicy attribute name
+        doc: Property docstring
+
+    Returns:
+        Property delegating to ``self.retry_policy``
+    """
+    return property(
+        lambda self: getattr(self.retry_policy, name),
+        lambda self, value: setattr(self.retry_policy, name, value),
+        doc=doc,
+    )
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting requests per second
+
+    Share one bucket between every worker talking to the same JIRA instance.
+    ``pause`` makes all callers wait, e.g. after a 429 response.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """Initialize token bucket
+
+        Args:
+            rate: Tokens added per second (sustained requests per second)
+            capacity: Maximum burst size (default: rate, at least 1)
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how long the caller must wait before using it
+
+        Returns:
+            Seconds to wait (0 if a token is available now)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._paused_until - now)
+
+    def acquire(self):
+        """Block until a token is available"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Make every caller wait at least the given number of seconds
+
+        Args:
+            seconds: Seconds from now before requests may resume
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
@@ -0,0 +1,159 @@
+"""Local SQLite store for incrementally synced JIRA issues
+
+Keeps the raw JSON of every synced issue plus a per-query high-water mark on
+the ``updated`` field, so JiraClient.sync_issues only downloads issues that
+changed since the previous run. The store can be queried offline. The
+``updated`` column holds UTC ISO-8601 timestamps, so it sorts correctly as
+text whatever offset the server reported.
+"""
+
+import json
+from datetime import timezone
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from commons.utils import SQLiteDatabase
+
+from .utils import parse_jira_datetime
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    key TEXT PRIMARY KEY,
+    updated TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    query TEXT PRIMARY KEY,
+    high_water_mark TEXT NOT NULL
+);
+"""
+
+
+def _utc_timestamp(updated: Optional[str]) -> Optional[str]:
+    """Normalize a JIRA timestamp to UTC ISO-8601 so it sorts correctly as text
+
+    Args:
+        updated: Timestamp such as '2024-05-01T10:15:30.000+0200'
+
+    Returns:
+        UTC timestamp such as '2024-05-01T08:15:30.000+00:00', or None if the
+        value is missing or not a JIRA timestamp
+    """
+    if not updated:
+        return None
+    try:
+        when = parse_jira_datetime(updated)
+    except ValueError:
+        return None
+    return when.astimezone(timezone.utc).isoformat(timespec="milliseconds")
+
+
+class IssueStore(SQLiteDatabase):
+    """Thread-safe SQLite store of raw JIRA issue JSON keyed by issue key"""
+
+    def __init__(self, path: str = ":memory:"):
+        """Open (or create) an issue store
+
+        Args:
+            path: SQLite database file (default: in-memory store)
+        """
+        super().__init__(path, _SCHEMA)
+
+    def __len__(self) -> int:
+        """Return the number of stored issues."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM issues").fetchone()[0]
+
+    def upsert(self, raw_issues: Iterable[Dict[str, Any]]) -> int:
+        """Insert or replace issues
+
+        Args:
+            raw_issues: Raw issue JSON dictionaries (``Issue.raw``)
+
+        Returns:
+            Number of issues written
+        """
+        rows = [
+            (
+                raw["key"],
+                _utc_timestamp(raw.get("fields", {}).get("updated")),
+                json.dumps(raw),
+            )
+            for raw in raw_issues
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO issues (key, updated, data) VALUES (?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get one stored issue
+
+        Args:
+            key: Issue key
+
+        Returns:
+            Raw issue JSON, or None if the issue is not stored
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM issues WHERE key = ?", (key,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def iter_issues(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over every stored issue, most recently updated first
+
+        Yields:
+            Raw issue JSON dictionaries
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM issues ORDER BY updated DESC"
+            ).fetchall()
+        for (data,) in rows:
+            yield json.loads(data)
+
+    def delete(self, keys: Iterable[str]) -> int:
+        """Delete issues from the store
+
+        Args:
+            keys: Issue keys to delete
+
+        Returns:
+            Number of issues deleted
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.executemany(
+                "DELETE FROM issues WHERE key = ?", [(key,) for key in keys]
+            )
+        return cursor.rowcount
+
+    def get_high_water_mark(self, query: str) -> Optional[str]:
+        """Get the newest ``updated`` timestamp synced for a query
+
+        Args:
+            query: JQL query the mark belongs to
+
+        Returns:
+            JIRA timestamp string, or None if the query was never synced
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT high_water_mark FROM sync_state WHERE query = ?", (query,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_high_water_mark(self, query: str, high_water_mark: str):
+        """Record the newest ``updated`` timestamp synced for a query
+
+        Args:
+            query: JQL query the mark belongs to
+            high_water_mark: JIRA timestamp string
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state (query, high_water_mark) VALUES (?, ?)",
+                (query, high_water_mark),
+            )
@@ -0,0 +1,223 @@
+"""Tests for asynchronous JIRA client"""
+
+import asyncio
+import json
+import unittest
+from unittest.mock import AsyncMock, patch
+
+import httpx
+
+from commons.jira.async_client import AsyncJiraClient
+from commons.jira.exceptions import JiraAuthError, JiraQueryError, JiraUpdateError
+
+
+def _client(handler, **kwargs):
+    """Build an on-premise client backed by a mock transport"""
+    return AsyncJiraClient(
+        server="https://jira.example.com",
+        username="test",
+        password="test",
+        transport=httpx.MockTransport(handler),
+        **kwargs
+    )
+
+
+class TestAsyncJiraClient(unittest.IsolatedAsyncioTestCase):
+    """Test asynchronous JIRA client functionality"""
+
+    def test_init_without_credentials_raises_error(self):
+        """Test that missing credentials raises JiraAuthError"""
+        with self.assertRaises(JiraAuthError):
+            AsyncJiraClient(server="https://jira.example.com")
+
+    def test_init_cloud_requires_email_and_token(self):
+        """Test that Atlassian Cloud rejects token-only auth"""
+        with self.assertRaises(JiraAuthError):
+            AsyncJiraClient(server="https://redhat.atlassian.net", api_token="token")
+
+    async def test_query_issues(self):
+        """Test querying issues with JQL"""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"issues": [{"key": "TEST-1"}, {"key": "TEST-2"}]})
+
+        async with _client(handler) as client:
+            issues = await client.query_issues("project = TEST", max_results=10)
+
+        self.assertEqual([i["key"] for i in issues], ["TEST-1", "TEST-2"])
+        self.assertEqual(requests[0].url.path, "/rest/api/2/search")
+        self.assertEqual(requests[0].url.params["jql"], "project = TEST")
+        self.assertEqual(requests[0].url.params["maxResults"], "10")
+
+    async def test_query_issues_pages_up_to_max_results(self):
+        """Test that on-premise queries follow startAt until max_results"""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            start_at = int(request.url.params["startAt"])
+            page = [{"key": f"TEST-{i}"} for i in range(start_at, min(start_at + 2, 5))]
+            return httpx.Response(200, json={"issues": page, "total": 5})
+
+        async with _client(handler) as client:
+            issues = await client.query_issues("project = TEST", max_results=3)
+            everything = await client.query_issues("project = TEST", max_results=10)
+
+        self.assertEqual([i["key"] for i in issues], ["TEST-0", "TEST-1", "TEST-2"])
+        self.assertEqual(len(everything), 5)
+        self.assertEqual(
+            [r.url.params["startAt"] for r in requests], ["0", "2", "0", "2", "4"]
+        )
+        self.assertEqual(requests[1].url.params["maxResults"], "1")
+
+    async def test_query_issues_cloud_follows_page_token(self):
+        """Test that Cloud queries follow nextPageToken until it is absent"""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if "nextPageToken" not in request.url.params:
+                return httpx.Response(
+                    200, json={"issues": [{"key": "TEST-1"}], "nextPageToken": "p2"}
+                )
+            return httpx.Response(200, json={"issues": [{"key": "TEST-2"}]})
+
+        async with AsyncJiraClient(
+            server="https://redhat.atlassian.net",
+            email="user@example.com",
+            api_token="token",
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            issues = await client.query_issues("project = TEST")
+
+        self.assertEqual([i["key"] for i in issues], ["TEST-1", "TEST-2"])
+        self.assertEqual(requests[0].url.path, "/rest/api/2/search/jql")
+        self.assertEqual(requests[1].url.params["nextPageToken"], "p2")
+
+    async def test_get_field_value(self):
+        """Test reading built-in and cached custom fields from raw issues"""
+        paths = []
+
+        def handler(request):
+            paths.append(request.url.path)
+            return httpx.Response(
+                200, json=[{"id": "customfield_100", "name": "Priority Score"}]
+            )
+
+        issue = {
+            "key": "TEST-1",
+            "fields": {
+                "summary": "Test summary",
+                "status": {"name": "Open"},
+                "customfield_100": 42,
+            },
+        }
+        async with _client(handler) as client:
+            self.assertEqual(await client.get_field_value(issue, "summary"), "Test summary")
+            self.assertEqual(await client.get_field_value(issue, "status"), "Open")
+            self.assertIsNone(await client.get_field_value(issue, "assignee"))
+            self.assertEqual(await client.get_field_value(issue, "Priority Score"), 42)
+            self.assertIsNone(await client.get_field_value(issue, "Unknown Field"))
+
+        self.assertEqual(paths, ["/rest/api/2/field"])
+
+    @patch('commons.jira.async_client.asyncio.sleep', new_callable=AsyncMock)
+    async def test_retry_uses_asyncio_sleep(self, mock_sleep):
+        """Test that failed requests back off without blocking the event loop"""
+        responses = iter([
+            httpx.Response(503),
+            httpx.Response(200, json={"issues": []}),
+        ])
+
+        async with _client(lambda request: next(responses)) as client:
+            issues = await client.query_issues("project = TEST")
+
+        self.assertEqual(issues, [])
+        mock_sleep.assert_awaited_once_with(2)
+
+    @patch('commons.jira.async_client.asyncio.sleep', new_callable=AsyncMock)
+    async def test_query_issues_raises_query_error(self, mock_sleep):  # pylint: disable=unused-argument
+        """Test that a query failing every retry raises JiraQueryError"""
+        async with _client(lambda request: httpx.Response(500)) as client:
+            with self.assertRaises(JiraQueryError):
+                await client.query_issues("project = TEST")
+
+    async def test_add_label(self):
+        """Test adding a label sends an update operation"""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(204)
+
+        async with _client(handler) as client:
+            await client.add_label({"key": "TEST-1"}, "new_label")
+
+        self.assertEqual(requests[0].method, "PUT")
+        self.assertEqual(requests[0].url.path, "/rest/api/2/issue/TEST-1")
+        self.assertEqual(
+            json.loads(requests[0].content),
+            {"update": {"labels": [{"add": "new_label"}]}}
+        )
+
+    async def test_transition_issue(self):
+        """Test transitioning an issue by name"""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if request.method == "GET":
+                return httpx.Response(200, json={"transitions": [
+                    {"id": "1", "name": "To Do"},
+                    {"id": "2", "name": "Done"},
+                ]})
+            return httpx.Response(204)
+
+        async with _client(handler) as client:
+            await client.transition_issue("TEST-1", "done")
+            with self.assertRaises(JiraUpdateError):
+                await client.transition_issue("TEST-1", "NonExistent")
+
+        self.assertEqual(json.loads(requests[1].content), {"transition": {"id": "2"}})
+
+    async def test_concurrent_operations(self):
+        """Test that many issue operations can run concurrently"""
+        paths = []
+
+        def handler(request):
+            paths.append(request.url.path)
+            return httpx.Response(201, json={"id": "1"})
+
+        async with _client(handler) as client:
+            await asyncio.gather(
+                *(client.add_comment(f"TEST-{i}", "Reviewed") for i in range(50))
+            )
+
+        self.assertEqual(
+            sorted(paths),
+            sorted(f"/rest/api/2/issue/TEST-{i}/comment" for i in range(50))
+        )
+
+    async def test_create_issue(self):
+        """Test creating an issue"""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(201, json={"id": "10001", "key": "TEST-1"})
+
+        async with _client(handler) as client:
+            issue = await client.create_issue(
+                "TEST", "Summary", "Description", labels=["regression"]
+            )
+
+        self.assertEqual(issue["key"], "TEST-1")
+        fields = json.loads(requests[0].content)["fields"]
+        self.assertEqual(fields["project"], {"key": "TEST"})
+        self.assertEqual(fields["labels"], ["regression"])
+
+
+if __name__ == "__main__":
+    unittest.main()
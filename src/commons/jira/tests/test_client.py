@@ -1,10 +1,35 @@
 """Tests for JIRA client"""
 
+import importlib.util
+import json
 import unittest
+from types import SimpleNamespace
 from unittest.mock import MagicMock, Mock, patch
 
 from commons.jira.client import JiraClient
-from commons.jira.exceptions import JiraAuthError, JiraUpdateError
+from commons.jira.exceptions import JiraAuthError, JiraQueryError, JiraUpdateError
+from commons.jira.records import IssueRecord
+from commons.jira.store import IssueStore
+
+
+def _jira_url(path):
+    """Build a REST API URL the way JIRA._get_url does"""
+    return f"https://jira.example.com/rest/api/2/{path}"
+
+
+def _label_updates(mock_instance):
+    """Return the label operations PUT through the jira session, by issue key"""
+    return {
+        c.args[0].rsplit("/", 1)[-1]: json.loads(c.kwargs["data"])["update"]["labels"]
+        for c in mock_instance._session.put.call_args_list  # pylint: disable=protected-access
+    }
+
+
+def _updated_issue(key, updated, day="2026-01-01"):
+    """Build a search result whose raw JSON carries an updated timestamp"""
+    issue = Mock()
+    issue.raw = {"key": key, "fields": {"updated": f"{day}T{updated}.000+0000", "summary": key}}
+    return issue
 
 
 class TestJiraClient(unittest.TestCase):
@@ -22,7 +47,8 @@ class TestJiraClient(unittest.TestCase):
         self.assertIsNotNone(client)
         mock_jira.assert_called_once_with(
             server="https://redhat.atlassian.net",
-            basic_auth=("test@example.com", "test_token")
+            basic_auth=("test@example.com", "test_token"),
+            max_retries=0
         )
 
     @patch('commons.jira.client.JIRA')
@@ -37,7 +63,8 @@ class TestJiraClient(unittest.TestCase):
         self.assertIsNotNone(client)
         mock_jira.assert_called_once_with(
             server="https://jira.example.com",
-            basic_auth=("testuser", "testpass")
+            basic_auth=("testuser", "testpass"),
+            max_retries=0
         )
 
     @patch('commons.jira.client.JIRA')
@@ -46,6 +73,52 @@ class TestJiraClient(unittest.TestCase):
         with self.assertRaises(JiraAuthError):
             JiraClient(server="https://jira.example.com")
 
+    @patch('commons.jira.client.JIRA')
+    def test_init_disables_session_retries(self, mock_jira):
+        """Test the jira session does not retry behind the retry policy"""
+        JiraClient(
+            server="https://redhat.atlassian.net",
+            email="test@example.com",
+            api_token="test_token"
+        )
+        JiraClient(server="https://jira.example.com", api_token="test_token")
+
+        for call in mock_jira.call_args_list:
+            self.assertEqual(call.kwargs["max_retries"], 0)
+
+    @patch('commons.jira.client.JIRA')
+    def test_init_with_pool_timeout_and_proxies(self, mock_jira):
+        """Test connection pool, timeout and proxy options reach the session"""
+        mock_instance = MagicMock()
+        mock_jira.return_value = mock_instance
+        configure_session = Mock()
+
+        JiraClient(
+            server="https://jira.example.com",
+            username="testuser",
+            password="testpass",
+            pool_size=16,
+            timeout=(3.05, 30),
+            proxies={"https": "http://proxy.example.com:3128"},
+            configure_session=configure_session
+        )
+
+        mock_jira.assert_called_once_with(
+            server="https://jira.example.com",
+            basic_auth=("testuser", "testpass"),
+            max_retries=0,
+            timeout=(3.05, 30),
+            proxies={"https": "http://proxy.example.com:3128"}
+        )
+        session = mock_instance._session  # pylint: disable=protected-access
+        self.assertEqual(
+            [call.args[0] for call in session.mount.call_args_list],
+            ["https://", "http://"]
+        )
+        adapter = session.mount.call_args_list[0].args[1]
+        self.assertEqual(adapter._pool_maxsize, 16)  # pylint: disable=protected-access
+        configure_session.assert_called_once_with(session)
+
     @patch('commons.jira.client.JIRA')
     def test_query_issues(self, mock_jira):
         """Test querying issues with JQL"""
@@ -70,6 +143,133 @@ class TestJiraClient(unittest.TestCase):
             fields=None
         )
 
+    @patch('commons.jira.client.JIRA')
+    def test_iter_issues_pages_with_start_at(self, mock_jira):
+        """Test iterating issues across pages on an on-premise instance"""
+        mock_instance = MagicMock()
+        mock_jira.return_value = mock_instance
+
+        pages = [[Mock(), Mock()], [Mock(), Mock()], [Mock()]]
+        mock_instance.search_issues.side_effect = pages
+
+        client = JiraClient(
+            server="https://jira.example.com",
+            username="test",
+            password="test"
+        )
+
+        issues = list(client.iter_issues("project = TEST", page_size=2, fields="summary"))
+
+        self.assertEqual(issues, pages[0] + pages[1] + pages[2])
+        start_ats = [c[1]["startAt"] for c in mock_instance.search_issues.call_args_list]
+        self.assertEqual(start_ats, [0, 2, 4])
+        mock_instance.search_issues.assert_called_with(
+            "project = TEST", startAt=4, maxResults=2, fields="summary"
+        )
+
+    @patch('commons.jira.client.JIRA')
+    def test_iter_issues_pages_with_next_page_token(self, mock_jira):
+        """Test iterating issues with nextPageToken on Atlassian Cloud"""
+        mock_instance = MagicMock()
+        mock_jira.return_value = mock_instance
+
+        first_page, second_page = MagicMock(), MagicMock()
+        first_page.__iter__.return_value = iter([Mock(), Mock()])
+        first_page.__len__.return_value = 2
+        first_page.nextPageToken = "token-2"
+        second_page.__iter__.return_value = iter([Mock()])
+        second_page.__len__.return_value = 1
+        second_page.nextPageToken = None
+        mock_instance.enhanced_search_issues.side_effect = [first_page, second_page]
+
+        client = JiraClient(
+            server="https://redhat.atlassian.net",
+            email="test@example.com",
+            api_token="test_token"
+        )
+
+        issues = list(client.iter_issues("project = TEST", page_size=2))
+
+        self.assertEqual(len(issues), 3)
+        tokens = [
+            c[1]["nextPageToken"]
+            for c in mock_instance.enhanced_search_issues.call_args_list
+        ]
+        self.assertEqual(tokens, [None, "token-2"])
+
+    @patch('commons.jira.client.time.sleep')
+    @patch('commons.jira.client.JIRA')
+    def test_iter_issues_retries_failed_page(self, mock_jira, mock_sleep):  # pylint: disable=unused-argument
+        """Test that a flaky page is retried without restarting the scan"""
+        from jira.exceptions import JIRAError
+
+        mock_instance = MagicMock()
+        mock_jira.return_value = mock_instance
+
+        first_page, second_page = [Mock(), Mock()], [Mock()]
+        mock_instance.search_issues.side_effect = [
+            first_page, JIRAError("flaky"), second_page
+        ]
+
+        client = JiraClient(
+            server="https://jira.example.com",
+            username="test",
+            password="test"
+        )
+
+        issues = list(client.iter_issues("project = TEST", page_size=2))
+
+        self.assertEqual(issues, first_page + second_page)
+        start_ats = [c[1]["startAt"] for c in mock_instance.search_issues.call_args_list]
+        self.assertEqual(start_ats, [0, 2, 2])
+
+    @patch('commons.jira.client.time.sleep')
+    @patch('commons.jira.client.JIRA')
+    def test_iter_issues_raises_query_error(self, mock_jira, mock_sleep):  # pylint: disable=unused-argument
+        """Test that a page failing every retry raises JiraQueryError"""
+        from jira.exceptions import JIRAError
+
+        mock_instance = MagicMock()
+        mock_jira.return_value = mock_instance
+        mock_instance.search_issues.side_effect = JIRAError("down")
+
+        client = JiraClient(
+            server="https://jira.example.com",
+            username="test",
+            password="test"
+        )
+
+        with self.assertRaises(JiraQueryError):
+            list(client.iter_issues("project = TEST"))
+
+    @patch('commons.jira.client.JIRA')
+    def test_query_all_issues_prefetches_pages(self, mock_jira):
+        """Test that remaining pages are prefetched concurrently and kept in order"""
+        from jira.client import ResultList
+
+        mock_instance = MagicMock()
+        mock_jira.return_value = mock_instance
+
+        issues_by_offset = {start: [Mock(), Mock()] for start in range(0, 10, 2)}
+
+        def search(jql, startAt, maxResults, fields):  # pylint: disable=unused-argument
+            return ResultList(issues_by_offset[startAt], _startAt=startAt, _total=10)
+
+        mock_instance.search_issues.side_effect = search
+
+        client = JiraClient(
+            server="https://jira.example.com",
+            username="test",
+            password="test"
+        )
+
+        issues = client.query_all_issues("project = TEST", page_size=2, max_workers=3)
+
+        expected = [issue for start in range(0, 10, 2) for issue in issues_by_offset[start]]
+        self.assertEqual(issues, expected)
+        start_ats = sorted(c[1]["startAt"] for c in mock_instance.search_issues.call_args_list)
+        self.assertEqual(start_ats, [0, 2, 4, 6, 8])
+
     @patch('commons.jira.client.JIRA')
     def test_get_issues_by_status(self, mock_jira):
         """Test getting issues by status"""
@@ -92,11 +292,96 @@ class TestJiraClient(unittest.TestCase):
         self.assertIn('status = "New"', jql)
         self.assertIn('component = "TestComponent"', jql)
 
+    @patch('commons.jira.client.JIRA')
+    def test_get_issues_by_label_lean_projection(self, mock_jira):
+        """Test helpers pass field projections and can return lean records"""
+        mock_instance = MagicMock()
+        mock_jira.return_value = mock_instance
+        mock_instance.search_issues.return_value = {
+            "startAt": 0, "maxResults": 100, "total": 1,
+            "issues": [{"id": "10001", "key": "TEST-1", "fields": {"summary": "Slow"}}],
+        }
+
+        client = JiraClient(
+            server="https://jira.example.com",
+            username="test",
+            password="test"
+        )
+
+        issues = client.get_issues_by_label("TEST", "perf", fields="summary", lean=True)
+
+        self.assertIsInstance(issues[0], IssueRecord)
+        self.assertEqual((issues[0].key, issues[0].id), ("TEST-1", "10001"))
+        self.assertEqual(issues[0].get("summary"), "Slow")
+        self.assertFalse(hasattr(issues[0], "__dict__"))
+        mock_instance.search_issues.assert_called_once_with(
+            'project = TEST AND labels = "perf"',
+            startAt=0,
+            maxResults=100,
+            fields="summary",
+            json_result=True
+        )
+
+    @patch('commons.jira.client.JIRA')
+    def test_query_issues_lean_pages_to_max_results(self, mock_jira):
+        """Test lean queries and scans page past the server's page size"""
+        mock_instance = MagicMock()
+        mock_jira.return_value = mock_instance
+
+        def search(jql, startAt, maxResults, fields, json_result):  # pylint: disable=invalid-name,unused-argument
+            keys = range(startAt, min(startAt + 2, 5))
+            return {
+                "startAt": startAt, "maxResults": 2, "total": 5,
+                "issues": [{"id": str(i), "key": f"TEST-{i}"} for i in keys],
+            }
+
+        mock_instance.search_issues.side_effect = search
+
+        client = JiraClient(
+            server="https://jira.example.com",
+            username="test",
+            password="test"
+        )
+
+        issues = client.query_issues("project = TEST", max_results=3, lean=True)
+
+        self.assertEqual([i.key for i in issues], ["TEST-0", "TEST-1", "TEST-2"])
+        self.assertEqual(
+            [c.kwargs["startAt"] for c in mock_instance.search_issues.call_args_list],
+            [0, 2]
+        )
+        self.assertEqual(mock_instance.search_issues.call_args.kwargs["maxResults"], 1)
+
+        # A page shorter than page_size is not the end while the total is unmet
+        scanned = client.iter_issues("project = TEST", page_size=500, lean=True)
+        self.assertEqual([i.key for i in scanned], [f"TEST-{i}" for i in range(5)])
+
+    @patch('commons.jira.client.JIRA')
+    def test_default_fields(self, mock_jira):
+        """Test the client's default field projection applies when none is given"""
+        mock_instance = MagicMock()
+        mock_jira.return_value = mock_instance
+        mock_instance.search_issues.return_value = []
+
+        client = JiraClient(
+            server="https://jira.example.com",
+            username="test",
+            password="test",
+            default_fields="summary,status"
+        )
+
+        client.get_issues_by_status("TEST", "New")
+        self.assertEqual(mock_instance.search_issues.call_args[1]["fields"], "summary,status")
+
+        list(client.iter_issues("project = TEST", fields="labels"))
+        self.assertEqual(mock_instance.search_issues.call_args[1]["fields"], "labels")
+
     @patch('commons.jira.client.JIRA')
     def test_add_label(self, mock_jira):
         """Test adding a label to an issue"""
         mock_instance = MagicMock()
         mock_jira.return_value = mock_instance
+        mock_instance._get_url.side_effect = _jira_url  # pylint: disable=protected-access
 
         client = JiraClient(
             server="https://jira.example.com",
@@ -104,16 +389,131 @@ class TestJiraClient(unittest.TestCase):
             password="test"
         )
 
-        mock_issue = Mock()
+        mock_issue = Mock(key="TEST-1")
         mock_issue.fields.labels = ["existing_label"]
-        mock_issue.update = Mock()
 
         client.add_label(mock_issue, "new_label")
 
-        mock_issue.update.assert_called_once()
-        call_args = mock_issue.update.call_args
-        self.assertIn("new_label", call_args[1]["fields"]["labels"])
-        self.assertIn("existing_label", call_args[1]["fields"]["labels"])
+        mock_instance._session.put.assert_called_once_with(  # pylint: disable=protected-access
+            _jira_url("issue/TEST-1"),
+            data='{"update": {"labels": [{"add": "new_label"}]}}'
+        )
+        mock_issue.update.assert_not_called()
+        mock_instance.issue.assert_not_called()
+
+    @patch('commons.jira.client.JIRA')
+    def test_update_labels_single_request(self, mock_jira):
+        """Test several label changes are combined into one update request"""
+        mock_instance = MagicMock()
+        mock_jira.return_value = mock_instance
+        mock_instance._get_url.side_effect = _jira_url  # pylint: disable=protected-access
+
+        client = JiraClient(
+            server="https://jira.example.com",
+            username="test",
+            password="test"
+        )
+
+        client.update_labels(Mock(key="TEST-1"), add=["a", "b"], remove=["c"])
+        client.update_labels(Mock(key="TEST-1"))
+
+        self.assertEqual(mock_instance._session.put.call_count, 1)  # pylint: disable=protected-access
+        self.assertEqual(
+            _label_updates(mock_instance),
+            {"TEST-1": [{"add": "a"}, {"add": "b"}, {"remove": "c"}]}
+        )
+
+    @patch('commons.jira.client.time.sleep')
+    @patch('commons.jira.client.JIRA')
+    def test_add_labels_bulk(self, mock_jira, mock_sleep):  # pylint: disable=unused-argument
+        """Test bulk labeling skips labeled issues and reports failures"""
+        from jira.exceptions import JIRAError
+
+        mock_instance = MagicMock()
+        mock_jira.return_value = mock_instance
+
+        client = JiraClient(
+            server="https://jira.example.com",
+            username="test",
+            password="test"
+        )
+
+        labeled, unlabeled, broken = Mock(), Mock(), Mock()
+        labeled.key, unlabeled.key, broken.key = "TEST-1", "TEST-2", "TEST-3"
+        labeled.fields.labels = ["a", "b"]
+        unlabeled.fields.labels = ["a"]
+        broken.fields.labels = []
+
+        def put(url, data):  # pylint: disable=unused-argument
+            if url.endswith("TEST-3"):
+                raise JIRAError("forbidden")
+
+        mock_instance._get_url.side_effect = _jira_url  # pylint: disable=protected-access
+        mock_instance._session.put.side_effect = put  # pylint: disable=protected-access
+
+        report = client.add_labels_bulk([labeled, unlabeled, broken], ["a", "b"], max_workers=2)
+
+        self.assertEqual(list(report), ["TEST-1", "TEST-2", "TEST-3"])
+        self.assertEqual(report["TEST-1"]["status"], "skipped")
+        self.assertEqual(report["TEST-2"], {"status": "updated", "error": None})
+        self.assertEqual(report["TEST-3"]["status"], "failed")
+        self.assertIn("forbidden", report["TEST-3"]["error"])
+        updates = _label_updates(mock_instance)
+        self.assertNotIn("TEST-1", updates)
+        self.assertEqual(updates["TEST-2"], [{"add": "b"}])
+
+    @patch('commons.jira.client.JIRA')
+    def test_remove_labels_bulk_from_jql(self, mock_jira):
+        """Test bulk label removal from issues selected by JQL"""
+        mock_instance = MagicMock()
+        mock_jira.return_value = mock_instance
+
+        mock_instance._get_url.side_effect = _jira_url  # pylint: disable=protected-access
+        mock_instance.search_issues.return_value = {
+            "startAt": 0, "maxResults": 100, "total": 2,
+            "issues": [
+                {"key": "TEST-1", "fields": {"labels": ["stale", "keep"]}},
+                {"key": "TEST-2", "fields": {"labels": ["keep"]}},
+            ],
+        }
+
+        client = JiraClient(
+            server="https://jira.example.com",
+            username="test",
+            password="test"
+        )
+
+        report = client.remove_labels_bulk("project = TEST", "stale")
+
+        self.assertEqual(report["TEST-1"]["status"], "updated")
+        self.assertEqual(report["TEST-2"]["status"], "skipped")
+        self.assertEqual(_label_updates(mock_instance), {"TEST-1": [{"remove": "stale"}]})
+        self.assertEqual(mock_instance.search_issues.call_args[1]["fields"], "labels")
+        self.assertTrue(mock_instance.search_issues.call_args[1]["json_result"])
+
+    @patch('commons.jira.client.JIRA')
+    def test_remove_labels_bulk_without_loaded_labels(self, mock_jira):
+        """Test bulk label removal sends the operation when labels were not loaded"""
+        mock_instance = MagicMock()
+        mock_jira.return_value = mock_instance
+
+        client = JiraClient(
+            server="https://jira.example.com",
+            username="test",
+            password="test"
+        )
+
+        mock_instance._get_url.side_effect = _jira_url  # pylint: disable=protected-access
+        projected = Mock(key="TEST-1", fields=SimpleNamespace(summary="x"))
+        record = IssueRecord("TEST-2", "2", {"summary": "x"})
+        report = client.remove_labels_bulk([projected, record], "stale")
+
+        self.assertEqual(report["TEST-1"], {"status": "updated", "error": None})
+        self.assertEqual(report["TEST-2"], {"status": "updated", "error": None})
+        self.assertEqual(
+            _label_updates(mock_instance),
+            {"TEST-1": [{"remove": "stale"}], "TEST-2": [{"remove": "stale"}]}
+        )
 
     @patch('commons.jira.client.JIRA')
     def test_transition_issue(self, mock_jira):
@@ -161,6 +561,167 @@ class TestJiraClient(unittest.TestCase):
         with self.assertRaises(JiraUpdateError):
             client.transition_issue(mock_issue, "NonExistent")
 
+    @patch('commons.jira.client.JIRA')
+    def test_transition_issue_uses_cache(self, mock_jira):
+        """Test transition IDs are cached per project, issue type and status"""
+        mock_instance = MagicMock()
+        mock_jira.return_value = mock_instance
+        mock_instance.transitions.return_value = [
+            {"id": "1", "name": "To Do"},
+            {"id": "2", "name": "Done"}
+        ]
+
+        client = JiraClient(
+            server="https://jira.example.com",
+            username="test",
+            password="test"
+        )
+
+        issues = []
+        for i in range(3):
+            issue = Mock()
+            issue.key = f"TEST-{i}"
+            issue.fields.project.key = "TEST"
+            issue.fields.issuetype.name = "Bug"
+            issue.fields.status.name = "New"
+            issues.append(issue)
+
+        for issue in issues:
+            client.transition_issue(issue, "Done")
+
+        mock_instance.transitions.assert_called_once()
+        self.assertEqual(mock_instance.transition_issue.call_count, 3)
+
+        # These transitions carry no 'to' status, so the status issues[0] moved
+        # to is unknown and its transitions are looked up uncached
+        mock_instance.transitions.return_value = [{"id": "3", "name": "Verified"}]
+        client.transition_issue(issues[0], "Verified")
+        self.assertEqual(mock_instance.transitions.call_count, 2)
+        mock_instance.transition_issue.assert_called_with(issues[0], "3")
+
+    @patch('commons.jira.client.time.sleep')
+    @patch('commons.jira.client.JIRA')
+    def test_transition_issue_failure_invalidates_cache(self, mock_jira, mock_sleep):  # pylint: disable=unused-argument
+        """Test a rejected cached transition is looked up again once"""
+        from jira.exceptions import JIRAError
+
+        mock_instance = MagicMock()
+        mock_jira.return_value = mock_instance
+        mock_instance.transitions.return_value = [{"id": "2", "name": "Done"}]
+
+        client = JiraClient(
+            server="https://jira.example.com",
+            username="test",
+            password="test"
+        )
+
+        issues = []
+        for i in range(3):
+            issue = Mock()
+            issue.key = f"TEST-{i}"
+            issue.fields.project.key = "TEST"
+            issue.fields.issuetype.name = "Bug"
+            issue.fields.status.name = "New"
+            issues.append(issue)
+        client.transition_issue(issues[0], "Done")
+
+        # The workflow changed: the cached ID is rejected, a fresh one works
+        mock_instance.transitions.return_value = [{"id": "5", "name": "Done"}]
+        mock_instance.transition_issue.side_effect = [
+            JIRAError("invalid transition", status_code=400), None
+        ]
+        client.transition_issue(issues[1], "Done")
+        self.assertEqual(mock_instance.transitions.call_count, 2)
+        mock_instance.transition_issue.assert_called_with(issues[1], "5")
+
+        # A fresh lookup that is rejected too fails and drops the entry
+        mock_instance.transition_issue.side_effect = JIRAError(
+            "invalid transition", status_code=400
+        )
+        with self.assertRaises(JiraUpdateError):
+            client.transition_issue(issues[2], "Done")
+        self.assertEqual(mock_instance.transitions.call_count, 3)
+
+        mock_instance.transition_issue.side_effect = None
+        client.transition_issue(issues[2], "Done")
+        self.assertEqual(mock_instance.transitions.call_count, 4)
+
+    @patch('commons.jira.client.JIRA')
+    def test_transition_same_issue_twice(self, mock_jira):
+        """Test a second transition of one issue object is keyed by its new status"""
+        mock_instance = MagicMock()
+        mock_jira.return_value = mock_instance
+        new_transitions = [
+            {"id": "11", "name": "Start", "to": {"name": "In Progress"}}
+        ]
+        in_progress_transitions = [
+            {"id": "21", "name": "Close", "to": {"name": "Closed"}}
+        ]
+        mock_instance.transitions.side_effect = [
+            new_transitions, in_progress_transitions
+        ]
+
+        client = JiraClient(
+            server="https://jira.example.com",
+            username="test",
+            password="test"
+        )
+
+        issues = []
+        for i in range(2):
+            issue = Mock()
+            issue.key = f"TEST-{i}"
+            issue.fields.project.key = "TEST"
+            issue.fields.issuetype.name = "Bug"
+            issue.fields.status.name = "New"
+            issues.append(issue)
+
+        client.transition_issue(issues[0], "Start")
+        client.transition_issue(issues[0], "Close")
+        client.transition_issue(issues[1], "Start")
+
+        self.assertEqual(mock_instance.transitions.call_count, 2)
+        self.assertEqual(
+            [c.args[1] for c in mock_instance.transition_issue.call_args_list],
+            ["11", "21", "11"],
+        )
+
+    @patch('commons.jira.client.JIRA')
+    def test_transition_fresh_object_uses_its_own_status(self, mock_jira):
+        """Test a remembered status only applies to the object that was transitioned"""
+        mock_instance = MagicMock()
+        mock_jira.return_value = mock_instance
+        mock_instance.transitions.side_effect = [
+            [{"id": "11", "name": "Start", "to": {"name": "In Progress"}}],
+            [{"id": "21", "name": "Close", "to": {"name": "Closed"}}],
+        ]
+
+        client = JiraClient(
+            server="https://jira.example.com",
+            username="test",
+            password="test"
+        )
+
+        def new_issue():
+            issue = Mock()
+            issue.key = "TEST-1"
+            issue.fields.project.key = "TEST"
+            issue.fields.issuetype.name = "Bug"
+            issue.fields.status.name = "New"
+            return issue
+
+        first = new_issue()
+        client.transition_issue(first, "Start")
+        # The issue was moved back to New elsewhere and reloaded
+        client.transition_issue(new_issue(), "Start")
+        client.transition_issue(first, "Close")
+
+        self.assertEqual(mock_instance.transitions.call_count, 2)
+        self.assertEqual(
+            [c.args[1] for c in mock_instance.transition_issue.call_args_list],
+            ["11", "11", "21"],
+        )
+
     @patch('commons.jira.client.JIRA')
     def test_add_comment(self, mock_jira):
         """Test adding a comment to an issue"""
@@ -198,5 +759,367 @@ class TestJiraClient(unittest.TestCase):
         self.assertEqual(client.get_field_value(mock_issue, "summary"), "Test summary")
 
 
+    @patch('commons.jira.client.JIRA')
+    def test_get_field_value_custom_field_cached(self, mock_jira):
+        """Test that custom field lookups reuse the cached field index"""
+        mock_instance = MagicMock()
+        mock_jira.return_value = mock_instance
+        mock_instance.fields.return_value = [
+            {"id": "summary", "name": "Summary"},
+            {"id": "customfield_100", "name": "Priority Score"},
+        ]
+
+        client = JiraClient(
+            server="https://jira.example.com",
+            username="test",
+            password="test"
+        )
+
+        mock_issue = Mock()
+        mock_issue.fields.customfield_100 = 42
+
+        self.assertEqual(client.get_field_value(mock_issue, "Priority Score"), 42)
+        self.assertEqual(client.get_field_value(mock_issue, "priority score"), 42)
+        self.assertIsNone(client.get_field_value(mock_issue, "Unknown Field"))
+        mock_instance.fields.assert_called_once()
+
+    @patch('commons.jira.client.JIRA')
+    def test_get_field_value_record(self, mock_jira):
+        """Test reading built-in and custom fields of a lean record"""
+        mock_instance = MagicMock()
+        mock_jira.return_value = mock_instance
+        mock_instance.fields.return_value = [{"id": "customfield_100", "name": "Priority Score"}]
+
+        client = JiraClient(
+            server="https://jira.example.com",
+            username="test",
+            password="test"
+        )
+
+        record = IssueRecord("TEST-1", "1", {
+            "summary": "Test summary",
+            "status": {"name": "Open"},
+            "assignee": None,
+            "customfield_100": 42,
+        })
+
+        self.assertEqual(client.get_field_value(record, "summary"), "Test summary")
+        self.assertEqual(client.get_field_value(record, "status"), "Open")
+        self.assertIsNone(client.get_field_value(record, "assignee"))
+        self.assertIsNone(client.get_field_value(record, "description"))
+        self.assertEqual(client.get_field_value(record, "Priority Score"), 42)
+
+    @patch('commons.jira.client.JIRA')
+    def test_label_and_comment_records(self, mock_jira):
+        """Test label updates and comments on lean records go through the issue key"""
+        mock_instance = MagicMock()
+        mock_jira.return_value = mock_instance
+        mock_instance._get_url.side_effect = _jira_url  # pylint: disable=protected-access
+
+        client = JiraClient(
+            server="https://jira.example.com",
+            username="test",
+            password="test"
+        )
+
+        labeled = IssueRecord("TEST-1", "1", {"labels": ["a", "b"]})
+        unlabeled = IssueRecord("TEST-2", "2", {"labels": ["a"]})
+        report = client.add_labels_bulk([labeled, unlabeled], ["a", "b"])
+        client.add_comment(labeled, "Test comment")
+
+        self.assertEqual(report["TEST-1"]["status"], "skipped")
+        self.assertEqual(report["TEST-2"], {"status": "updated", "error": None})
+        mock_instance.issue.assert_not_called()
+        mock_instance._session.put.assert_called_once_with(  # pylint: disable=protected-access
+            _jira_url("issue/TEST-2"),
+            data='{"update": {"labels": [{"add": "b"}]}}'
+        )
+        mock_instance.add_comment.assert_called_once_with("TEST-1", "Test comment")
+
+    @patch('commons.jira.client.JIRA')
+    def test_transition_records(self, mock_jira):
+        """Test transitioning lean records by key with the shared transition cache"""
+        mock_instance = MagicMock()
+        mock_jira.return_value = mock_instance
+        mock_instance.transitions.return_value = [{"id": "31", "name": "Done"}]
+
+        client = JiraClient(
+            server="https://jira.example.com",
+            username="test",
+            password="test"
+        )
+
+        fields = {
+            "project": {"key": "TEST"},
+            "issuetype": {"name": "Bug"},
+            "status": {"name": "Open"},
+        }
+        client.transition_issue(IssueRecord("TEST-1", "1", dict(fields)), "Done")
+        client.transition_issue(IssueRecord("TEST-2", "2", dict(fields)), "done")
+
+        mock_instance.transitions.assert_called_once_with("TEST-1")
+        self.assertEqual(
+            [c.args for c in mock_instance.transition_issue.call_args_list],
+            [("TEST-1", "31"), ("TEST-2", "31")],
+        )
+
+    @patch('commons.jira.client.JIRA')
+    def test_resolve_field_ids_refresh_and_ttl(self, mock_jira):
+        """Test bulk field resolution with forced refresh and TTL expiry"""
+        mock_instance = MagicMock()
+        mock_jira.return_value = mock_instance
+        mock_instance.fields.return_value = [
+            {"id": "customfield_100", "name": "Priority Score"},
+            {"id": "customfield_200", "name": "Team"},
+        ]
+
+        client = JiraClient(
+            server="https://jira.example.com",
+            username="test",
+            password="test",
+            field_cache_ttl=60
+        )
+
+        resolved = client.resolve_field_ids(["TEAM", "Priority Score", "customfield_200", "Nope"])
+        self.assertEqual(resolved, {
+            "TEAM": "customfield_200",
+            "Priority Score": "customfield_100",
+            "customfield_200": "customfield_200",
+            "Nope": None,
+        })
+        self.assertEqual(mock_instance.fields.call_count, 1)
+
+        client.resolve_field_ids(["Team"], refresh=True)
+        self.assertEqual(mock_instance.fields.call_count, 2)
+
+        with patch('commons.jira.client.time.monotonic', return_value=10**9):
+            client.resolve_field_ids(["Team"])
+        self.assertEqual(mock_instance.fields.call_count, 3)
+
+    def _columnar_client(self, mock_jira):
+        """Build a client whose search returns two raw issues"""
+        mock_instance = MagicMock()
+        mock_jira.return_value = mock_instance
+        mock_instance.fields.return_value = [
+            {"id": "status", "name": "Status"},
+            {"id": "assignee", "name": "Assignee"},
+            {"id": "customfield_100", "name": "Team"},
+        ]
+        first, second = Mock(), Mock()
+        first.raw = {"key": "TEST-1", "fields": {
+            "status": {"name": "New"},
+            "assignee": {"name": "jdoe", "displayName": "Jane Doe"},
+            "customfield_100": [{"value": "perf"}, {"value": "scale"}],
+        }}
+        second.raw = {"key": "TEST-2", "fields": {
+            "status": {"name": "Closed"},
+            "assignee": None,
+            "customfield_100": None,
+        }}
+        mock_instance.search_issues.return_value = [first, second]
+
+        return mock_instance, JiraClient(
+            server="https://jira.example.com",
+            username="test",
+            password="test"
+        )
+
+    @patch('commons.jira.client.JIRA')
+    def test_query_fields_columns(self, mock_jira):
+        """Test extracting flattened columns with only the requested fields fetched"""
+        mock_instance, client = self._columnar_client(mock_jira)
+
+        columns = client.query_fields("project = TEST", ["Status", "assignee", "Team", "Nope"])
+
+        self.assertEqual(columns, {
+            "key": ["TEST-1", "TEST-2"],
+            "Status": ["New", "Closed"],
+            "assignee": ["Jane Doe", None],
+            "Team": [["perf", "scale"], None],
+            "Nope": [None, None],
+        })
+        self.assertEqual(
+            mock_instance.search_issues.call_args[1]["fields"],
+            "status,assignee,customfield_100"
+        )
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "numpy not installed")
+    @patch('commons.jira.client.JIRA')
+    def test_query_fields_numpy(self, mock_jira):
+        """Test extracting columns into a NumPy structured array"""
+        _, client = self._columnar_client(mock_jira)
+
+        records = client.query_fields("project = TEST", ["Status"], output="numpy")
+
+        self.assertEqual(records.dtype.names, ("key", "Status"))
+        self.assertEqual(list(records["Status"]), ["New", "Closed"])
+
+    @patch('commons.jira.client.JIRA')
+    def test_query_fields_invalid_output(self, mock_jira):
+        """Test that an unsupported output format raises ValueError"""
+        _, client = self._columnar_client(mock_jira)
+
+        with self.assertRaises(ValueError):
+            client.query_fields("project = TEST", ["Status"], output="csv")
+
+    @patch('commons.jira.client.time.sleep')
+    @patch('commons.jira.client.JIRA')
+    def test_create_issues_bulk(self, mock_jira, mock_sleep):  # pylint: disable=unused-argument
+        """Test bulk creation batches specs and retries only rejected items"""
+        mock_instance = MagicMock()
+        mock_jira.return_value = mock_instance
+
+        def created(key):
+            issue = Mock()
+            issue.key = key
+            return {"status": "Success", "issue": issue}
+
+        rejected = {"status": "Error", "error": {"summary": "rate limited"}, "issue": None}
+        mock_instance.create_issues.side_effect = [
+            [created("TEST-1"), rejected],
+            [created("TEST-3")],
+            [created("TEST-2")],
+        ]
+
+        client = JiraClient(
+            server="https://jira.example.com",
+            username="test",
+            password="test"
+        )
+
+        specs = [
+            {"project": "TEST", "summary": f"Regression {i}", "description": "..."}
+            for i in range(3)
+        ]
+        keys = client.create_issues_bulk(specs, batch_size=2)
+
+        self.assertEqual(keys, ["TEST-1", "TEST-2", "TEST-3"])
+        batches = [c[0][0] for c in mock_instance.create_issues.call_args_list]
+        self.assertEqual([len(b) for b in batches], [2, 1, 1])
+        self.assertEqual(batches[2][0]["summary"], "Regression 1")
+        self.assertEqual(batches[0][0]["issuetype"], {"name": "Bug"})
+
+    @patch('commons.jira.client.JIRA')
+    def test_create_issues_bulk_invalid_spec(self, mock_jira):
+        """Test that a spec without required arguments raises JiraUpdateError"""
+        mock_jira.return_value = MagicMock()
+
+        client = JiraClient(
+            server="https://jira.example.com",
+            username="test",
+            password="test"
+        )
+
+        with self.assertRaises(JiraUpdateError):
+            client.create_issues_bulk([{"project": "TEST"}])
+
+    @patch('commons.jira.client.JIRA')
+    def test_sync_issues_incremental(self, mock_jira):
+        """Test sync fetches only issues updated since the high-water mark"""
+        mock_instance = MagicMock()
+        mock_jira.return_value = mock_instance
+        mock_instance.myself.return_value = {"timeZone": "America/New_York"}
+
+        client = JiraClient(
+            server="https://jira.example.com",
+            username="test",
+            password="test"
+        )
+
+        with IssueStore() as store:
+            mock_instance.search_issues.return_value = [
+                _updated_issue("TEST-1", "10:00:00"),
+                _updated_issue("TEST-2", "12:30:00", day="2026-01-02"),
+            ]
+            self.assertEqual(
+                client.sync_issues("project = TEST ORDER BY key", store, fields="summary"), 2
+            )
+            jql = mock_instance.search_issues.call_args[0][0]
+            self.assertEqual(jql, "project = TEST ORDER BY updated ASC")
+            self.assertEqual(
+                mock_instance.search_issues.call_args[1]["fields"], "summary,updated"
+            )
+
+            mock_instance.search_issues.return_value = [
+                _updated_issue("TEST-2", "08:00:00", day="2026-01-03"),
+            ]
+            self.assertEqual(client.sync_issues("project = TEST ORDER BY key", store), 1)
+            jql = mock_instance.search_issues.call_args[0][0]
+            self.assertEqual(
+                jql,
+                '(project = TEST) AND updated >= "2026/01/02 07:29" ORDER BY updated ASC'
+            )
+
+            self.assertEqual(len(store), 2)
+            self.assertEqual(
+                store.get("TEST-2")["fields"]["updated"], "2026-01-03T08:00:00.000+0000"
+            )
+            self.assertEqual(
+                store.get_high_water_mark("project = TEST ORDER BY key"),
+                "2026-01-03T08:00:00.000+0000"
+            )
+
+    @patch('commons.jira.client.JIRA')
+    def test_sync_issues_restarts_from_cursor(self, mock_jira):
+        """Test sync pages with an updated cursor so shifted rows are not skipped"""
+        mock_instance = MagicMock()
+        mock_jira.return_value = mock_instance
+        mock_instance.myself.return_value = {"timeZone": "UTC"}
+
+        # TEST-1 is updated while the scan runs and moves to the end
+        mock_instance.search_issues.side_effect = [
+            [_updated_issue("TEST-1", "10:00:00"), _updated_issue("TEST-2", "10:05:00")],
+            [_updated_issue("TEST-2", "10:05:00"), _updated_issue("TEST-3", "10:10:00")],
+            [_updated_issue("TEST-3", "10:10:00"), _updated_issue("TEST-1", "10:20:00")],
+            [_updated_issue("TEST-1", "10:20:00")],
+        ]
+
+        client = JiraClient(
+            server="https://jira.example.com",
+            username="test",
+            password="test"
+        )
+
+        with IssueStore() as store:
+            self.assertEqual(client.sync_issues("project = TEST", store, page_size=2), 4)
+
+            calls = mock_instance.search_issues.call_args_list
+            self.assertEqual([c.kwargs["startAt"] for c in calls], [0, 0, 0, 0])
+            self.assertEqual(
+                calls[1].args[0],
+                '(project = TEST) AND updated >= "2026/01/01 10:04" ORDER BY updated ASC'
+            )
+            self.assertEqual(len(store), 3)
+            self.assertEqual(
+                store.get("TEST-1")["fields"]["updated"], "2026-01-01T10:20:00.000+0000"
+            )
+            self.assertEqual(
+                store.get_high_water_mark("project = TEST"), "2026-01-01T10:20:00.000+0000"
+            )
+
+    @patch('commons.jira.client.JIRA')
+    def test_sync_issues_pages_within_same_minute(self, mock_jira):
+        """Test sync follows offsets while a page brings no newer timestamp"""
+        mock_instance = MagicMock()
+        mock_jira.return_value = mock_instance
+        mock_instance.myself.return_value = {"timeZone": "UTC"}
+
+        first = [_updated_issue("TEST-1", "10:00:01"), _updated_issue("TEST-2", "10:00:02")]
+        mock_instance.search_issues.side_effect = [
+            first, first, [_updated_issue("TEST-3", "10:00:02")]
+        ]
+
+        client = JiraClient(
+            server="https://jira.example.com",
+            username="test",
+            password="test"
+        )
+
+        with IssueStore() as store:
+            self.assertEqual(client.sync_issues("project = TEST", store, page_size=2), 3)
+            calls = mock_instance.search_issues.call_args_list
+            self.assertEqual([c.kwargs["startAt"] for c in calls], [0, 0, 2])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,67 @@
+"""Tests for lazy loading of the jira library"""
+
+import unittest
+
+from commons.tests.helpers import import_time, run_python
+
+
+class TestLazyImports(unittest.TestCase):
+    """Test that importing commons.jira does not import heavy dependencies"""
+
+    def test_import_does_not_load_jira_or_httpx(self):
+        """Test the package and its exceptions import without jira or httpx"""
+        output = run_python(
+            "import sys\n"
+            "from commons.jira import JiraClient, JiraAuthError\n"
+            "from commons.jira.client import JIRA_AVAILABLE\n"
+            "print(JIRA_AVAILABLE, 'jira' in sys.modules, 'httpx' in sys.modules)"
+        )
+
+        self.assertEqual(output, "True False False")
+
+    def test_building_client_loads_jira(self):
+        """Test the jira library is imported when a JiraClient is built"""
+        output = run_python(
+            "import sys\n"
+            "from commons.jira import JiraClient, JiraAuthError\n"
+            "try:\n"
+            "    JiraClient(server='https://jira.example.com')\n"
+            "except JiraAuthError:\n"
+            "    pass\n"
+            "print('jira' in sys.modules)"
+        )
+
+        self.assertEqual(output, "True")
+
+    def test_client_module_exposes_jira_names(self):
+        """Test jira names on the client module resolve before a client is built"""
+        output = run_python(
+            "from commons.jira import client\n"
+            "try:\n"
+            "    raise client.JIRAError('boom')\n"
+            "except client.JIRAError:\n"
+            "    print(client.JIRA.__name__, client.Issue.__name__)"
+        )
+
+        self.assertEqual(output, "JIRA Issue")
+
+    def test_async_client_still_exported(self):
+        """Test AsyncJiraClient is importable from the package on demand"""
+        output = run_python(
+            "from commons.jira import AsyncJiraClient\n"
+            "print(AsyncJiraClient.__module__)"
+        )
+
+        self.assertEqual(output, "commons.jira.async_client")
+
+    def test_import_time_below_jira(self):
+        """Benchmark: importing commons.jira is cheaper than importing jira"""
+        package_time = import_time("commons.jira")
+        jira_time = import_time("jira")
+
+        self.assertIsNotNone(package_time)
+        self.assertLess(package_time, jira_time)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,191 @@
+"""Tests for JIRA retry policy and rate limiting"""
+
+import unittest
+from unittest.mock import MagicMock, Mock, patch
+
+import requests
+from jira.exceptions import JIRAError
+
+from commons.jira.client import JiraClient
+from commons.jira.exceptions import JiraQueryError
+from commons.jira.retry import RetryPolicy, TokenBucket, parse_retry_after
+
+
+def _jira_error(status_code, headers=None):
+    """Build a JIRAError carrying a status code and response headers"""
+    response = Mock()
+    response.headers = headers or {}
+    return JIRAError("error", status_code=status_code, response=response)
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """Test retry policy classification and delays"""
+
+    def test_is_retryable(self):
+        """Test status code classification"""
+        policy = RetryPolicy()
+
+        self.assertTrue(policy.is_retryable(_jira_error(429)))
+        self.assertTrue(policy.is_retryable(_jira_error(503)))
+        self.assertTrue(policy.is_retryable(JIRAError("connection reset")))
+        self.assertFalse(policy.is_retryable(_jira_error(400)))
+        self.assertFalse(policy.is_retryable(_jira_error(404)))
+
+    def test_compute_delay_decorrelated_jitter(self):
+        """Test jittered delays stay between base delay and max delay"""
+        policy = RetryPolicy(base_delay=1.0, max_delay=10.0)
+
+        delay = 0.0
+        for attempt in range(20):
+            previous = delay
+            delay = policy.compute_delay(attempt, delay)
+            self.assertGreaterEqual(delay, 1.0)
+            self.assertLessEqual(delay, min(10.0, max(1.0, previous * 3)))
+
+    def test_compute_delay_without_jitter(self):
+        """Test plain exponential backoff when jitter is disabled"""
+        policy = RetryPolicy(base_delay=2.0, max_delay=5.0, jitter=False)
+
+        self.assertEqual(
+            [policy.compute_delay(attempt, 0.0) for attempt in range(3)],
+            [2.0, 4.0, 5.0]
+        )
+
+    def test_compute_delay_honors_retry_after(self):
+        """Test the server-requested wait takes precedence"""
+        policy = RetryPolicy(base_delay=1.0)
+
+        self.assertEqual(
+            policy.compute_delay(0, 0.0, _jira_error(429, {"Retry-After": "7"})), 7.0
+        )
+        ignoring = RetryPolicy(base_delay=1.0, respect_retry_after=False)
+        self.assertEqual(
+            ignoring.compute_delay(0, 0.0, _jira_error(429, {"Retry-After": "7"})), 1.0
+        )
+
+    def test_parse_retry_after(self):
+        """Test parsing Retry-After and X-RateLimit-Reset headers"""
+        self.assertEqual(parse_retry_after({"Retry-After": "3"}), 3.0)
+        self.assertEqual(
+            parse_retry_after({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}), 0.0
+        )
+        self.assertEqual(
+            parse_retry_after({"X-RateLimit-Reset": "2015-10-21T07:28:00Z"}), 0.0
+        )
+        self.assertIsNone(parse_retry_after({}))
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test token bucket rate limiter"""
+
+    @patch('commons.jira.retry.time.monotonic', return_value=100.0)
+    def test_reserve_and_pause(self, mock_monotonic):
+        """Test burst capacity, waiting for refill and pausing"""
+        bucket = TokenBucket(rate=2, capacity=2)
+
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertEqual(bucket.reserve(), 0.5)
+
+        mock_monotonic.return_value = 110.0
+        bucket.pause(5)
+        self.assertEqual(bucket.reserve(), 5.0)
+
+
+class TestJiraClientRetry(unittest.TestCase):
+    """Test JiraClient retry integration"""
+
+    @patch('commons.jira.client.time.sleep')
+    @patch('commons.jira.client.JIRA')
+    def test_non_retryable_error_fails_fast(self, mock_jira, mock_sleep):
+        """Test 4xx errors are not retried"""
+        mock_instance = MagicMock()
+        mock_jira.return_value = mock_instance
+        mock_instance.search_issues.side_effect = _jira_error(400)
+
+        client = JiraClient(
+            server="https://jira.example.com",
+            username="test",
+            password="test"
+        )
+
+        with self.assertRaises(JiraQueryError):
+            client.query_issues("project = TEST")
+
+        mock_instance.search_issues.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @patch('commons.jira.client.time.sleep')
+    @patch('commons.jira.client.JIRA')
+    def test_rate_limited_waits_and_pauses_limiter(self, mock_jira, mock_sleep):
+        """Test 429 responses wait for Retry-After and pause the shared limiter"""
+        mock_instance = MagicMock()
+        mock_jira.return_value = mock_instance
+        mock_instance.search_issues.side_effect = [
+            _jira_error(429, {"Retry-After": "12"}), ["issue"]
+        ]
+        limiter = Mock()
+
+        client = JiraClient(
+            server="https://jira.example.com",
+            username="test",
+            password="test",
+            rate_limiter=limiter
+        )
+
+        self.assertEqual(client.query_issues("project = TEST"), ["issue"])
+        mock_sleep.assert_called_once_with(12.0)
+        limiter.pause.assert_called_once_with(12.0)
+        self.assertEqual(limiter.acquire.call_count, 2)
+
+    @patch('commons.jira.client.time.sleep')
+    @patch('commons.jira.client.JIRA')
+    def test_connection_errors_and_timeouts_are_retried(self, mock_jira, mock_sleep):
+        """Test network errors raised by requests go through the retry policy"""
+        mock_instance = MagicMock()
+        mock_jira.return_value = mock_instance
+        mock_instance.search_issues.side_effect = [
+            requests.ConnectionError("reset"), requests.ConnectTimeout("slow"), ["issue"]
+        ]
+
+        client = JiraClient(
+            server="https://jira.example.com",
+            username="test",
+            password="test",
+            retry_policy=RetryPolicy(jitter=False),
+        )
+
+        self.assertEqual(client.query_issues("project = TEST"), ["issue"])
+        self.assertEqual(mock_instance.search_issues.call_count, 3)
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [2.0, 4.0])
+
+    @patch('commons.jira.client.time.sleep')
+    @patch('commons.jira.client.JIRA')
+    def test_retry_attributes_update_policy(self, mock_jira, mock_sleep):
+        """Test max_retries and retry_delay read and write the retry policy"""
+        mock_instance = MagicMock()
+        mock_jira.return_value = mock_instance
+        mock_instance.search_issues.side_effect = _jira_error(503)
+
+        client = JiraClient(
+            server="https://jira.example.com",
+            username="test",
+            password="test",
+            retry_policy=RetryPolicy(jitter=False),
+        )
+        client.max_retries = 5
+        client.retry_delay = 1
+
+        self.assertEqual(client.retry_policy.max_retries, 5)
+        self.assertEqual(client.retry_policy.base_delay, 1)
+        with self.assertRaises(JiraQueryError):
+            client.query_issues("project = TEST")
+
+        self.assertEqual(mock_instance.search_issues.call_count, 5)
+        self.assertEqual(
+            [c.args[0] for c in mock_sleep.call_args_list], [1, 2, 4, 8]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+"""Tests for the local JIRA issue store"""
+
+import os
+import tempfile
+import unittest
+
+from commons.jira.store import IssueStore
+
+
+class TestIssueStore(unittest.TestCase):
+    """Test issue store persistence and queries"""
+
+    def test_upsert_get_and_delete(self):
+        """Test issues are merged by key and can be read back"""
+        with IssueStore() as store:
+            store.upsert([
+                {"key": "TEST-1", "fields": {"updated": "2026-01-01T10:00:00.000+0000"}},
+                {"key": "TEST-2", "fields": {"updated": "2026-01-02T10:00:00.000+0000"}},
+            ])
+            store.upsert([
+                {"key": "TEST-1", "fields": {"updated": "2026-01-03T10:00:00.000+0000"}},
+            ])
+
+            self.assertEqual(len(store), 2)
+            self.assertEqual(
+                [issue["key"] for issue in store.iter_issues()], ["TEST-1", "TEST-2"]
+            )
+            self.assertIsNone(store.get("TEST-3"))
+
+            self.assertEqual(store.delete(["TEST-2"]), 1)
+            self.assertEqual(len(store), 1)
+
+    def test_orders_by_utc_updated(self):
+        """Test issues are ordered by their UTC update time across offsets"""
+        with IssueStore() as store:
+            store.upsert([
+                {"key": "TEST-1", "fields": {"updated": "2026-01-01T10:00:00.000+0200"}},
+                {"key": "TEST-2", "fields": {"updated": "2026-01-01T09:00:00.000+0000"}},
+                {"key": "TEST-3", "fields": {"updated": "2026-01-01T03:30:00.000-0500"}},
+            ])
+
+            self.assertEqual(
+                [issue["key"] for issue in store.iter_issues()],
+                ["TEST-2", "TEST-3", "TEST-1"],
+            )
+
+    def test_persists_high_water_mark(self):
+        """Test issues and high-water marks survive reopening the database"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "issues.db")
+            with IssueStore(path) as store:
+                self.assertIsNone(store.get_high_water_mark("project = TEST"))
+                store.upsert([{"key": "TEST-1", "fields": {}}])
+                store.set_high_water_mark("project = TEST", "2026-01-01T10:00:00.000+0000")
+
+            with IssueStore(path) as store:
+                self.assertEqual(store.get("TEST-1"), {"key": "TEST-1", "fields": {}})
+                self.assertEqual(
+                    store.get_high_water_mark("project = TEST"),
+                    "2026-01-01T10:00:00.000+0000"
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,246 @@
+"""Helpers shared by the JIRA clients"""
+
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from .exceptions import JiraUpdateError
+
+logger = logging.getLogger(__name__)
+
+
+def project_jql(
+    project: str, field: str, value: str, component: Optional[str] = None
+) -> str:
+    """Build a JQL query matching a project, one quoted field value and a component
+
+    Args:
+        project: JIRA project key
+        field: JQL field name (e.g., 'status', 'labels')
+        value: Field value to match
+        component: Optional component filter
+
+    Returns:
+        JQL query string
+    """
+    escaped_value = value.replace('"', '\\"')
+    jql = f'project = {project} AND {field} = "{escaped_value}"'
+    if component:
+        escaped_component = component.replace('"', '\\"')
+        jql += f' AND component = "{escaped_component}"'
+    return jql
+
+
+def build_issue_fields(
+    project: str,
+    summary: str,
+    description: str,
+    issue_type: str = "Bug",
+    component: Optional[str] = None,
+    labels: Optional[List[str]] = None,
+    **extra_fields
+) -> Dict[str, Any]:
+    """Build the fields payload for creating an issue
+
+    Args:
+        project: JIRA project key
+        summary: Issue summary/title
+        description: Issue description
+        issue_type: Issue type (e.g., 'Bug', 'Task', 'Story')
+        component: Optional component name
+        labels: Optional list of labels
+        **extra_fields: Additional fields to set
+
+    Returns:
+        Dictionary of issue fields
+    """
+    fields = {
+        "project": {"key": project},
+        "summary": summary,
+        "description": description,
+        "issuetype": {"name": issue_type},
+    }
+
+    if component:
+        fields["components"] = [{"name": component}]
+
+    if labels:
+        fields["labels"] = labels
+
+    # Add any extra fields
+    fields.update(extra_fields)
+    return fields
+
+
+def label_operations(
+    add: Optional[List[str]] = None, remove: Optional[List[str]] = None
+) -> List[Dict[str, str]]:
+    """Build incremental label update operations
+
+    Args:
+        add: Labels to add
+        remove: Labels to remove
+
+    Returns:
+        List of ``{'add': label}`` and ``{'remove': label}`` operations
+    """
+    operations = [{"add": label} for label in add or []]
+    operations += [{"remove": label} for label in remove or []]
+    return operations
+
+
+def find_transition(
+    transitions: List[Dict[str, Any]], transition_name: str
+) -> Optional[Dict[str, Any]]:
+    """Find a transition by name
+
+    Args:
+        transitions: Transition dictionaries with 'id' and 'name' keys
+        transition_name: Name of transition (case-insensitive)
+
+    Returns:
+        Transition dictionary, or None if no transition has that name
+    """
+    name = transition_name.lower()
+    return next((t for t in transitions if t["name"].lower() == name), None)
+
+
+def transition_not_found(
+    key: str, transition_name: str, transitions: List[Dict[str, Any]]
+) -> JiraUpdateError:
+    """Build the error raised when a transition is not available
+
+    Args:
+        key: Issue key
+        transition_name: Requested transition name
+        transitions: Transitions available for the issue
+
+    Returns:
+        JiraUpdateError listing the available transitions
+    """
+    available = [t["name"] for t in transitions]
+    return JiraUpdateError(
+        f"Transition '{transition_name}' not found for {key}. "
+        f"Available transitions: {available}"
+    )
+
+
+def parse_jira_datetime(value: str) -> datetime:
+    """Parse a JIRA timestamp
+
+    Args:
+        value: Timestamp such as '2024-05-01T10:15:30.000+0000'
+
+    Returns:
+        Timezone-aware datetime
+    """
+    return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z")
+
+
+def flatten_field_value(value: Any) -> Any:
+    """Reduce a raw JSON field value to its display value
+
+    Args:
+        value: Raw field value from the issue JSON
+
+    Returns:
+        displayName, name, value or key of an object, recursing into lists
+    """
+    if isinstance(value, dict):
+        for attr in ("displayName", "name", "value", "key"):
+            if attr in value:
+                return value[attr]
+        return value
+    if isinstance(value, list):
+        return [flatten_field_value(item) for item in value]
+    return value
+
+
+def columns_to_output(columns: Dict[str, List[Any]], output: str) -> Any:
+    """Convert a dict of columns to the requested output format
+
+    Args:
+        columns: Dictionary mapping column names to equal-length lists
+        output: 'dict', 'numpy' or 'pandas'
+
+    Returns:
+        The columns unchanged, a NumPy structured array or a pandas DataFrame
+
+    Raises:
+        ImportError: If numpy or pandas is requested but not installed
+    """
+    if output == "pandas":
+        try:
+            import pandas  # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise ImportError(
+                "pandas not installed. Install with: pip install pandas"
+            ) from e
+        return pandas.DataFrame(columns)
+
+    if output == "numpy":
+        try:
+            import numpy  # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise ImportError(
+                "numpy not installed. Install with: pip install numpy"
+            ) from e
+        size = len(columns["key"])
+        records = numpy.empty(size, dtype=[(name, object) for name in columns])
+        for name, values in columns.items():
+            records[name] = numpy.fromiter(values, dtype=object, count=size)
+        return records
+
+    return columns
+
+
+class FieldIndex:
+    """Cached index mapping lowercase field names and IDs to field IDs
+
+    Groups the index, the time it was built and the lock serializing rebuilds.
+    The sync client passes a ``threading.Lock`` and the async client an
+    ``asyncio.Lock``.
+    """
+
+    def __init__(self, lock: Any):
+        """Initialize an empty index
+
+        Args:
+            lock: Lock held while the index is checked and rebuilt
+        """
+        self.lock = lock
+        self.ids: Optional[Dict[str, str]] = None
+        self.loaded_at = 0.0
+
+    def is_stale(self, ttl: float, refresh: bool = False) -> bool:
+        """Return whether the index must be (re)built
+
+        Args:
+            ttl: Seconds an index stays valid
+            refresh: Force a rebuild
+
+        Returns:
+            True if the index is missing, expired or a refresh is forced
+        """
+        return (
+            self.ids is None or refresh or time.monotonic() - self.loaded_at >= ttl
+        )
+
+    def load(self, fields: List[Dict[str, Any]]) -> Dict[str, str]:
+        """Rebuild the index from the field catalog
+
+        Args:
+            fields: Field catalog as returned by the /field endpoint
+
+        Returns:
+            The new index
+        """
+        field_ids: Dict[str, str] = {}
+        for field in fields:
+            field_ids.setdefault(field["name"].lower(), field["id"])
+            field_ids.setdefault(field["id"].lower(), field["id"])
+        self.ids = field_ids
+        self.loaded_at = time.monotonic()
+        logger.debug("Cached %d JIRA fields", len(fields))
+        return field_ids
@@ -0,0 +1,44 @@
+"""Subprocess helpers for the import-time tests of the commons packages"""
+
+import subprocess
+import sys
+from typing import Optional
+
+
+def run_python(code: str) -> str:
+    """Run Python code in a fresh interpreter
+
+    Args:
+        code: Source code passed to ``python -c``
+
+    Returns:
+        Stripped standard output
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+def import_time(module: str, runs: int = 3) -> Optional[int]:
+    """Measure the cumulative import time of a module with ``-X importtime``
+
+    Args:
+        module: Module to import in a fresh interpreter
+        runs: Number of interpreters to start; the fastest run wins
+
+    Returns:
+        Best cumulative import time in microseconds, or None if not reported
+    """
+    best = None
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True, text=True, check=True
+        )
+        for line in result.stderr.splitlines():
+            parts = [part.strip() for part in line.split("|")]
+            if len(parts) == 3 and parts[2] == module:
+                cumulative = int(parts[1])
+                best = cumulative if best is None else min(best, cumulative)
+    return best
@@ -0,0 +1,113 @@
+"""Helpers shared by the commons client libraries"""
+
+import importlib
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+
+def seconds_until(when: datetime) -> float:
+    """Return the number of seconds from now until a point in time
+
+    Args:
+        when: Point in time (naive values are taken as UTC)
+
+    Returns:
+        Seconds until ``when``, or 0 if it has already passed
+    """
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header value
+
+    Args:
+        value: Delay in seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if the value is missing or malformed
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return seconds_until(parsedate_to_datetime(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def lazy_import(
+    namespace: Dict[str, Any],
+    imports: Mapping[str, Tuple[str, Optional[str]]],
+    name: str,
+) -> Any:
+    """Return a lazily imported name of a module, importing it on first use
+
+    The value is bound in the module namespace, so later lookups are plain
+    dictionary reads and a value already bound there (for example by
+    ``unittest.mock.patch``) is returned as is. Meant to back a module level
+    ``__getattr__`` (PEP 562).
+
+    Args:
+        namespace: ``globals()`` of the module owning the name
+        imports: Lazy names mapped to (module, attribute); attribute None
+            binds the module itself
+        name: Name to resolve
+
+    Returns:
+        Imported object
+
+    Raises:
+        AttributeError: If the name is neither bound nor lazily imported
+    """
+    if name in namespace:
+        return namespace[name]
+    if name not in imports:
+        raise AttributeError(
+            f"module {namespace['__name__']!r} has no attribute {name!r}"
+        )
+    module_name, attribute = imports[name]
+    module = importlib.import_module(module_name)
+    value = getattr(module, attribute) if attribute else module
+    namespace[name] = value
+    return value
+
+
+class SQLiteDatabase:
+    """SQLite connection shared by threads, with writes serialized by a lock
+
+    Base class for the on-disk stores. The schema script is applied when the
+    database is opened, and the database closes when used as a context manager.
+    """
+
+    def __init__(self, path: str, schema: str):
+        """Open (or create) a database
+
+        Args:
+            path: SQLite database file (':memory:' for an in-memory database)
+            schema: SQL script creating the tables if they do not exist
+        """
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.executescript(schema)
+
+    def close(self) -> None:
+        """Close the database connection"""
+        self._conn.close()
+
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit - close the database"""
+        self.close()